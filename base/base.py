@@ -1,9 +1,18 @@
 from abc import ABCMeta, abstractmethod
-from typing import Callable, Union
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from math import exp, log
+from os.path import getsize
+from random import Random
+from typing import Callable, Iterable, Union
 
 import json
 import pandas as pd
-from sklearn.pipeline import Pipeline
+
+CHUNKSIZE = 10000
+MEMORY_PER_BYTE = 4  # Estimated memory per byte of text read into Pandas.
+MIN_CHUNK_BYTES = 1 << 16
 
 
 class Transformer(metaclass=ABCMeta):
@@ -29,80 +38,306 @@ class PandasTransformer(Transformer):
     def __init__(
         self,
         applymap: Callable = lambda x: x,
+        ascending: bool = False,
         column: Union[str, list] = None,
         drop_duplicates: bool = False,
         dropna: bool = False,
+        head: int = None,
         json_records: bool = True,
         low_memory: bool = False,
+        max_memory: int = None,
+        n_threads: int = 1,
+        prefetch: int = None,
+        sample: float = None,
+        seed: int = None,
         sep: str = None,
         skiprows: int = None,
         sort: list = [],
+        time_column: str = None,
     ):
         self.applymap = applymap
+        self.ascending = ascending
         self.column = column
         self.drop_duplicates = drop_duplicates
         self.dropna = dropna
+        self.head = head
         self.json_records = json_records
         self.low_memory = low_memory
+        self.max_memory = max_memory
+        self.n_threads = n_threads
+        self.prefetch = prefetch
+        self.sample = sample
+        self.seed = seed
         self.sep = sep
         self.skiprows = skiprows
         self.sort = sort
+        self.time_column = time_column
 
     def transform(self, path_or_df: Union[str, pd.Series, pd.DataFrame]) -> pd.Series:
-        series = self.__concat(
-            [self.__read_json(
-                x,
-                json_records=self.json_records
+        if self.sample and self.sample >= 1 and not self.sort:
+            series = self.__reservoir(
+                self.__concat([df], column=self.column, index=self.time_column)
+                for df in self._iread(path_or_df)
+            )
+        else:
+            series = self.__concat(
+                list(self._iread(path_or_df)),
+                column=self.column,
+                sort=self.sort,
+                ascending=self.ascending,
+                index=self.time_column,
+            )
+            if self.sort and self.head:
+                series = series.iloc[:self.head]
+            if self.sample and self.sample >= 1:
+                series = self.__reservoir([series])
+
+        series = self.__process(series)
+
+        self.index_ = series.index
+        self.skiprows_ = self.index_.difference(series.index)
+        return series
+
+    def iter_transform(self, path_or_df: Union[str, pd.Series, pd.DataFrame]):
+        """
+        Yields one processed Series per input, as soon as it is read. If
+        sorting or sampling a fixed number of rows, all inputs are read
+        first and yielded in chunks. Duplicates are dropped across inputs,
+        as if concatenated.
+        """
+        if self.sort or (self.sample and self.sample >= 1):
+            series = self.transform(path_or_df)
+            for i in range(0, series.shape[0], CHUNKSIZE):
+                yield series.iloc[i:i+CHUNKSIZE]
+            return
+
+        seen = set()
+        for df in self._iread(path_or_df):
+            yield self.__process(
+                self.__concat([df], column=self.column, index=self.time_column),
+                seen=seen,
             )
-            if
-                type(x) == str and x.endswith(".json")
-            else
-                self.__read_records(x)
-            if
-                type(x) == str and self.sep is None
-            else
-                pd.read_table(
-                    x,
-                    low_memory=self.low_memory,
-                    sep=self.__get_file_delimiter(x) if self.sep is None and self.column else self.sep,
-                    skiprows=self.skiprows,
-                    usecols=list(set(
-                        ((self.column if type(self.column) == list else [self.column]) if self.column is not None else []) +
-                        ((self.sort if type(self.sort) == list else [self.sort]) if self.sort is not None else [])
-                    )) or None,
+
+    def _iread(self, path_or_df: Union[str, pd.Series, pd.DataFrame]):
+        """
+        Reads inputs concurrently with up to `n_threads` threads, keeping at
+        most `prefetch` inputs in flight, and yields them in input order.
+        Stops reading as soon as `head` rows are read, unless sorting.
+
+        If `max_memory` is set, half of it bounds the estimated memory of
+        inputs in flight, and line-based inputs (records or JSON lines) are
+        read in byte ranges sized to fit, so that reading waits for
+        processing instead of exceeding it.
+        """
+        inputs = path_or_df if type(path_or_df) == list else [path_or_df]
+        self.files_read_, self.bytes_read_ = 0, 0
+        if self.max_memory:
+            inputs = [span for x in inputs for span in self.__split(x)]
+        remaining = None if self.sort else self.head
+
+        for df in self.__iread(inputs):
+            if remaining is not None:
+                df = df.iloc[:remaining]
+                remaining -= df.shape[0]
+            yield df
+            if remaining == 0:
+                break
+
+    def __iread(self, inputs: list):
+        if self.n_threads < 2:
+            for i, x in enumerate(inputs):
+                df = self.__read(x, i)
+                self.__count(x)
+                yield df
+            return
+
+        executor = ThreadPoolExecutor(max_workers=self.n_threads)
+        try:
+            queue, in_flight = deque(), 0
+            for i, x in enumerate(inputs):
+                size = self.__estimate(x)
+                while queue and (
+                    len(queue) >= self.__slots() or
+                    (self.max_memory and in_flight + size > self.max_memory // 2)
+                ):
+                    future, n, done = queue.popleft()
+                    in_flight -= n
+                    df = future.result()
+                    self.__count(done)
+                    yield df
+                queue.append((executor.submit(self.__read, x, i), size, x))
+                in_flight += size
+            while queue:
+                future, n, done = queue.popleft()
+                df = future.result()
+                self.__count(done)
+                yield df
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __read(self, x: Union[str, tuple, pd.Series, pd.DataFrame], i: int = 0) -> Union[pd.Series, pd.DataFrame]:
+        x, span = (x[0], x[1:]) if type(x) == tuple else (x, None)
+        if type(x) != str:
+            return self.__select_frame(x, i)
+        if x.endswith(".json"):
+            if self.json_records:
+                return self.__read_json(x, json_records=True, select=lambda rows: self.__select(rows, i), span=span)
+            return self.__select_frame(self.__read_json(x, json_records=False), i)
+        if self.sep is None:
+            return self.__read_records(x, select=lambda rows: self.__select(rows, i), span=span)
+
+        rng = self.__rng(i)
+        skiprows = self.skiprows or 0
+        return pd.read_table(
+            x,
+            low_memory=self.low_memory,
+            nrows=None if self.sort else self.head,
+            sep=self.__get_file_delimiter(x) if self.sep is None and self.column else self.sep,
+            skiprows=(lambda n: n < skiprows or (n > skiprows and rng.random() >= self.sample))
+                     if self.sample and self.sample < 1 else self.skiprows,
+            usecols=list(set(
+                ((self.column if type(self.column) == list else [self.column]) if self.column is not None else []) +
+                ((self.sort if type(self.sort) == list else [self.sort]) if self.sort is not None else []) +
+                ([self.time_column] if self.time_column is not None else [])
+            )) or None,
+        )
+
+    def __split(self, x: Union[str, pd.Series, pd.DataFrame]):
+        """ Yields line-based inputs as (path, start, end) byte ranges that fit in memory. """
+        if type(x) != str:
+            yield x
+            return
+
+        size = getsize(x)
+        chunk = max(self.max_memory // (2 * MEMORY_PER_BYTE * (self.__slots() + 1)), MIN_CHUNK_BYTES)
+
+        if x.endswith(".json") and not self.json_records or not x.endswith(".json") and self.sep is not None:
+            if size * MEMORY_PER_BYTE > self.max_memory // 2:
+                raise MemoryError(
+                    f"Input '{x}' needs about {size * MEMORY_PER_BYTE // 1024 ** 2} MB to read, exceeding "
+                    f"maximum memory ({self.max_memory // 1024 ** 2} MB); records or JSON lines are read in chunks instead."
                 )
-            if
-                type(x) == str
-            else
-                x
-            for x in
-                (path_or_df if type(path_or_df) == list else [path_or_df])
-            ],
-            column=self.column,
+            yield x
+        elif size <= chunk:
+            yield x
+        else:
+            yield from ((x, start, min(start + chunk, size)) for start in range(0, size, chunk))
+
+    def __estimate(self, x: Union[str, tuple, pd.Series, pd.DataFrame]) -> int:
+        if type(x) == tuple:
+            return (x[2] - x[1]) * MEMORY_PER_BYTE
+        return getsize(x) * MEMORY_PER_BYTE if type(x) == str else 0
+
+    def __count(self, x: Union[str, tuple, pd.Series, pd.DataFrame]) -> None:
+        """ Counts files and bytes read, for progress. """
+        if type(x) == tuple:
+            self.bytes_read_ += x[2] - x[1]
+            self.files_read_ += x[2] == getsize(x[0])
+        elif type(x) == str:
+            self.bytes_read_ += getsize(x)
+            self.files_read_ += 1
+
+    def __slots(self) -> int:
+        return self.prefetch or 2 * self.n_threads
+
+    def __select(self, rows: Iterable, i: int = 0) -> Iterable:
+        """ Lazily samples a fraction of rows and limits them to `head`. """
+        if self.sample and self.sample < 1:
+            rng = self.__rng(i)
+            rows = (row for row in rows if rng.random() < self.sample)
+        if self.head and not self.sort:
+            rows = islice(rows, self.head)
+        return rows
+
+    def __select_frame(self, df: Union[pd.Series, pd.DataFrame], i: int = 0) -> Union[pd.Series, pd.DataFrame]:
+        if self.sample and self.sample < 1:
+            rng = self.__rng(i)
+            df = df[[rng.random() < self.sample for _ in range(df.shape[0])]]
+        return df
+
+    def __reservoir(self, chunks: Iterable) -> pd.Series:
+        """
+        Uniformly samples `sample` rows in a single pass over streamed chunks,
+        keeping only the sample in memory (reservoir sampling, Algorithm L).
+        Rows are returned in input order.
+        """
+        k, n = int(self.sample), 0
+        rng = self.__rng()
+        uniform = lambda: rng.random() or 1e-300
+        positions, values, labels = [], [], []
+
+        w = exp(log(uniform()) / k)
+        following = k + int(log(uniform()) / log(1 - w))
+
+        for chunk in chunks:
+            m = chunk.shape[0]
+            fill = max(min(k - n, m), 0)
+            positions.extend(range(n, n + fill))
+            values.extend(chunk.iloc[:fill])
+            labels.extend(chunk.index[:fill])
+
+            while following < n + m:
+                j = rng.randrange(k)
+                positions[j], values[j], labels[j] = following, chunk.iat[following - n], chunk.index[following - n]
+                w *= exp(log(uniform()) / k)
+                following += int(log(uniform()) / log(1 - w)) + 1
+            n += m
+
+        order = sorted(range(len(positions)), key=positions.__getitem__)
+        return pd.Series(
+            [values[i] for i in order],
+            index=pd.Index([labels[i] for i in order]) if self.time_column else None,
+            dtype=object,
         )
 
+    def __rng(self, i: int = None) -> Random:
+        """ Returns a random generator, reproducible per input if `seed` is set. """
+        return Random(None if self.seed is None else f"{self.seed}:{i}")
+
+    def __process(self, series: pd.Series, seen: set = None) -> pd.Series:
+        """ Applies `applymap` and drops duplicates, also those in `seen` (if given) and then remembered. """
         if type(series) == pd.DataFrame:
             raise TypeError(f"Expected a Pandas Series or 1-dimensional DataFrame (column='{self.column}').")
 
         series = series.apply(self.applymap)
 
-        if self.sort:
-            series.sort_values(self.sort, ascending=False)
         if self.drop_duplicates:
             series.drop_duplicates(inplace=True)
+            if seen is not None:
+                series = series[[x not in seen for x in series]]
+                seen.update(series)
         if self.dropna:
             series.dropna(inplace=True)
-
-        self.index_ = series.index
-        self.skiprows_ = self.index_.difference(series.index)
         return series
 
     @staticmethod
-    def __concat(dfs: list, column=None) -> pd.DataFrame:
+    def __concat(dfs: list, column=None, sort=None, ascending=False, index=None) -> pd.DataFrame:
+        """
+        Concatenates columns from inputs, optionally sorted and indexed by
+        timestamps parsed from the `index` column (otherwise by position).
+        """
+        if index:
+            if not column:
+                raise TypeError(f"Expected a column to index by '{index}' (column='{column}').")
+            times = pd.concat([
+                pd.to_datetime(df[index], utc=True)
+                for df in dfs for c in (column if type(column) == list else [column])
+            ])
+        if sort:
+            if not column:
+                raise TypeError(f"Expected a column to sort by {sort} (column='{column}').")
+            # Sorts only the key columns, then reorders texts by position.
+            sort = sort if type(sort) == list else [sort]
+            keys = pd.concat([df[sort] for df in dfs for c in (column if type(column) == list else [column])])
+            order = keys.reset_index(drop=True).sort_values(sort, ascending=ascending, kind="mergesort").index.values
         if column:
             dfs = [df[c] for df in dfs for c in (column if type(column) == list else [column])]
         df = pd.concat(dfs)
-        df.index = range(df.shape[0])
+        df.index = pd.DatetimeIndex(times) if index else range(df.shape[0])
+        if sort:
+            df = df.iloc[order]
+            if not index:
+                df.index = range(df.shape[0])
         return df
 
     @staticmethod
@@ -116,18 +351,31 @@ class PandasTransformer(Transformer):
         return "\n"
 
     @staticmethod
-    def __read_json(path: str, json_records=False) -> pd.DataFrame:
+    def __read_json(path: str, json_records=False, select: Callable = iter, span: tuple = None) -> pd.DataFrame:
         if json_records:
             with open(path, "r") as j:
                 return pd.DataFrame(
-                    [json.loads(_) for _ in j.readlines()]
+                    [json.loads(_) for _ in select(PandasTransformer.__lines(path, *span) if span else j)]
                 )
         return pd.read_json(path)
 
     @staticmethod
-    def __read_records(path: str) -> pd.Series:
+    def __read_records(path: str, select: Callable = iter, span: tuple = None) -> pd.Series:
         with open(path, "r") as f:
             return pd.Series(
-                [_ for _ in [_.rstrip() for _ in f.readlines()] if _],
+                list(select(_ for _ in (_.rstrip() for _ in (PandasTransformer.__lines(path, *span) if span else f)) if _)),
                 dtype=object,
             )
+
+    @staticmethod
+    def __lines(path: str, start: int, end: int):
+        """ Yields lines starting within the byte range [start, end). """
+        with open(path, "rb") as f:
+            if start:
+                f.seek(start - 1)
+                f.readline()
+            while f.tell() < end:
+                line = f.readline()
+                if not line:
+                    break
+                yield line.decode("utf-8")
@@ -0,0 +1,107 @@
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+from .base import Transformer
+
+
+class Cooccurrence(Transformer):
+    """
+    Counts unordered pairs of tokens co-occurring within `window` tokens of
+    each other, or anywhere in the same document if not set, passing
+    documents through unchanged.
+
+    Tokens are mapped to integer IDs and pairs are packed into a single
+    64-bit key per pair. If `max_pairs` is set, the rarest pairs are pruned
+    whenever exceeded, bounding memory at the cost of undercounting them.
+    Edges between tokens counted less than `min_count` times are dropped.
+    """
+    def __init__(
+        self,
+        max_pairs: int = None,
+        min_count: int = 2,
+        window: int = None,
+    ):
+        self.max_pairs = max_pairs
+        self.min_count = min_count
+        self.window = window
+
+    def fit(self, X, y=None):
+        """ Resets vocabulary and counts. """
+        self.vocabulary_ = {}
+        self.counts_ = np.zeros(0, dtype=np.int64)
+        self.pairs_ = {}
+        self.pruned_ = 0
+        return self
+
+    def transform(self, X):
+        if not hasattr(self, "pairs_"):
+            self.fit(X)
+
+        vocabulary = self.vocabulary_
+        ids = [
+            [vocabulary.setdefault(w, len(vocabulary)) for w in (x.split() if type(x) == str else x)]
+            for x in X
+        ]
+        self.__count(np.fromiter((i for doc in ids for i in doc), dtype=np.int64))
+
+        keys = self.__window(ids) if self.window else self.__document(ids)
+        keys, counts = np.unique(keys, return_counts=True)
+
+        pairs = self.pairs_
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            pairs[key] = pairs.get(key, 0) + count
+
+        if self.max_pairs and len(pairs) > self.max_pairs:
+            self.__prune()
+        return X
+
+    def edges(self) -> pd.DataFrame:
+        """ Returns co-occurring tokens as an edge list (source, target, weight). """
+        words = np.array(list(self.vocabulary_), dtype=object)
+        keys = np.fromiter(self.pairs_.keys(), dtype=np.int64, count=len(self.pairs_))
+        weights = np.fromiter(self.pairs_.values(), dtype=np.int64, count=len(self.pairs_))
+        sources, targets = keys >> 32, keys & 0xFFFFFFFF
+
+        keep = (self.counts_[sources] >= self.min_count) & (self.counts_[targets] >= self.min_count)
+        order = np.argsort(-weights[keep], kind="stable")
+        return pd.DataFrame({
+            "source": words[sources[keep][order]],
+            "target": words[targets[keep][order]],
+            "weight": weights[keep][order],
+        })
+
+    def __count(self, ids: np.ndarray) -> None:
+        counts = np.bincount(ids, minlength=len(self.vocabulary_))
+        counts[:len(self.counts_)] += self.counts_
+        self.counts_ = counts
+
+    def __window(self, ids: list) -> np.ndarray:
+        """ Returns packed keys of pairs within `window` tokens, never across documents. """
+        tokens = np.fromiter((i for doc in ids for i in doc), dtype=np.int64)
+        docs = np.repeat(np.arange(len(ids)), [len(doc) for doc in ids])
+        keys = []
+        for d in range(1, self.window):
+            a, b = tokens[:-d], tokens[d:]
+            same = (docs[:-d] == docs[d:]) & (a != b)
+            keys.append(self._pack(a[same], b[same]))
+        return np.concatenate(keys) if keys else np.zeros(0, dtype=np.int64)
+
+    def __document(self, ids: list) -> np.ndarray:
+        """ Returns packed keys of pairs of distinct tokens in the same document. """
+        pairs = np.array(
+            [pair for doc in ids for pair in combinations(sorted(set(doc)), 2)],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        return self._pack(pairs[:, 0], pairs[:, 1])
+
+    def __prune(self) -> None:
+        """ Drops the least frequent pairs, until at most half of `max_pairs` are left. """
+        while len(self.pairs_) > self.max_pairs // 2:
+            self.pruned_ += 1
+            self.pairs_ = {k: v for k, v in self.pairs_.items() if v > self.pruned_}
+
+    @staticmethod
+    def _pack(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        return (np.minimum(a, b) << 32) | np.maximum(a, b)
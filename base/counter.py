@@ -0,0 +1,166 @@
+from collections import Counter
+from heapq import nlargest
+from math import ceil
+from operator import itemgetter
+from os import remove
+from tempfile import TemporaryDirectory
+from typing import Iterable
+
+from . import runs
+
+BYTES_PER_WORD = 128  # Estimated memory per counted word (key, value and hash table entry).
+MAX_RUNS = 64
+
+
+class SpaceSaving():
+    """
+    Space-Saving heavy hitter counter (Metwally et al., 2005).
+
+    Keeps at most `capacity` counters, so memory is bounded regardless of
+    the number of distinct keys. Counts are overestimated by at most
+    `N / capacity`, where `N` is the total number of updates; an item's
+    `error` is the exact upper bound on its own overestimation.
+    """
+    def __init__(self, capacity: int = None, error: float = None):
+        if not capacity and not error:
+            raise ValueError("Expected either `capacity` or `error` for Space-Saving counter.")
+
+        self.capacity = capacity or ceil(1 / error)
+        self.error = error
+        self.n = 0
+
+        self.__counts = {}  # key -> count
+        self.__errors = {}  # key -> overestimation
+        self.__buckets = {}  # count -> keys
+        self.__min = 0
+
+    def __contains__(self, key) -> bool:
+        return key in self.__counts
+
+    def __len__(self) -> int:
+        return len(self.__counts)
+
+    def update(self, keys: Iterable) -> None:
+        counts = self.__counts
+        buckets = self.__buckets
+
+        for key in keys:
+            self.n += 1
+            count = counts.get(key)
+
+            if count is None:
+                if len(counts) < self.capacity:
+                    count, self.__errors[key] = 0, 0
+                    self.__min = 1
+                else:
+                    count = self.__errors[key] = self.__min
+                    evicted = buckets[count].pop()
+                    if not buckets[count]:
+                        del buckets[count]
+                        self.__min = count + 1
+                    del counts[evicted], self.__errors[evicted]
+            else:
+                bucket = buckets[count]
+                bucket.remove(key)
+                if not bucket:
+                    del buckets[count]
+                    if count == self.__min:
+                        self.__min = count + 1
+
+            counts[key] = count + 1
+            buckets.setdefault(count + 1, set()).add(key)
+
+    def most_common(self, n: int = None) -> list:
+        if n is None:
+            return sorted(self.__counts.items(), key=itemgetter(1), reverse=True)
+        return nlargest(n, self.__counts.items(), key=itemgetter(1))
+
+    def guaranteed(self, n: int = None) -> int:
+        """ Returns how many of the top `n` items are guaranteed in correct order. """
+        items = self.most_common()
+        for i, (key, count) in enumerate(items[:n]):
+            if i+1 < len(items):
+                following = items[i+1][1]
+            else:  # Once full, any unseen or evicted item may have counted up to the minimum.
+                following = self.__min if len(items) >= self.capacity else 0
+            if count - self.__errors[key] < following:
+                return i
+        return len(items[:n])
+
+    def most_common_guaranteed(self, n: int = None) -> list:
+        """
+        Returns the top `n` items whose order is guaranteed, with guaranteed
+        (minimum) counts, i.e. each count less its own error.
+        """
+        return [
+            (key, count - self.__errors[key])
+            for key, count in self.most_common(self.guaranteed(n))
+        ]
+
+    def max_error(self) -> float:
+        return self.n / self.capacity
+
+
+class SpillCounter():
+    """
+    Exact counter with bounded memory for vocabularies larger than RAM.
+
+    Keeps at most `max_size` words in memory (or as many as fit in
+    `max_memory` bytes), spilling them as a sorted run to a temporary
+    directory whenever exceeded, and merges runs on disk (at most
+    MAX_RUNS at a time) when queried.
+    """
+    def __init__(self, max_size: int = None, max_memory: int = None, path: str = None):
+        if not max_size and not max_memory:
+            raise ValueError("Expected either `max_size` or `max_memory` for spilling counter.")
+
+        self.max_size = max_size or max(max_memory // BYTES_PER_WORD, 1)
+        self.path = path
+        self.runs = []
+
+        self.__counts = Counter()
+        self.__spills = 0
+        self.__tmp = None
+
+    def __len__(self) -> int:
+        """ Returns words in memory, not yet spilled. """
+        return len(self.__counts)
+
+    def update(self, keys: Iterable) -> None:
+        self.__counts.update(keys)
+        if len(self.__counts) > self.max_size:
+            self.spill()
+
+    def spill(self) -> None:
+        """ Writes words in memory to a new sorted run, compacting runs if too many. """
+        if self.__tmp is None:
+            self.__tmp = TemporaryDirectory(prefix="wordcloud_", dir=self.path)
+
+        self.runs.append(self.__run())
+        runs.write(self.runs[-1], self.__counts.items())
+        self.__counts = Counter()
+
+        if len(self.runs) >= MAX_RUNS:
+            path = self.__run()
+            runs.write(path, runs.combine(self.runs), is_sorted=True)
+            for run in self.runs:
+                remove(run)
+            self.runs = [path]
+
+    def items(self):
+        """ Yields (word, count) items sorted by word, merged from runs and memory. """
+        return runs.combine(self.runs + [sorted(self.__counts.items(), key=itemgetter(0))])
+
+    def most_common(self, n: int) -> list:
+        """ Returns the top `n` words, merging runs with only a heap in memory. """
+        return runs.top(self.runs + [sorted(self.__counts.items(), key=itemgetter(0))], n)
+
+    def close(self) -> None:
+        """ Removes spilled runs. """
+        if self.__tmp is not None:
+            self.__tmp.cleanup()
+            self.__tmp, self.runs = None, []
+
+    def __run(self) -> str:
+        self.__spills += 1
+        return f"{self.__tmp.name}/{self.__spills:06d}.tsv"
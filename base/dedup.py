@@ -0,0 +1,131 @@
+import hashlib
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from .base import Transformer
+
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+class Deduplicator(Transformer):
+    """
+    Streaming document deduplication, keeping state across calls so that
+    duplicates are dropped across chunks (files) before tokenization.
+
+    With method "exact", documents are compared by 64-bit content hashes.
+    With method "minhash", near-duplicates are detected by MinHash signatures
+    of word shingles and LSH banding, with estimated Jaccard similarity of at
+    least `threshold`. If `max_size` is set, only the most recent documents
+    are remembered, bounding memory.
+    """
+    def __init__(
+        self,
+        method: str = "exact",
+        max_size: int = None,
+        num_perm: int = 64,
+        seed: int = 1,
+        shingle_size: int = 3,
+        threshold: float = 0.8,
+    ):
+        self.method = method
+        self.max_size = max_size
+        self.num_perm = num_perm
+        self.seed = seed
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+
+    def fit(self, X, y=None):
+        """ Resets previously seen documents. """
+        if self.method not in ("exact", "minhash"):
+            raise ValueError(f"Unknown deduplication method '{self.method}' (available: ['exact', 'minhash']).")
+
+        self.seen_ = OrderedDict()
+        self.n_seen_ = 0
+        self.n_dropped_ = 0
+
+        if self.method == "minhash":
+            rng = np.random.RandomState(self.seed)
+            self.bands_, self.rows_ = self._lsh_params(self.threshold, self.num_perm)
+            self.perms_ = (
+                rng.randint(1, MERSENNE_PRIME, size=self.num_perm, dtype=np.uint64),
+                rng.randint(0, MERSENNE_PRIME, size=self.num_perm, dtype=np.uint64),
+            )
+            self.buckets_ = {}
+        return self
+
+    def transform(self, X):
+        if not hasattr(self, "seen_"):
+            self.fit(X)
+
+        keep = [
+            self.__add(x) if type(x) == str else True
+            for x in X
+        ]
+        self.n_dropped_ += len(keep) - sum(keep)
+
+        if isinstance(X, pd.Series):
+            return X[keep]
+        return [x for x, k in zip(X, keep) if k]
+
+    def __add(self, doc: str) -> bool:
+        """ Returns False if `doc` is a duplicate, otherwise remembers it. """
+        if self.method == "exact":
+            key = int.from_bytes(hashlib.blake2b(doc.encode("utf-8"), digest_size=8).digest(), "little")
+            if key in self.seen_:
+                return False
+            self.seen_[key] = None
+        else:
+            signature = self._minhash(doc)
+            bands = [
+                (i, signature[i*self.rows_:(i+1)*self.rows_].tobytes())
+                for i in range(self.bands_)
+            ]
+            for band in bands:
+                candidate = self.buckets_.get(band)
+                if candidate is not None and np.mean(self.seen_[candidate][0] == signature) >= self.threshold:
+                    return False
+            key = self.n_seen_
+            self.seen_[key] = (signature, bands)
+            for band in bands:
+                self.buckets_.setdefault(band, key)
+
+        self.n_seen_ += 1
+
+        if self.max_size and len(self.seen_) > self.max_size:
+            self.__evict()
+        return True
+
+    def __evict(self) -> None:
+        key, value = self.seen_.popitem(last=False)
+        if self.method == "minhash":
+            for band in value[1]:
+                if self.buckets_.get(band) == key:
+                    del self.buckets_[band]
+
+    def _minhash(self, doc: str) -> np.ndarray:
+        words = doc.lower().split()
+        shingles = {
+            " ".join(words[i:i+self.shingle_size])
+            for i in range(max(len(words) - self.shingle_size + 1, 1))
+        }
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        a, b = self.perms_
+        return (
+            ((np.outer(a, hashes) + b[:, None]) % MERSENNE_PRIME) & MAX_HASH
+        ).min(axis=1).astype(np.uint32)
+
+    @staticmethod
+    def _lsh_params(threshold: float, num_perm: int) -> tuple:
+        """ Returns (bands, rows) whose LSH threshold (1/b)^(1/r) is closest to `threshold`. """
+        return min(
+            ((b, r) for b in range(1, num_perm + 1) for r in range(1, num_perm // b + 1)),
+            key=lambda x: (abs((1 / x[0]) ** (1 / x[1]) - threshold), -x[0] * x[1]),
+        )
@@ -0,0 +1,43 @@
+"""
+Default parameters, kept apart from the pipeline so that the command line
+interface can be loaded without importing any of its dependencies.
+"""
+
+ENCODING = "utf-8"
+IGNORE_STARTSWITH = ["http", "www", "kk"]
+IGNORE_STARTSWITH_CHARS = "@#"
+MAX_TABLE_WORDS = 10000
+MAX_WORDS = 100
+MIN_WORD_LEN = 2
+N_GRAMS = 1
+
+AVAILABLE_SCORES = [
+    "count",
+    "keyness",
+    "llr",
+    "npmi",
+    "pmi",
+    "tfidf",
+]
+
+AVAILABLE_STOPWORDS = [
+    "all",
+    "catalan",
+    "chinese",
+    "common",
+    "english",
+    "french",
+    "german",
+    "italian",
+    "japanese",
+    "portuguese",
+    "russian",
+    "spanish",
+]
+
+AVAILABLE_STREAMS = [
+    "emojis",
+    "hashtags",
+    "mentions",
+    "urls",
+]
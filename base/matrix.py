@@ -0,0 +1,81 @@
+import numpy as np
+import scipy.sparse as sp
+
+from .base import Transformer
+
+
+class DocumentTermMatrix(Transformer):
+    """
+    Builds a SciPy CSR document-term matrix from tokenized documents, one
+    chunk at a time, and passes documents through unchanged so the word
+    cloud is computed in the same pass.
+
+    Columns are either terms from a vocabulary grown incrementally, or
+    `n_features` hashed features (HashingVectorizer-compatible), which keeps
+    memory constant regardless of the number of distinct terms.
+    """
+    def __init__(self, n_features: int = None):
+        self.n_features = n_features
+
+    def fit(self, X, y=None):
+        """ Resets matrix chunks and vocabulary. """
+        self.chunks_ = []
+        self.vocabulary_ = {}
+        return self
+
+    def transform(self, X):
+        if not hasattr(self, "chunks_"):
+            self.fit(X)
+
+        self.chunks_.append(
+            self.__hash(X) if self.n_features else self.__count(X)
+        )
+        return X
+
+    def matrix(self) -> sp.csr_matrix:
+        """ Returns all chunks stacked as a single CSR matrix, without densifying. """
+        n_features = self.n_features or len(self.vocabulary_)
+
+        if not self.chunks_:
+            return sp.csr_matrix((0, n_features), dtype=np.int32)
+
+        for chunk in self.chunks_:
+            chunk.resize((chunk.shape[0], n_features))
+        return sp.vstack(self.chunks_, format="csr", dtype=np.int32)
+
+    def vocabulary(self) -> list:
+        """ Returns terms in column order (empty if hashing). """
+        return sorted(self.vocabulary_, key=self.vocabulary_.get)
+
+    def __count(self, X) -> sp.csr_matrix:
+        vocabulary = self.vocabulary_
+        indices, indptr = [], [0]
+
+        for x in X:
+            indices.extend(
+                vocabulary.setdefault(w, len(vocabulary))
+                for w in self._analyze(x)
+            )
+            indptr.append(len(indices))
+
+        matrix = sp.csr_matrix(
+            (np.ones(len(indices), dtype=np.int32), np.asarray(indices, dtype=np.int32), indptr),
+            shape=(len(indptr) - 1, len(vocabulary)),
+        )
+        matrix.sum_duplicates()
+        return matrix
+
+    def __hash(self, X) -> sp.csr_matrix:
+        from sklearn.feature_extraction.text import HashingVectorizer
+
+        return HashingVectorizer(
+            alternate_sign=False,
+            analyzer=self._analyze,
+            dtype=np.int32,
+            n_features=self.n_features,
+            norm=None,
+        ).transform(X)
+
+    @staticmethod
+    def _analyze(x) -> list:
+        return x.split() if type(x) == str else x
@@ -1,5 +1,3 @@
-import nltk
-
 from .base import Transformer
 
 class NGrams(Transformer):
@@ -25,7 +23,7 @@ class NGrams(Transformer):
             else
                 g
             for g in
-                list(nltk.ngrams(tokens, n))
+                zip(*[tokens[i:] for i in range(n)])
             if
                 len(set(g)) == n
         ]
\ No newline at end of file
@@ -0,0 +1,243 @@
+"""
+Parallel word count over worker processes, each running its own pipeline.
+
+Workers hash tokens to stable 64-bit IDs (BLAKE2b) and ship back compact
+(id, count) arrays through shared memory, merged by the parent with a
+vectorized sort and reduce. Strings are kept by the workers and only
+recovered for the final top words.
+"""
+
+import hashlib
+import logging as log
+from collections import Counter, deque
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from os.path import getsize
+from queue import Empty
+from time import monotonic
+
+import numpy as np
+import pandas as pd
+
+from .defaults import MAX_WORDS
+
+POLL = 1.0  # Seconds between checks that workers are still alive.
+PREFETCH = 2
+
+
+def wordcount(
+    args: dict,
+    files: list,
+    n_processes: int,
+    max_words: int = MAX_WORDS,
+    exclude_words: list = [],
+) -> pd.Series:
+    """
+    Counts words from files with `n_processes` worker processes, each
+    running a pipeline created from `args`, returning the top `max_words`.
+    Any `max_memory` is split evenly between workers, and any `progress`
+    is reported by the parent as results arrive.
+
+    Options applying to the whole input (deduplication, head, sampling,
+    sorting) are not supported, since each worker reads one file at a time,
+    nor is counting all words, since only the top words are resolved back
+    to strings.
+    """
+    if max_words is None:
+        raise ValueError("Parallel word count requires a finite number of words (`max_words`).")
+    unsupported = [key for key in ("dedup", "drop_duplicates", "head", "sample", "sort") if args.get(key)]
+    if unsupported:
+        raise ValueError(f"Parallel word count does not support options applying to the whole input: {unsupported}.")
+
+    if args.get("max_memory"):
+        args = {**args, "max_memory": args["max_memory"] // n_processes}  # Per worker.
+
+    progress = None
+    if args.get("progress"):
+        from .progress import Progress
+        progress = Progress(args["progress"], files_total=len(files), bytes_total=sum(getsize(f) for f in files))
+        args = {**args, "progress": None}  # Reported by the parent instead.
+
+    context = get_context("spawn")
+    results, cancel = context.Queue(), context.Event()
+    tasks = [context.Queue() for _ in range(n_processes)]
+    workers = [
+        context.Process(target=_work, args=(k, args, tasks[k], results, cancel), daemon=True)
+        for k in range(n_processes)
+    ]
+    for worker in workers:
+        worker.start()
+
+    failed = False
+    try:
+        pending, parts = iter(files), []
+        ids, counts = np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.int64)
+
+        running, assigned = 0, [deque() for _ in range(n_processes)]
+        for k in range(n_processes):
+            for f in _take(pending, PREFETCH):
+                tasks[k].put(("count", f))
+                assigned[k].append(f)
+                running += 1
+
+        while running:
+            k, (name, n, docs, tokens, seconds) = _get(results, workers)
+            running -= 1
+            done = assigned[k].popleft()
+            for f in _take(pending, 1):
+                tasks[k].put(("count", f))
+                assigned[k].append(f)
+                running += 1
+
+            clock = monotonic()
+            parts.append(_unshare(name, n))
+            if len(parts) >= n_processes:
+                ids, counts = _merge([(ids, counts)] + parts)
+                parts = []
+            if progress:
+                progress.update(
+                    files=1,
+                    n_bytes=getsize(done),
+                    docs=docs,
+                    tokens=tokens,
+                    stages={"count": seconds / n_processes, "merge": monotonic() - clock},  # Workers in parallel.
+                )
+
+        ids, counts = _merge([(ids, counts)] + parts)
+
+        if exclude_words:
+            keep = ~np.isin(ids, np.array([_hash(w) for w in exclude_words], dtype=np.uint64))
+            ids, counts = ids[keep], counts[keep]
+
+        top = np.argpartition(-counts, max_words)[:max_words] if max_words < len(ids) else np.arange(len(ids))
+        top = top[np.argsort(-counts[top], kind="stable")]
+
+        for queue in tasks:
+            queue.put(("resolve", ids[top].tolist()))
+        words = {}
+        for _ in workers:
+            words.update(_get(results, workers)[1])
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        if failed:
+            cancel.set()  # Skips any files still assigned.
+        for queue in tasks:
+            queue.put(None)
+        while any(worker.is_alive() for worker in workers):
+            _drain(results)
+        _drain(results)
+        for worker in workers:
+            worker.join()
+        if progress:
+            progress.close()
+
+    log.info(f"Counted {len(ids)} distinct words from {len(files)} files with {n_processes} processes.")
+
+    from .wordcloud import Wordcloud
+    return Wordcloud._series([(words[i], c) for i, c in zip(ids[top].tolist(), counts[top].tolist())])
+
+
+def _work(k: int, args: dict, tasks, results, cancel) -> None:
+    """ Runs tasks from a worker's own queue until receiving None, skipping them once cancelled. """
+    from .pipeline import WordcloudNLP
+
+    nlp = WordcloudNLP(**{**args, "use_wordcloud": False})
+    words = {}
+
+    for task, payload in iter(tasks.get, None):
+        if cancel.is_set():
+            continue
+        try:
+            if task == "count":
+                clock = monotonic()
+                counter, docs, tokens = Counter(), 0, 0
+                for Xt in nlp.iter_transform(payload):
+                    for x in Xt:
+                        x = x.split() if type(x) == str else x
+                        counter.update(x)
+                        tokens += len(x)
+                    docs += len(Xt)
+
+                ids = np.zeros(len(counter), dtype=np.uint64)
+                for i, w in enumerate(counter):
+                    ids[i] = h = _hash(w)
+                    words.setdefault(h, w)
+                counts = np.fromiter(counter.values(), dtype=np.int64, count=len(counter))
+                results.put((k, (*_share(ids, counts), docs, tokens, monotonic() - clock)))
+
+            elif task == "resolve":
+                results.put((k, {i: words[i] for i in payload if i in words}))
+
+        except Exception as e:
+            results.put((k, e))
+
+
+def _hash(word: str) -> int:
+    return int.from_bytes(hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _share(ids: np.ndarray, counts: np.ndarray) -> tuple:
+    """ Copies (id, count) arrays to a new shared memory block, to be unlinked by the parent. """
+    shm = SharedMemory(create=True, size=max(ids.nbytes + counts.nbytes, 1))
+    np.ndarray(ids.shape, dtype=np.uint64, buffer=shm.buf)[:] = ids
+    np.ndarray(counts.shape, dtype=np.int64, buffer=shm.buf, offset=ids.nbytes)[:] = counts
+    shm.close()
+    return shm.name, len(ids)
+
+
+def _unshare(name: str, n: int) -> tuple:
+    shm = SharedMemory(name=name)
+    try:
+        ids = np.ndarray((n,), dtype=np.uint64, buffer=shm.buf).copy()
+        counts = np.ndarray((n,), dtype=np.int64, buffer=shm.buf, offset=n * 8).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+    return ids, counts
+
+
+def _merge(parts: list) -> tuple:
+    """ Sums counts of equal IDs across (id, count) arrays. """
+    ids = np.concatenate([p[0] for p in parts])
+    counts = np.concatenate([p[1] for p in parts])
+    order = np.argsort(ids, kind="stable")
+    ids, counts = ids[order], counts[order]
+    starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]]) if len(ids) else np.zeros(0, dtype=int)
+    return ids[starts], np.add.reduceat(counts, starts) if len(ids) else counts
+
+
+def _get(results, workers: list) -> tuple:
+    """ Returns the next result, raising any worker error, or if a worker exited (e.g. killed). """
+    while True:
+        try:
+            k, result = results.get(timeout=POLL)
+            break
+        except Empty:
+            for k, worker in enumerate(workers):
+                if not worker.is_alive():
+                    raise RuntimeError(f"Worker process {k} exited unexpectedly (exit code {worker.exitcode}).")
+    if isinstance(result, Exception):
+        raise result
+    return k, result
+
+
+def _drain(results) -> None:
+    """ Unlinks shared memory of pending results, never to be received. """
+    while True:
+        try:
+            k, result = results.get(timeout=0.1)
+        except Empty:
+            return
+        if type(result) == tuple:
+            try:
+                shm = SharedMemory(name=result[0])
+            except FileNotFoundError:
+                continue
+            shm.close()
+            shm.unlink()
+
+
+def _take(iterator, n: int) -> list:
+    return [x for _, x in zip(range(n), iterator)]
@@ -0,0 +1,309 @@
+import logging as log
+from os.path import getsize
+from time import monotonic
+from typing import Callable, Union
+
+from sklearn.pipeline import Pipeline
+
+from .defaults import IGNORE_STARTSWITH, IGNORE_STARTSWITH_CHARS, MAX_WORDS, MIN_WORD_LEN, N_GRAMS
+
+
+class WordcloudNLP(Pipeline):
+
+    def __init__(
+        self,
+        applymap: Callable = lambda x: x,
+        approx_counters: int = None,
+        approx_error: float = None,
+        ascending: bool = False,
+        column: Union[str, list] = None,
+        cooccurrence_max_pairs: int = None,
+        cooccurrence_min_count: int = 2,
+        cooccurrence_window: int = None,
+        dedup: str = None,
+        dedup_max_size: int = None,
+        dedup_threshold: float = 0.8,
+        drop_duplicates: bool = False,
+        dropna: bool = False,
+        exclude_words: list = [],
+        head: int = None,
+        ignore_startswith: list = IGNORE_STARTSWITH,
+        ignore_startswith_chars: str = IGNORE_STARTSWITH_CHARS,
+        ignore_stopwords: bool = True,
+        json_records: bool = True,
+        lang: str = None,
+        low_memory: bool = False,
+        matrix_features: int = None,
+        max_memory: int = None,
+        max_words: int = MAX_WORDS,
+        min_count: int = 5,
+        min_word_len: int = MIN_WORD_LEN,
+        model: str = None,
+        n_grams: int = N_GRAMS,
+        n_threads: int = 1,
+        prefetch: int = None,
+        progress: str = None,
+        reference: str = None,
+        sample: float = None,
+        score: str = "count",
+        seed: int = None,
+        sep: str = None,
+        skiprows: int = None,
+        sort: list = [],
+        spill_memory: int = None,
+        stop_words: Union[str, list] = [],
+        streams: list = [],
+        time_column: str = None,
+        use_cooccurrence: bool = False,
+        use_lemmas: bool = False,
+        use_matrix: bool = False,
+        use_pandas: bool = False,
+        use_pandas_tokenizer: bool = False,
+        use_stemmer: bool = False,
+        use_tokens: bool = False,
+        use_wordcloud: bool = True,
+    ):
+        steps = []
+
+        self.applymap = applymap
+        self.approx_counters = approx_counters
+        self.approx_error = approx_error
+        self.ascending = ascending
+        self.column = column
+        self.cooccurrence_max_pairs = cooccurrence_max_pairs
+        self.cooccurrence_min_count = cooccurrence_min_count
+        self.cooccurrence_window = cooccurrence_window
+        self.dedup = dedup
+        self.dedup_max_size = dedup_max_size
+        self.dedup_threshold = dedup_threshold
+        self.drop_duplicates = drop_duplicates
+        self.dropna = dropna
+        self.exclude_words = exclude_words
+        self.head = head
+        self.ignore_stopwords = ignore_stopwords
+        self.ignore_startswith = ignore_startswith
+        self.ignore_startswith_chars = ignore_startswith_chars
+        self.json_records = json_records
+        self.lang = lang
+        self.low_memory = low_memory
+        self.matrix_features = matrix_features
+        self.max_memory = max_memory
+        self.max_words = max_words
+        self.min_count = min_count
+        self.min_word_len = min_word_len
+        self.model = model
+        self.n_grams = n_grams
+        self.n_threads = n_threads
+        self.prefetch = prefetch
+        self.progress = progress
+        self.reference = reference
+        self.sample = sample
+        self.score = score
+        self.seed = seed
+        self.sep = sep
+        self.skiprows = skiprows
+        self.sort = sort
+        self.spill_memory = spill_memory
+        self.stop_words = stop_words
+        self.streams = streams
+        self.time_column = time_column
+        self.use_cooccurrence = use_cooccurrence
+        self.use_lemmas = use_lemmas
+        self.use_matrix = use_matrix
+        self.use_pandas= use_pandas
+        self.use_pandas_tokenizer = use_pandas_tokenizer
+        self.use_stemmer = use_stemmer
+        self.use_tokens = use_tokens
+        self.use_wordcloud = use_wordcloud
+
+        if self.use_pandas:
+            from .base import PandasTransformer
+            steps.append(
+                ('pandas', PandasTransformer(
+                    applymap=self.applymap,
+                    ascending=self.ascending,
+                    column=self.column,
+                    drop_duplicates=self.drop_duplicates,
+                    dropna=self.dropna,
+                    head=self.head,
+                    json_records=self.json_records,
+                    low_memory=self.low_memory,
+                    max_memory=self.max_memory,
+                    n_threads=self.n_threads,
+                    prefetch=self.prefetch,
+                    sample=self.sample,
+                    seed=self.seed,
+                    sep=self.sep,
+                    skiprows=self.skiprows,
+                    sort=self.sort,
+                    time_column=self.time_column,
+                ))
+            )
+        if self.dedup:
+            from .dedup import Deduplicator
+            steps.append(
+                ('dedup', Deduplicator(
+                    method=self.dedup,
+                    max_size=self.dedup_max_size,
+                    threshold=self.dedup_threshold,
+                ))
+            )
+        if self.use_tokens:
+            from .tokenizer import PandasTokenizer, Tokenizer
+            steps.append(
+                ('token', (PandasTokenizer if self.use_pandas_tokenizer else Tokenizer)(
+                    ignore_startswith=self.ignore_startswith,
+                    min_word_len=self.min_word_len,
+                    stop_words=self.__stopwords(self.stop_words),
+                    streams=self.streams,
+                ))
+            )
+        if self.use_lemmas:
+            from .lemmatizer import Lemmatizer
+            steps.append(
+                ('lemma', Lemmatizer(
+                    model=self.model,
+                ))
+            )
+        if self.use_stemmer:
+            from .stemmer import Stemmer
+            steps.append(
+                ('stem', Stemmer(
+                    ignore_startswith=self.ignore_startswith_chars,
+                    ignore_stopwords=self.ignore_stopwords,
+                    lang=self.lang,
+                ))
+            )
+        if self.use_cooccurrence:
+            from .cooccurrence import Cooccurrence
+            steps.append(
+                ('cooccurrence', Cooccurrence(
+                    max_pairs=self.cooccurrence_max_pairs,
+                    min_count=self.cooccurrence_min_count,
+                    window=self.cooccurrence_window,
+                ))
+            )
+        if self.n_grams:
+            from .ngrams import NGrams
+            steps.append(
+                ('ngrams', NGrams(
+                    n_grams=self.n_grams,
+                ))
+            )
+        if self.use_matrix:
+            from .matrix import DocumentTermMatrix
+            steps.append(
+                ('matrix', DocumentTermMatrix(
+                    n_features=self.matrix_features,
+                ))
+            )
+        if self.use_wordcloud:
+            from .wordcloud import Wordcloud
+            steps.append(
+                ('wordcloud', Wordcloud(
+                    approx_counters=self.approx_counters,
+                    approx_error=self.approx_error,
+                    exclude_words=self.exclude_words,
+                    max_words=self.max_words,
+                    min_count=self.min_count,
+                    reference=self.reference,
+                    score=self.score,
+                    spill_memory=self.spill_memory or self.__spill_memory(),
+                ))
+            )
+        super().__init__(steps=steps)
+
+    def iter_transform(self, X):
+        """
+        Yields transformed data per input instead of concatenating all inputs
+        first, so that reading (concurrent, if `n_threads` > 1) overlaps with
+        the remaining steps. Excludes the final word cloud step.
+
+        If `time_column` is set, yields Series indexed by timestamps, kept
+        across steps that return lists.
+
+        If `max_memory` is set, raises MemoryError as soon as memory grows
+        beyond it, rather than swapping (if memory in use is known, from
+        /proc or psutil). If `progress` is set, reports progress once per
+        chunk to stderr ("-") or a JSON lines log file, with time spent per
+        step, reading ("pandas") and counting ("wordcloud", i.e. consuming
+        the chunks yielded). Tokens are counted only once tokenized (lists).
+        """
+        import pandas as pd
+
+        steps = [(name, step) for name, step in self.steps if name not in ("pandas", "wordcloud")]
+        chunks = self.named_steps["pandas"].iter_transform(X) if "pandas" in self.named_steps else [X]
+
+        baseline = self.__memory() if self.max_memory else None
+        if self.max_memory and baseline is None:
+            log.warning("Memory in use is unknown (no /proc or psutil), so maximum memory is not enforced.")
+        progress = self.__progress(X) if self.progress else None
+        files, n_bytes = 0, 0
+        clock, counting = monotonic(), 0.0
+
+        for Xt in chunks:
+            stages = {"pandas": monotonic() - clock} if progress else {}
+            if baseline is not None and self.__memory() - baseline > self.max_memory:
+                raise MemoryError(
+                    f"Exceeded maximum memory ({self.max_memory / 1024 ** 2:.1f} MB) with "
+                    f"{(self.__memory() - baseline) / 1024 ** 2:.1f} MB in use."
+                )
+            index = Xt.index if isinstance(Xt, pd.Series) else None
+            for name, step in steps:
+                clock = monotonic()
+                Xt = step.transform(Xt)
+                index = Xt.index if isinstance(Xt, pd.Series) else index
+                if progress:
+                    stages[name] = monotonic() - clock
+
+            if progress:
+                pandas = self.named_steps.get("pandas")
+                progress.update(
+                    files=getattr(pandas, "files_read_", 0) - files,
+                    n_bytes=getattr(pandas, "bytes_read_", 0) - n_bytes,
+                    docs=len(Xt),
+                    tokens=0 if type(next(iter(Xt), None)) == str else sum(map(len, Xt)),
+                    stages={**stages, "wordcloud": counting},
+                )
+                files, n_bytes = getattr(pandas, "files_read_", 0), getattr(pandas, "bytes_read_", 0)
+
+            clock = monotonic()
+            yield pd.Series(Xt, index=index, dtype=object) if self.time_column and type(Xt) == list else Xt
+            counting, clock = monotonic() - clock, monotonic()
+
+        if progress:
+            progress.update(stages={"wordcloud": counting})
+            progress.close()
+
+    def __progress(self, X):
+        from .progress import Progress
+        paths = [x for x in (X if type(X) == list else [X]) if type(x) == str]
+        return Progress(
+            self.progress,
+            files_total=len(paths) or None,
+            bytes_total=sum(getsize(x) for x in paths) or None,
+        )
+
+    def __spill_memory(self):
+        """ Returns half of `max_memory` for exact word count, the rest is for reading. """
+        if self.max_memory and self.score == "count" and not (self.approx_counters or self.approx_error):
+            return self.max_memory // 2
+
+    @staticmethod
+    def __memory() -> int:
+        """ Returns memory in use (resident set size) in bytes, or None if unknown. """
+        try:
+            from os import sysconf  # Not available on Windows.
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * sysconf("SC_PAGE_SIZE")
+        except (ImportError, OSError, ValueError):
+            try:
+                import psutil
+            except ImportError:
+                return None
+            return psutil.Process().memory_info().rss
+
+    @staticmethod
+    def __stopwords(s):
+        from .stopwords import combine
+        return combine(s) if s else []
@@ -0,0 +1,107 @@
+import json
+import sys
+from datetime import datetime, timedelta
+from time import monotonic
+
+INTERVAL = 1.0
+
+
+class Progress():
+    """
+    Reports files, bytes, documents and tokens processed, with current
+    throughput (since the previous report) and estimated time left (by
+    bytes, if sized up front), either to stderr or as JSON lines appended to
+    a log file ("-" for stderr).
+
+    Time spent per stage (e.g. per pipeline step) is added up as reported by
+    updates, each with its own estimated time left at the same pace.
+
+    Updates are meant to be batched (e.g. once per chunk) and are only
+    written at most once every `interval` seconds.
+    """
+    def __init__(
+        self,
+        path: str = "-",
+        stage: str = "process",
+        files_total: int = None,
+        bytes_total: int = None,
+        interval: float = INTERVAL,
+    ):
+        self.path = path
+        self.stage = stage
+        self.files_total = files_total
+        self.bytes_total = bytes_total
+        self.interval = interval
+
+        self.files = self.bytes = self.docs = self.tokens = 0
+        self.stages = {}
+        self.__start = self.__last = monotonic()
+        self.__last_docs = 0
+        self.__file = sys.stderr if path == "-" else open(path, "a", encoding="utf-8")
+
+    def update(self, files: int = 0, n_bytes: int = 0, docs: int = 0, tokens: int = 0, stages: dict = {}) -> None:
+        """ Adds to processed counts and seconds per stage, reporting if `interval` has passed. """
+        self.files += files
+        self.bytes += n_bytes
+        self.docs += docs
+        self.tokens += tokens
+        for stage, seconds in stages.items():
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+        if monotonic() - self.__last >= self.interval:
+            self.report()
+
+    def report(self, done: bool = False) -> None:
+        now = monotonic()
+        elapsed = max(now - self.__start, 1e-9)
+        left = (self.bytes_total - self.bytes) / self.bytes if self.bytes_total and self.bytes and not done else None
+
+        status = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "stage": self.stage,
+            "done": done,
+            "files": self.files,
+            "files_total": self.files_total,
+            "bytes": self.bytes,
+            "bytes_total": self.bytes_total,
+            "docs": self.docs,
+            "tokens": self.tokens,
+            "docs_per_sec": round((self.docs - self.__last_docs) / max(now - self.__last, 1e-9), 1),
+            "avg_docs_per_sec": round(self.docs / elapsed, 1),
+            "elapsed": round(elapsed, 1),
+            "eta": round(elapsed * left, 1) if left is not None else None,
+            "stages": {
+                stage: {"elapsed": round(seconds, 1), "eta": round(seconds * left, 1) if left is not None else None}
+                for stage, seconds in self.stages.items()
+            },
+        }
+        self.__last, self.__last_docs = now, self.docs
+
+        if self.__file is sys.stderr:
+            self.__file.write(("\r" if self.__file.isatty() else "") + self.__format(status) + ("\n" if done or not self.__file.isatty() else ""))
+        else:
+            self.__file.write(json.dumps(status) + "\n")
+        self.__file.flush()
+
+    def close(self) -> None:
+        self.report(done=True)
+        if self.__file is not sys.stderr:
+            self.__file.close()
+
+    @staticmethod
+    def __format(status: dict) -> str:
+        files = f"{status['files']}" + (f"/{status['files_total']}" if status["files_total"] else "")
+        size = f"{status['bytes'] / 1024 ** 2:.1f}" + (
+            f"/{status['bytes_total'] / 1024 ** 2:.1f} MB ({100 * status['bytes'] / status['bytes_total']:.0f}%)"
+            if status["bytes_total"] else " MB"
+        )
+        eta = f", ETA {timedelta(seconds=round(status['eta']))}" if status["eta"] is not None else ""
+        stages = "".join(
+            f"{'; ' if i else ' ('}{stage} {times['elapsed']:.1f}s" +
+            (f", ETA {timedelta(seconds=round(times['eta']))}" if times["eta"] is not None else "")
+            for i, (stage, times) in enumerate(status["stages"].items())
+        ) + (")" if status["stages"] else "")
+        return (
+            f"[{status['stage']}] {files} files, {size}, {status['docs']:,} docs, {status['tokens']:,} tokens, "
+            f"{status['avg_docs_per_sec' if status['done'] else 'docs_per_sec']:,.0f} docs/s, {timedelta(seconds=round(status['elapsed']))} elapsed{eta}{stages}"
+        )
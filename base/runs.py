@@ -0,0 +1,54 @@
+"""
+Sorted runs of word counts on disk, mergeable in a single pass.
+
+A run is a UTF-8 text file with one "word<TAB>count" line per word, sorted
+by word, so that any number of runs (e.g. partial counts from several
+machines) are merged with a k-way merge in constant memory per run.
+"""
+
+from heapq import merge, nlargest
+from itertools import groupby
+from operator import itemgetter
+from typing import Iterable
+
+ENCODING = "utf-8"
+
+
+def write(path: str, items: Iterable, is_sorted: bool = False) -> None:
+    """ Writes (word, count) items to a run, sorting them by word unless `is_sorted`. """
+    with open(path, "w", encoding=ENCODING) as f:
+        f.writelines(
+            f"{word}\t{count}\n"
+            for word, count in (items if is_sorted else sorted(items, key=itemgetter(0)))
+        )
+
+
+def read(path: str):
+    """ Yields (word, count) items from a run, raising ValueError if not one. """
+    with open(path, "r", encoding=ENCODING) as f:
+        n = 0
+        try:
+            for line in f:
+                n += 1
+                word, count = line.rstrip("\n").rsplit("\t", 1)
+                yield word, int(count)
+        except UnicodeDecodeError:
+            raise ValueError(f"Expected 'word<TAB>count' lines in run '{path}', found binary data after line {n}.") from None
+        except ValueError:
+            raise ValueError(f"Expected 'word<TAB>count' lines in run '{path}', found line {n}: {line[:50]!r}.") from None
+
+
+def combine(runs: list):
+    """ Yields (word, count) items summed over runs (paths or sorted items), sorted by word. """
+    runs = [read(run) if type(run) == str else run for run in runs]
+    for word, items in groupby(merge(*runs, key=itemgetter(0)), key=itemgetter(0)):
+        yield word, sum(count for _, count in items)
+
+
+def top(runs: list, max_words: int, exclude_words: list = []) -> list:
+    """ Returns the top `max_words` (word, count) items over runs, keeping only a heap in memory. """
+    if max_words is None:
+        raise ValueError("Expected a finite `max_words` for top words over runs.")
+    exclude_words = set(exclude_words)
+    items = ((word, count) for word, count in combine(runs) if word not in exclude_words)
+    return nlargest(max_words, items, key=itemgetter(1))
@@ -0,0 +1,143 @@
+import json
+import logging as log
+import sys
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from itertools import chain
+from os import remove
+from os.path import exists
+from socketserver import UnixStreamServer
+from urllib.parse import parse_qs, urlparse
+
+from .defaults import AVAILABLE_SCORES
+from .wordcloud import PHRASE_SCORES
+
+ENCODING = "utf-8"
+OVERRIDES = {"max_words", "exclude_words", "score"}
+
+
+class UnixHTTPServer(UnixStreamServer):
+    """ HTTP server listening on a Unix domain socket. """
+
+
+def serve(nlp, wordcloud, address: str) -> None:
+    """
+    Serves a resident pipeline over HTTP, either on "host:port" or on a
+    Unix socket path, so that models and stopwords are loaded only once.
+
+    POST a JSON object with either "texts" (list of documents) or "files"
+    (list of paths readable by the server), optionally overriding
+    "max_words", "exclude_words" and "score". Returns word counts as a JSON object,
+    or the rendered word cloud with "?format=html".
+    """
+    handler = type("Handler", (RequestHandler,), {"nlp": nlp, "wordcloud": wordcloud})
+
+    if ":" in address:
+        host, port = address.rsplit(":", 1)
+        server = HTTPServer((host or "localhost", int(port)), handler)
+    else:
+        if exists(address):
+            remove(address)
+        server = UnixHTTPServer(address, handler)
+
+    print(f"Serving pipeline {[name for name, step in nlp.steps]} on '{address}'...", file=sys.stderr, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+
+    nlp = None
+    wordcloud = None
+
+    def do_GET(self):
+        self.__respond(200, {"steps": [name for name, step in self.nlp.steps]})
+
+    def do_POST(self):
+        try:
+            body = self.__validate(
+                json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or "{}")
+            )
+        except ValueError as e:
+            return self.__respond(400, {"error": str(e)})
+
+        try:
+            for name, step in self.nlp.steps:
+                step.fit(None)  # Resets stateful steps between requests.
+
+            wordcount = self.wordcloud._wordcount(
+                chain.from_iterable(self.__transform(body)),
+                max_words=body.get("max_words", self.wordcloud.max_words),
+                exclude_words=body.get("exclude_words", self.wordcloud.exclude_words),
+                approx_counters=self.wordcloud.approx_counters,
+                approx_error=self.wordcloud.approx_error,
+                score=body.get("score", self.wordcloud.score),
+                reference=self.wordcloud.reference,
+                min_count=self.wordcloud.min_count,
+                spill_memory=self.wordcloud.spill_memory,
+            )
+        except Exception as e:
+            log.exception(e)
+            return self.__respond(500, {"error": f"{type(e).__name__}: {e}"})
+
+        if parse_qs(urlparse(self.path).query).get("format") == ["html"]:
+            return self.__respond(200, self.wordcloud._wordcloud(wordcount.to_dict()), "text/html")
+        return self.__respond(200, wordcount.to_dict())
+
+    def address_string(self):
+        return self.client_address[0] if self.client_address else "unix"
+
+    def __validate(self, body) -> dict:
+        """ Checks the request body against the pipeline, raising ValueError (bad request) otherwise. """
+        if not isinstance(body, dict) or ("texts" in body) == ("files" in body):
+            raise ValueError("Expected a JSON object with either 'texts' or 'files'.")
+
+        unknown = set(body) - OVERRIDES - {"texts", "files"}
+        if unknown:
+            raise ValueError(f"Unknown keys {sorted(unknown)} (available: {sorted(OVERRIDES | {'texts', 'files'})}).")
+
+        for key in ("texts", "files", "exclude_words"):
+            if key in body and not (type(body[key]) == list and all(type(x) == str for x in body[key])):
+                raise ValueError(f"Expected '{key}' to be a list of strings.")
+
+        max_words = body.get("max_words")
+        if max_words is not None and not (type(max_words) == int and max_words > 0):
+            raise ValueError(f"Expected 'max_words' to be a positive integer or null, got {max_words!r}.")
+
+        if "score" in body and body["score"] not in AVAILABLE_SCORES:
+            raise ValueError(f"Unknown score {body['score']!r} (available: {AVAILABLE_SCORES}).")
+
+        score = body.get("score", self.wordcloud.score)
+        if score in PHRASE_SCORES and (self.nlp.n_grams or 1) > 1:
+            raise ValueError(f"Score '{score}' requires a pipeline with n_grams 1, not {self.nlp.n_grams}.")
+
+        self.wordcloud._check(
+            max_words=body.get("max_words", self.wordcloud.max_words),
+            approx_counters=self.wordcloud.approx_counters,
+            approx_error=self.wordcloud.approx_error,
+            score=score,
+            reference=self.wordcloud.reference,
+            spill_memory=self.wordcloud.spill_memory,
+        )
+        return body
+
+    def __transform(self, body: dict):
+        if "files" in body:
+            return self.nlp.iter_transform(body["files"])
+
+        Xt = body["texts"]
+        for name, step in self.nlp.steps:
+            if name != "pandas":
+                Xt = step.transform(Xt)
+        return [Xt]
+
+    def __respond(self, status: int, content, content_type: str = "application/json"):
+        content = (content if type(content) == str else json.dumps(content, ensure_ascii=False)).encode(ENCODING)
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset={ENCODING}")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
@@ -1,5921 +0,0 @@
-"""
-Total stopword count: 4579 strings.
-
-    Catalan:    825
-    Chinese:    119
-    English:    777
-    French:     1317
-    German:     616
-    Italian:    443
-    Japanese:   44
-    Portuguese: 806
-    Russian:    421
-    Spanish:    491
-"""
-
-COMMON_STOPWORDS = [
-    "罓",
-    "amp",
-    "null",
-    "x200b",
-]
-
-CATALAN_STOPWORDS = [
-    "a",
-    "abans-d'ahir",
-    "abans",
-    "abansdahir",
-    "abintestat",
-    "aci",
-    "ací",
-    "aco",
-    "açò",
-    "adagio",
-    "adàgio",
-    "ades",
-    "adés",
-    "adesiara",
-    "adeu",
-    "adéu",
-    "adhuc",
-    "àdhuc",
-    "ah",
-    "ahir",
-    "ai",
-    "aitambe",
-    "aitambé",
-    "aitampoc",
-    "aitan",
-    "aitant",
-    "aitantost",
-    "aixa",
-    "aixà",
-    "aixi",
-    "així",
-    "aixo",
-    "això",
-    "alca",
-    "alça",
-    "aleshores",
-    "algu",
-    "algú",
-    "algun",
-    "alguna",
-    "algunes",
-    "alguns",
-    "alhora",
-    "alies",
-    "àlies",
-    "alla",
-    "allà",
-    "al·legro",
-    "allen",
-    "allèn",
-    "alli",
-    "allí",
-    "allo",
-    "allò",
-    "almenys",
-    "alto",
-    "altra",
-    "altre",
-    "altres",
-    "altresi",
-    "altresí",
-    "altri",
-    "amargament",
-    "amb",
-    "ambdos",
-    "ambdós",
-    "ambdues",
-    "amen",
-    "amén",
-    "amunt",
-    "anc",
-    "andante",
-    "andantino",
-    "anit",
-    "ans",
-    "antany",
-    "apa",
-    "apres",
-    "aprés",
-    "aqueix",
-    "aqueixa",
-    "aqueixes",
-    "aqueixos",
-    "aqueixs",
-    "aquell",
-    "aquella",
-    "aquelles",
-    "aquells",
-    "aquen",
-    "aquèn",
-    "aquest",
-    "aquesta",
-    "aquestes",
-    "aquests",
-    "aqui",
-    "aquí",
-    "ara",
-    "arran",
-    "arrera",
-    "arrere",
-    "arreu",
-    "arri",
-    "arruix",
-    "atxim",
-    "au",
-    "avall",
-    "avant",
-    "aviat",
-    "avui",
-    "bah",
-    "baix",
-    "baldament",
-    "ballmanetes",
-    "banzim-banzam",
-    "banzimbanzam",
-    "bastant",
-    "bastants",
-    "be",
-    "bé",
-    "ben",
-    "bis",
-    "bitllo-bitllo",
-    "bitllobitllo",
-    "bo",
-    "ca",
-    "ça",
-    "cada",
-    "cal",
-    "cap",
-    "car",
-    "caram",
-    "catorze",
-    "cent",
-    "centes",
-    "cents",
-    "cerca",
-    "cert",
-    "certa",
-    "certes",
-    "certs",
-    "cinc",
-    "cinquanta",
-    "cinque",
-    "cinquè",
-    "cinquena",
-    "cinquenes",
-    "cinquens",
-    "co",
-    "ço",
-    "com",
-    "comsevulla",
-    "contra",
-    "cordons",
-    "corrents",
-    "cric-crac",
-    "criccrac",
-    "d",
-    "daixo",
-    "daixò",
-    "daixonses",
-    "dallo",
-    "dallò",
-    "dallonses",
-    "dalt",
-    "daltabaix",
-    "damunt",
-    "darrera",
-    "darrere",
-    "davall",
-    "davant",
-    "de",
-    "debades",
-    "deca",
-    "deçà",
-    "dedins",
-    "defora",
-    "dejorn",
-    "dejus",
-    "dejús",
-    "della",
-    "dellà",
-    "dema",
-    "demà",
-    "dementre",
-    "demes",
-    "demés",
-    "dempeus",
-    "des",
-    "dese",
-    "desè",
-    "desena",
-    "desenes",
-    "desens",
-    "despres",
-    "després",
-    "dessobre",
-    "dessota",
-    "dessus",
-    "dessús",
-    "deu",
-    "devers",
-    "devora",
-    "diferents",
-    "dinou",
-    "dins",
-    "dintre",
-    "disset",
-    "divers",
-    "diversa",
-    "diverses",
-    "diversos",
-    "divuit",
-    "doncs",
-    "dos",
-    "dotze",
-    "dues",
-    "durant",
-    "ecs",
-    "eh",
-    "el",
-    "ela",
-    "elis",
-    "ell",
-    "ella",
-    "elles",
-    "ells",
-    "els",
-    "em",
-    "empero",
-    "emperò",
-    "en",
-    "enans",
-    "enant",
-    "enca",
-    "ençà",
-    "encara",
-    "encontinent",
-    "endalt",
-    "endarrera",
-    "endarrere",
-    "endavant",
-    "endebades",
-    "endema",
-    "endemà",
-    "endemes",
-    "endemés",
-    "endemig",
-    "endins",
-    "endintre",
-    "enfora",
-    "engir",
-    "enguany",
-    "enguanyasses",
-    "enjus",
-    "enjús",
-    "enlaire",
-    "enlla",
-    "enllà",
-    "enlloc",
-    "enrera",
-    "enrere",
-    "ens",
-    "ensems",
-    "ensota",
-    "ensus",
-    "ensús",
-    "entorn",
-    "entre",
-    "entremig",
-    "entretant",
-    "entro",
-    "entrò",
-    "envers",
-    "envides",
-    "enviro",
-    "enviró",
-    "environs",
-    "ep",
-    "era",
-    "erem",
-    "érem",
-    "eren",
-    "eres",
-    "ereu",
-    "éreu",
-    "ergo",
-    "es",
-    "és",
-    "escar",
-    "essent",
-    "esser",
-    "ésser",
-    "est",
-    "esta",
-    "està",
-    "estada",
-    "estades",
-    "estan",
-    "estant",
-    "estar",
-    "estara",
-    "estarà",
-    "estaran",
-    "estaras",
-    "estaràs",
-    "estare",
-    "estaré",
-    "estarem",
-    "estareu",
-    "estaria",
-    "estariem",
-    "estaríem",
-    "estarien",
-    "estaries",
-    "estarieu",
-    "estaríeu",
-    "estas",
-    "estàs",
-    "estat",
-    "estats",
-    "estava",
-    "estavem",
-    "estàvem",
-    "estaven",
-    "estaves",
-    "estaveu",
-    "estàveu",
-    "estem",
-    "estes",
-    "esteu",
-    "estic",
-    "estigue",
-    "estigué",
-    "estiguem",
-    "estiguerem",
-    "estiguérem",
-    "estigueren",
-    "estigueres",
-    "estiguereu",
-    "estiguéreu",
-    "estigues",
-    "estigués",
-    "estiguessis",
-    "estigueu",
-    "estigui",
-    "estiguí",
-    "estiguin",
-    "estiguis",
-    "estos",
-    "et",
-    "etc",
-    "etcetera",
-    "etcètera",
-    "ets",
-    "excepte",
-    "fins",
-    "fora",
-    "fóra",
-    "forca",
-    "força",
-    "forem",
-    "fórem",
-    "foren",
-    "fores",
-    "foreu",
-    "fóreu",
-    "fos",
-    "fossim",
-    "fóssim",
-    "fossin",
-    "fossis",
-    "fossiu",
-    "fóssiu",
-    "fou",
-    "fra",
-    "fui",
-    "gaire",
-    "gairebe",
-    "gairebé",
-    "gaires",
-    "gens",
-    "girientorn",
-    "gratis",
-    "ha",
-    "hagi",
-    "hagim",
-    "hàgim",
-    "hagin",
-    "hagis",
-    "hagiu",
-    "hàgiu",
-    "haguda",
-    "hagudes",
-    "hague",
-    "hagué",
-    "haguerem",
-    "haguérem",
-    "hagueren",
-    "hagueres",
-    "haguereu",
-    "haguéreu",
-    "hagues",
-    "hagués",
-    "haguessim",
-    "haguéssim",
-    "haguessin",
-    "haguessis",
-    "haguessiu",
-    "haguéssiu",
-    "hagui",
-    "haguí",
-    "hagut",
-    "haguts",
-    "hala",
-    "han",
-    "has",
-    "haura",
-    "haurà",
-    "hauran",
-    "hauras",
-    "hauràs",
-    "haure",
-    "hauré",
-    "haurem",
-    "haureu",
-    "hauria",
-    "hauriem",
-    "hauríem",
-    "haurien",
-    "hauries",
-    "haurieu",
-    "hauríeu",
-    "havem",
-    "havent",
-    "haver",
-    "haveu",
-    "havia",
-    "haviem",
-    "havíem",
-    "havien",
-    "havies",
-    "havieu",
-    "havíeu",
-    "he",
-    "hem",
-    "heu",
-    "hi",
-    "ho",
-    "hom",
-    "hui",
-    "i",
-    "idem",
-    "ídem",
-    "igual",
-    "iguals",
-    "inclusive",
-    "ja",
-    "jamai",
-    "jo",
-    "l",
-    "la",
-    "leri-leri",
-    "lerileri",
-    "les",
-    "li",
-    "lla",
-    "llavors",
-    "llevat",
-    "lluny",
-    "llur",
-    "llurs",
-    "lo",
-    "los",
-    "ls",
-    "m",
-    "ma",
-    "mai",
-    "mal",
-    "malament",
-    "malgrat",
-    "manco",
-    "mant",
-    "manta",
-    "mantes",
-    "mantinent",
-    "mants",
-    "massa",
-    "mateix",
-    "mateixa",
-    "mateixes",
-    "mateixos",
-    "me",
-    "mentre",
-    "mentrestant",
-    "menys",
-    "mes",
-    "més",
-    "meu",
-    "meua",
-    "meues",
-    "meus",
-    "meva",
-    "meves",
-    "mi",
-    "mig",
-    "mil",
-    "mitges",
-    "mitja",
-    "mitjancant",
-    "mitjançant",
-    "mitjos",
-    "moixoni",
-    "molt",
-    "molta",
-    "moltes",
-    "molts",
-    "mon",
-    "mos",
-    "n",
-    "na",
-    "ne",
-    "ni",
-    "ningu",
-    "ningú",
-    "no",
-    "nogensmenys",
-    "nomes",
-    "només",
-    "noranta",
-    "nos",
-    "nós",
-    "nòs",
-    "nosaltres",
-    "nostra",
-    "nostre",
-    "nostres",
-    "nou",
-    "nove",
-    "novè",
-    "novena",
-    "novenes",
-    "novens",
-    "ns",
-    "o",
-    "oh",
-    "oi",
-    "oida",
-    "oidà",
-    "olim",
-    "òlim",
-    "on",
-    "onsevulga",
-    "onsevulla",
-    "onze",
-    "pas",
-    "passim",
-    "pàssim",
-    "pengim-penjam",
-    "pengimpenjam",
-    "per",
-    "pero",
-    "però",
-    "perque",
-    "perquè",
-    "pertot",
-    "piano",
-    "pla",
-    "poc",
-    "poca",
-    "pocs",
-    "poques",
-    "potser",
-    "prest",
-    "primer",
-    "primera",
-    "primeres",
-    "primers",
-    "pro",
-    "prompte",
-    "prop",
-    "prou",
-    "puix",
-    "pus",
-    "qual",
-    "quals",
-    "qualsevol",
-    "qualsevulla",
-    "qualssevol",
-    "qualssevulla",
-    "quan",
-    "quant",
-    "quanta",
-    "quantes",
-    "quants",
-    "quaranta",
-    "quart",
-    "quarta",
-    "quartes",
-    "quarts",
-    "quasi",
-    "quatre",
-    "que",
-    "què",
-    "quelcom",
-    "qui",
-    "quin",
-    "quina",
-    "quines",
-    "quins",
-    "quinze",
-    "quisvulla",
-    "ran",
-    "re",
-    "rebe",
-    "rebé",
-    "renoi",
-    "rera",
-    "rere",
-    "res",
-    "retruc",
-    "s",
-    "sa",
-    "salvament",
-    "salvant",
-    "salvat",
-    "se",
-    "segon",
-    "segona",
-    "segones",
-    "segons",
-    "seguida",
-    "seixanta",
-    "sempre",
-    "sengles",
-    "sens",
-    "sense",
-    "ser",
-    "sera",
-    "serà",
-    "seran",
-    "seras",
-    "seràs",
-    "sere",
-    "seré",
-    "serem",
-    "sereu",
-    "seria",
-    "seriem",
-    "seríem",
-    "serien",
-    "series",
-    "serieu",
-    "seríeu",
-    "ses",
-    "set",
-    "setanta",
-    "sete",
-    "setè",
-    "setena",
-    "setenes",
-    "setens",
-    "setze",
-    "seu",
-    "seua",
-    "seues",
-    "seus",
-    "seva",
-    "seves",
-    "si",
-    "sí",
-    "sia",
-    "siau",
-    "sic",
-    "siguem",
-    "sigues",
-    "sigueu",
-    "sigui",
-    "siguin",
-    "siguis",
-    "sino",
-    "sinó",
-    "sis",
-    "sise",
-    "sisè",
-    "sisena",
-    "sisenes",
-    "sisens",
-    "sobre",
-    "sobretot",
-    "soc",
-    "sóc",
-    "sol",
-    "sola",
-    "solament",
-    "soles",
-    "sols",
-    "som",
-    "son",
-    "són",
-    "sos",
-    "sota",
-    "sots",
-    "sou",
-    "sovint",
-    "suara",
-    "t",
-    "ta",
-    "tal",
-    "tals",
-    "tambe",
-    "també",
-    "tampoc",
-    "tan",
-    "tanmateix",
-    "tant",
-    "tanta",
-    "tantes",
-    "tantost",
-    "tants",
-    "te",
-    "tercer",
-    "tercera",
-    "terceres",
-    "tercers",
-    "tes",
-    "teu",
-    "teua",
-    "teues",
-    "teus",
-    "teva",
-    "teves",
-    "ton",
-    "tos",
-    "tost",
-    "tostemps",
-    "tot",
-    "tota",
-    "total",
-    "totes",
-    "tothom",
-    "tothora",
-    "tots",
-    "trenta",
-    "tres",
-    "tret",
-    "tretze",
-    "tu",
-    "tururut",
-    "u",
-    "uf",
-    "ui",
-    "uix",
-    "ultim",
-    "últim",
-    "ultima",
-    "última",
-    "ultimes",
-    "últimes",
-    "ultims",
-    "últims",
-    "ultra",
-    "un",
-    "una",
-    "unes",
-    "unic",
-    "únic",
-    "unica",
-    "única",
-    "unics",
-    "únics",
-    "uniques",
-    "úniques",
-    "uns",
-    "up",
-    "upa",
-    "us",
-    "va",
-    "vagi",
-    "vagin",
-    "vagis",
-    "vaig",
-    "vair",
-    "vam",
-    "van",
-    "vareig",
-    "vàreig",
-    "varem",
-    "vàrem",
-    "vares",
-    "vareu",
-    "vàreu",
-    "vas",
-    "vau",
-    "vem",
-    "verbigracia",
-    "verbigràcia",
-    "vers",
-    "ves",
-    "vés",
-    "vet",
-    "veu",
-    "vint",
-    "vora",
-    "vos",
-    "vós",
-    "vosaltres",
-    "voste",
-    "vostè",
-    "vostes",
-    "vostès",
-    "vostra",
-    "vostre",
-    "vostres",
-    "vuit",
-    "vuitanta",
-    "vuite",
-    "vuitè",
-    "vuitena",
-    "vuitenes",
-    "vuitens",
-    "xao-xano",
-    "xaoxano",
-    "xau-xau",
-    "xauxau",
-    "xec",
-]
-
-CHINESE_STOPWORDS = [
-    "一",
-    "上",
-    "下",
-    "不",
-    "与",
-    "且",
-    "个",
-    "为",
-    "乃",
-    "么",
-    "之",
-    "也",
-    "了",
-    "于",
-    "些",
-    "亦",
-    "人",
-    "今",
-    "仍",
-    "从",
-    "他",
-    "以",
-    "们",
-    "但",
-    "何",
-    "你",
-    "使",
-    "儿",
-    "其",
-    "再",
-    "几",
-    "凡",
-    "凭",
-    "则",
-    "别",
-    "到",
-    "即",
-    "却",
-    "去",
-    "又",
-    "及",
-    "另",
-    "只",
-    "可",
-    "各",
-    "同",
-    "后",
-    "向",
-    "吧",
-    "和",
-    "咱",
-    "哇",
-    "哟",
-    "哪",
-    "啥",
-    "啦",
-    "嗡",
-    "嘛",
-    "因",
-    "在",
-    "她",
-    "好",
-    "如",
-    "它",
-    "小",
-    "尔",
-    "已",
-    "并",
-    "当",
-    "往",
-    "很",
-    "得",
-    "怎",
-    "您",
-    "我",
-    "或",
-    "所",
-    "打",
-    "把",
-    "拿",
-    "据",
-    "无",
-    "既",
-    "是",
-    "曾",
-    "最",
-    "有",
-    "来",
-    "某",
-    "此",
-    "每",
-    "比",
-    "沿",
-    "用",
-    "由",
-    "的",
-    "看",
-    "着",
-    "给",
-    "而",
-    "自",
-    "至",
-    "致",
-    "若",
-    "虽",
-    "被",
-    "让",
-    "该",
-    "诸",
-    "谁",
-    "起",
-    "趁",
-    "距",
-    "跟",
-    "还",
-    "这",
-    "那",
-    "随",
-    "靠",
-]
-
-ENGLISH_STOPWORDS = [
-    "a's",
-    "a",
-    "able",
-    "about",
-    "above",
-    "abroad",
-    "according",
-    "accordingly",
-    "across",
-    "actually",
-    "adj",
-    "after",
-    "afterwards",
-    "again",
-    "against",
-    "ago",
-    "ahead",
-    "ain't",
-    "aint",
-    "all",
-    "allow",
-    "allows",
-    "almost",
-    "alone",
-    "along",
-    "alongside",
-    "already",
-    "also",
-    "although",
-    "always",
-    "am",
-    "amid",
-    "amidst",
-    "among",
-    "amongst",
-    "amoungst",
-    "amount",
-    "an",
-    "and",
-    "another",
-    "any",
-    "anybody",
-    "anyhow",
-    "anyone",
-    "anything",
-    "anyway",
-    "anyways",
-    "anywhere",
-    "apart",
-    "appear",
-    "appreciate",
-    "appropriate",
-    "are",
-    "aren't",
-    "arent",
-    "around",
-    "as",
-    "aside",
-    "ask",
-    "asking",
-    "associated",
-    "at",
-    "available",
-    "away",
-    "awfully",
-    "b",
-    "back",
-    "backward",
-    "backwards",
-    "be",
-    "became",
-    "because",
-    "become",
-    "becomes",
-    "becoming",
-    "been",
-    "before",
-    "beforehand",
-    "begin",
-    "behind",
-    "being",
-    "believe",
-    "below",
-    "beside",
-    "besides",
-    "best",
-    "better",
-    "between",
-    "beyond",
-    "bill",
-    "both",
-    "bottom",
-    "brief",
-    "but",
-    "by",
-    "c'mon",
-    "c's",
-    "c",
-    "call",
-    "came",
-    "can't",
-    "can",
-    "cannot",
-    "cant",
-    "caption",
-    "cause",
-    "causes",
-    "certain",
-    "certainly",
-    "changes",
-    "clearly",
-    "cmon",
-    "co.",
-    "co",
-    "com",
-    "come",
-    "comes",
-    "computer",
-    "con",
-    "concerning",
-    "consequently",
-    "consider",
-    "considering",
-    "contain",
-    "containing",
-    "contains",
-    "corresponding",
-    "could",
-    "couldn't",
-    "couldnt",
-    "course",
-    "cry",
-    "cs",
-    "currently",
-    "d",
-    "dare",
-    "daren't",
-    "darent",
-    "de",
-    "definitely",
-    "describe",
-    "described",
-    "despite",
-    "detail",
-    "did",
-    "didn't",
-    "didnt",
-    "different",
-    "directly",
-    "do",
-    "does",
-    "doesn't",
-    "doesnt",
-    "doing",
-    "don't",
-    "done",
-    "dont",
-    "down",
-    "downwards",
-    "due",
-    "during",
-    "e",
-    "each",
-    "edu",
-    "eg",
-    "eight",
-    "eighty",
-    "either",
-    "eleven",
-    "else",
-    "elsewhere",
-    "empty",
-    "end",
-    "ending",
-    "enough",
-    "entirely",
-    "especially",
-    "et",
-    "etc",
-    "even",
-    "ever",
-    "evermore",
-    "every",
-    "everybody",
-    "everyone",
-    "everything",
-    "everywhere",
-    "ex",
-    "exactly",
-    "example",
-    "except",
-    "f",
-    "fairly",
-    "far",
-    "farther",
-    "few",
-    "fewer",
-    "fifteen",
-    "fifth",
-    "fify",
-    "fill",
-    "find",
-    "fire",
-    "first",
-    "five",
-    "followed",
-    "following",
-    "follows",
-    "for",
-    "forever",
-    "former",
-    "formerly",
-    "forth",
-    "forty",
-    "forward",
-    "found",
-    "four",
-    "from",
-    "front",
-    "full",
-    "further",
-    "furthermore",
-    "g",
-    "get",
-    "gets",
-    "getting",
-    "give",
-    "given",
-    "gives",
-    "go",
-    "goes",
-    "going",
-    "gone",
-    "got",
-    "gotten",
-    "greetings",
-    "h",
-    "had",
-    "hadn't",
-    "hadnt",
-    "half",
-    "happens",
-    "hardly",
-    "has",
-    "hasn't",
-    "hasnt",
-    "have",
-    "haven't",
-    "havent",
-    "having",
-    "he'd",
-    "he'll",
-    "he's",
-    "he",
-    "hed",
-    "hell",
-    "hello",
-    "help",
-    "hence",
-    "her",
-    "here's",
-    "here",
-    "hereafter",
-    "hereby",
-    "herein",
-    "heres",
-    "hereupon",
-    "hers",
-    "herse",
-    "herse”",
-    "herself",
-    "hes",
-    "hi",
-    "him",
-    "himse",
-    "himse”",
-    "himself",
-    "his",
-    "hither",
-    "hopefully",
-    "how's",
-    "how",
-    "howbeit",
-    "however",
-    "hows",
-    "hundred",
-    "i'd",
-    "i'll",
-    "i'm",
-    "i've",
-    "i",
-    "id",
-    "ie",
-    "if",
-    "ignored",
-    "ill",
-    "im",
-    "immediate",
-    "in",
-    "inasmuch",
-    "inc.",
-    "inc",
-    "indeed",
-    "indicate",
-    "indicated",
-    "indicates",
-    "inner",
-    "inside",
-    "insofar",
-    "instead",
-    "interest",
-    "into",
-    "inward",
-    "is",
-    "isn't",
-    "isnt",
-    "it'd",
-    "it'll",
-    "it's",
-    "it",
-    "itd",
-    "itll",
-    "its",
-    "itse",
-    "itse”",
-    "itself",
-    "ive",
-    "j",
-    "just",
-    "k",
-    "keep",
-    "keeps",
-    "kept",
-    "know",
-    "known",
-    "knows",
-    "l",
-    "last",
-    "lately",
-    "later",
-    "latter",
-    "latterly",
-    "least",
-    "less",
-    "lest",
-    "let's",
-    "let",
-    "lets",
-    "like",
-    "liked",
-    "likely",
-    "likewise",
-    "little",
-    "look",
-    "looking",
-    "looks",
-    "low",
-    "lower",
-    "ltd",
-    "m",
-    "made",
-    "mainly",
-    "make",
-    "makes",
-    "many",
-    "may",
-    "maybe",
-    "mayn't",
-    "maynt",
-    "me",
-    "mean",
-    "meantime",
-    "meanwhile",
-    "merely",
-    "might",
-    "mightn't",
-    "mightnt",
-    "mill",
-    "mine",
-    "minus",
-    "miss",
-    "more",
-    "moreover",
-    "most",
-    "mostly",
-    "move",
-    "mr",
-    "mrs",
-    "much",
-    "must",
-    "mustn't",
-    "mustnt",
-    "my",
-    "myse",
-    "myse”",
-    "myself",
-    "n",
-    "name",
-    "namely",
-    "nd",
-    "near",
-    "nearly",
-    "necessary",
-    "need",
-    "needn't",
-    "neednt",
-    "needs",
-    "neither",
-    "never",
-    "neverf",
-    "neverless",
-    "nevertheless",
-    "new",
-    "next",
-    "nine",
-    "ninety",
-    "no-one",
-    "no",
-    "nobody",
-    "non",
-    "none",
-    "nonetheless",
-    "noone",
-    "nor",
-    "normally",
-    "not",
-    "nothing",
-    "notwithstanding",
-    "novel",
-    "now",
-    "nowhere",
-    "o",
-    "obviously",
-    "of",
-    "off",
-    "often",
-    "oh",
-    "ok",
-    "okay",
-    "old",
-    "on",
-    "once",
-    "one's",
-    "one",
-    "ones",
-    "only",
-    "onto",
-    "opposite",
-    "or",
-    "other",
-    "others",
-    "otherwise",
-    "ought",
-    "oughtn't",
-    "oughtnt",
-    "our",
-    "ours ",
-    "ours",
-    "ourselves",
-    "out",
-    "outside",
-    "over",
-    "overall",
-    "own",
-    "p",
-    "part",
-    "particular",
-    "particularly",
-    "past",
-    "per",
-    "perhaps",
-    "placed",
-    "please",
-    "plus",
-    "possible",
-    "presumably",
-    "probably",
-    "provided",
-    "provides",
-    "put",
-    "q",
-    "que",
-    "quite",
-    "qv",
-    "r",
-    "rather",
-    "rd",
-    "re",
-    "really",
-    "reasonably",
-    "recent",
-    "recently",
-    "regarding",
-    "regardless",
-    "regards",
-    "relatively",
-    "respectively",
-    "right",
-    "round",
-    "s",
-    "said",
-    "same",
-    "saw",
-    "say",
-    "saying",
-    "says",
-    "second",
-    "secondly",
-    "see",
-    "seeing",
-    "seem",
-    "seemed",
-    "seeming",
-    "seems",
-    "seen",
-    "self",
-    "selves",
-    "sensible",
-    "sent",
-    "serious",
-    "seriously",
-    "seven",
-    "several",
-    "shall",
-    "shan't",
-    "shant",
-    "she'd",
-    "she'll",
-    "she's",
-    "she",
-    "shed",
-    "shell",
-    "shes",
-    "should",
-    "shouldn't",
-    "shouldnt",
-    "show",
-    "side",
-    "since",
-    "sincere",
-    "six",
-    "sixty",
-    "so",
-    "some",
-    "somebody",
-    "someday",
-    "somehow",
-    "someone",
-    "something",
-    "sometime",
-    "sometimes",
-    "somewhat",
-    "somewhere",
-    "soon",
-    "sorry",
-    "specified",
-    "specify",
-    "specifying",
-    "still",
-    "sub",
-    "such",
-    "sup",
-    "sure",
-    "system",
-    "t's",
-    "t",
-    "take",
-    "taken",
-    "taking",
-    "tell",
-    "ten",
-    "tends",
-    "th",
-    "than",
-    "thank",
-    "thanks",
-    "thanx",
-    "that'll",
-    "that's",
-    "that've",
-    "that",
-    "thatll",
-    "thats",
-    "thatve",
-    "the",
-    "their",
-    "theirs",
-    "them",
-    "themselves",
-    "then",
-    "thence",
-    "there'd",
-    "there'll",
-    "there're",
-    "there's",
-    "there've",
-    "there",
-    "thereafter",
-    "thereby",
-    "thered",
-    "therefore",
-    "therein",
-    "therell",
-    "therere",
-    "theres",
-    "thereupon",
-    "thereve",
-    "these",
-    "they'd",
-    "they'll",
-    "they're",
-    "they've",
-    "they",
-    "theyd",
-    "theyll",
-    "theyre",
-    "theyve",
-    "thick",
-    "thin",
-    "thing",
-    "things",
-    "think",
-    "third",
-    "thirty",
-    "this",
-    "thorough",
-    "thoroughly",
-    "those",
-    "though",
-    "three",
-    "through",
-    "throughout",
-    "thru",
-    "thus",
-    "till",
-    "to",
-    "together",
-    "too",
-    "tooktop",
-    "toward",
-    "towards",
-    "tried",
-    "tries",
-    "truly",
-    "try",
-    "trying",
-    "ts",
-    "twelve",
-    "twenty",
-    "twice",
-    "two",
-    "u",
-    "un",
-    "under",
-    "underneath",
-    "undoing",
-    "unfortunately",
-    "unless",
-    "unlike",
-    "unlikely",
-    "until",
-    "unto",
-    "up",
-    "upon",
-    "upwards",
-    "us",
-    "use",
-    "used",
-    "useful",
-    "uses",
-    "using",
-    "usually",
-    "uucp",
-    "v",
-    "value",
-    "various",
-    "versus",
-    "very",
-    "via",
-    "viz",
-    "vs",
-    "w",
-    "want",
-    "wants",
-    "was",
-    "wasn't",
-    "wasnt",
-    "way",
-    "we'd",
-    "we'll",
-    "we're",
-    "we've",
-    "we",
-    "wed",
-    "welcome",
-    "well",
-    "went",
-    "were",
-    "weren't",
-    "werent",
-    "weve",
-    "what'll",
-    "what's",
-    "what've",
-    "what",
-    "whatever",
-    "whatll",
-    "whats",
-    "whatve",
-    "when's",
-    "when",
-    "whence",
-    "whenever",
-    "whens",
-    "where's",
-    "where",
-    "whereafter",
-    "whereas",
-    "whereby",
-    "wherein",
-    "wheres",
-    "whereupon",
-    "wherever",
-    "whether",
-    "which",
-    "whichever",
-    "while",
-    "whilst",
-    "whither",
-    "who'd",
-    "who'll",
-    "who's",
-    "who",
-    "whod",
-    "whoever",
-    "whole",
-    "wholl",
-    "whom",
-    "whomever",
-    "whos",
-    "whose",
-    "why's",
-    "why",
-    "whys",
-    "will",
-    "willing",
-    "wish",
-    "with",
-    "within",
-    "without",
-    "won't",
-    "wonder",
-    "wont",
-    "would",
-    "wouldn't",
-    "wouldnt",
-    "www",
-    "x",
-    "y",
-    "yes",
-    "yet",
-    "you'd",
-    "you'll",
-    "you're",
-    "you've",
-    "you",
-    "youd",
-    "youll",
-    "your",
-    "youre",
-    "yours",
-    "yourself",
-    "yourselves",
-    "youve",
-    "z",
-    "zero",
-]
-
-FRENCH_STOPWORDS = [
-    "a",
-    "à",
-    "â",
-    "abans-d'ahir",
-    "abans",
-    "abansdahir",
-    "abintestat",
-    "abord",
-    "aci",
-    "ací",
-    "aco",
-    "açò",
-    "adagio",
-    "adàgio",
-    "ades",
-    "adés",
-    "adesiara",
-    "adeu",
-    "adéu",
-    "adhuc",
-    "àdhuc",
-    "afin",
-    "ah",
-    "ahir",
-    "ai",
-    "aie",
-    "ainsi",
-    "aitambe",
-    "aitambé",
-    "aitampoc",
-    "aitan",
-    "aitant",
-    "aitantost",
-    "aixa",
-    "aixà",
-    "aixi",
-    "així",
-    "aixo",
-    "això",
-    "alca",
-    "alça",
-    "aleshores",
-    "algu",
-    "algú",
-    "algun",
-    "alguna",
-    "algunes",
-    "alguns",
-    "alhora",
-    "alies",
-    "àlies",
-    "alla",
-    "allà",
-    "allaient",
-    "al·legro",
-    "allen",
-    "allèn",
-    "alli",
-    "allí",
-    "allo",
-    "allò",
-    "allô",
-    "allons",
-    "almenys",
-    "alors",
-    "alto",
-    "altra",
-    "altre",
-    "altres",
-    "altresi",
-    "altresí",
-    "altri",
-    "amargament",
-    "amb",
-    "ambdos",
-    "ambdós",
-    "ambdues",
-    "amen",
-    "amén",
-    "amunt",
-    "anc",
-    "andante",
-    "andantino",
-    "anit",
-    "ans",
-    "antany",
-    "apa",
-    "apres",
-    "aprés",
-    "après",
-    "aqueix",
-    "aqueixa",
-    "aqueixes",
-    "aqueixos",
-    "aqueixs",
-    "aquell",
-    "aquella",
-    "aquelles",
-    "aquells",
-    "aquen",
-    "aquèn",
-    "aquest",
-    "aquesta",
-    "aquestes",
-    "aquests",
-    "aqui",
-    "aquí",
-    "ara",
-    "arran",
-    "arrera",
-    "arrere",
-    "arreu",
-    "arri",
-    "arruix",
-    "assez",
-    "attendu",
-    "atxim",
-    "au",
-    "aucun",
-    "aucune",
-    "aucuns",
-    "aujourd'hui",
-    "aujourd",
-    "aujourdhui",
-    "auquel",
-    "aura",
-    "auront",
-    "aussi",
-    "autre",
-    "autres",
-    "aux",
-    "auxquelles",
-    "auxquels",
-    "avaient",
-    "avais",
-    "avait",
-    "avall",
-    "avant",
-    "avec",
-    "aviat",
-    "avoir",
-    "avui",
-    "ayant",
-    "b",
-    "bah",
-    "baix",
-    "baldament",
-    "ballmanetes",
-    "banzim-banzam",
-    "banzimbanzam",
-    "bastant",
-    "bastants",
-    "be",
-    "bé",
-    "beaucoup",
-    "ben",
-    "bien",
-    "bigre",
-    "bis",
-    "bitllo-bitllo",
-    "bitllobitllo",
-    "bo",
-    "bon",
-    "boum",
-    "bravo",
-    "brrr",
-    "c",
-    "ca",
-    "ça",
-    "cada",
-    "cal",
-    "cap",
-    "car",
-    "caram",
-    "catorze",
-    "ce",
-    "ceci",
-    "cela",
-    "celle-ci",
-    "celle-là",
-    "celle",
-    "celleci",
-    "cellela",
-    "celles-ci",
-    "celles-là",
-    "celles",
-    "cellesci",
-    "cellesla",
-    "celui-ci",
-    "celui-là",
-    "celui",
-    "celuici",
-    "celuila",
-    "cent",
-    "centes",
-    "cents",
-    "cependant",
-    "cerca",
-    "cert",
-    "certa",
-    "certain",
-    "certaine",
-    "certaines",
-    "certains",
-    "certes",
-    "certs",
-    "ces",
-    "cet",
-    "cette",
-    "ceux-ci",
-    "ceux-là",
-    "ceux",
-    "ceuxci",
-    "ceuxla",
-    "chacun",
-    "chaque",
-    "cher",
-    "chere",
-    "chère",
-    "cheres",
-    "chères",
-    "chers",
-    "chez",
-    "chiche",
-    "chut",
-    "ci",
-    "cinc",
-    "cinq",
-    "cinquanta",
-    "cinquantaine",
-    "cinquante",
-    "cinquantieme",
-    "cinquantième",
-    "cinque",
-    "cinquè",
-    "cinquena",
-    "cinquenes",
-    "cinquens",
-    "cinquieme",
-    "cinquième",
-    "clac",
-    "clic",
-    "co",
-    "ço",
-    "com",
-    "combien",
-    "comme",
-    "comment",
-    "compris",
-    "comsevulla",
-    "concernant",
-    "contra",
-    "contre",
-    "cordons",
-    "corrents",
-    "couic",
-    "crac",
-    "cric-crac",
-    "criccrac",
-    "d",
-    "da",
-    "daixo",
-    "daixò",
-    "daixonses",
-    "dallo",
-    "dallò",
-    "dallonses",
-    "dalt",
-    "daltabaix",
-    "damunt",
-    "dans",
-    "darrera",
-    "darrere",
-    "davall",
-    "davant",
-    "de",
-    "debades",
-    "debout",
-    "debut",
-    "début",
-    "deca",
-    "deçà",
-    "dedans",
-    "dedins",
-    "defora",
-    "dehors",
-    "dejorn",
-    "dejus",
-    "dejús",
-    "dela",
-    "delà",
-    "della",
-    "dellà",
-    "dema",
-    "demà",
-    "dementre",
-    "demes",
-    "demés",
-    "dempeus",
-    "depuis",
-    "derriere",
-    "derrière",
-    "des",
-    "dès",
-    "dese",
-    "desè",
-    "desena",
-    "desenes",
-    "desens",
-    "desormais",
-    "désormais",
-    "despres",
-    "després",
-    "desquelles",
-    "desquels",
-    "dessobre",
-    "dessota",
-    "dessous",
-    "dessus",
-    "dessús",
-    "deu",
-    "deux",
-    "deuxieme",
-    "deuxième",
-    "deuxiemement",
-    "deuxièmement",
-    "devant",
-    "devers",
-    "devora",
-    "devra",
-    "devrait",
-    "diferents",
-    "different",
-    "différent",
-    "differente",
-    "différente",
-    "differentes",
-    "différentes",
-    "differents",
-    "différents",
-    "dinou",
-    "dins",
-    "dintre",
-    "dire",
-    "disset",
-    "divers",
-    "diversa",
-    "diverse",
-    "diverses",
-    "diversos",
-    "divuit",
-    "dix-huit",
-    "dix-neuf",
-    "dix-sept",
-    "dix",
-    "dixhuit",
-    "dixieme",
-    "dixième",
-    "dixneuf",
-    "dixsept",
-    "doit",
-    "doivent",
-    "donc",
-    "doncs",
-    "dont",
-    "dos",
-    "dotze",
-    "douze",
-    "douzieme",
-    "douzième",
-    "dring",
-    "droite",
-    "du",
-    "dues",
-    "duquel",
-    "durant",
-    "e",
-    "ecs",
-    "effet",
-    "eh",
-    "el",
-    "ela",
-    "elis",
-    "ell",
-    "ella",
-    "elle-même",
-    "elle",
-    "ellememe",
-    "elles-mêmes",
-    "elles",
-    "ellesmemes",
-    "ells",
-    "els",
-    "em",
-    "empero",
-    "emperò",
-    "en",
-    "enans",
-    "enant",
-    "enca",
-    "ençà",
-    "encara",
-    "encontinent",
-    "encore",
-    "endalt",
-    "endarrera",
-    "endarrere",
-    "endavant",
-    "endebades",
-    "endema",
-    "endemà",
-    "endemes",
-    "endemés",
-    "endemig",
-    "endins",
-    "endintre",
-    "enfora",
-    "engir",
-    "enguany",
-    "enguanyasses",
-    "enjus",
-    "enjús",
-    "enlaire",
-    "enlla",
-    "enllà",
-    "enlloc",
-    "enrera",
-    "enrere",
-    "ens",
-    "ensems",
-    "ensota",
-    "ensus",
-    "ensús",
-    "entorn",
-    "entre",
-    "entremig",
-    "entretant",
-    "entro",
-    "entrò",
-    "envers",
-    "envides",
-    "enviro",
-    "enviró",
-    "environ",
-    "environs",
-    "ep",
-    "era",
-    "erem",
-    "érem",
-    "eren",
-    "eres",
-    "ereu",
-    "éreu",
-    "ergo",
-    "es",
-    "és",
-    "ès",
-    "escar",
-    "essai",
-    "essent",
-    "esser",
-    "ésser",
-    "est",
-    "esta",
-    "està",
-    "estada",
-    "estades",
-    "estan",
-    "estant",
-    "estar",
-    "estara",
-    "estarà",
-    "estaran",
-    "estaras",
-    "estaràs",
-    "estare",
-    "estaré",
-    "estarem",
-    "estareu",
-    "estaria",
-    "estariem",
-    "estaríem",
-    "estarien",
-    "estaries",
-    "estarieu",
-    "estaríeu",
-    "estas",
-    "estàs",
-    "estat",
-    "estats",
-    "estava",
-    "estavem",
-    "estàvem",
-    "estaven",
-    "estaves",
-    "estaveu",
-    "estàveu",
-    "estem",
-    "estes",
-    "esteu",
-    "estic",
-    "estigue",
-    "estigué",
-    "estiguem",
-    "estiguerem",
-    "estiguérem",
-    "estigueren",
-    "estigueres",
-    "estiguereu",
-    "estiguéreu",
-    "estigues",
-    "estigués",
-    "estiguessis",
-    "estigueu",
-    "estigui",
-    "estiguí",
-    "estiguin",
-    "estiguis",
-    "estos",
-    "et",
-    "etaient",
-    "étaient",
-    "etais",
-    "étais",
-    "etait",
-    "était",
-    "etant",
-    "étant",
-    "etat",
-    "état",
-    "etc",
-    "etcetera",
-    "etcètera",
-    "ete",
-    "été",
-    "etions",
-    "étions",
-    "etre",
-    "être",
-    "ets",
-    "eu",
-    "euh",
-    "eux-mêmes",
-    "eux",
-    "euxmemes",
-    "excepte",
-    "excepté",
-    "f",
-    "facon",
-    "façon",
-    "fais",
-    "faisaient",
-    "faisant",
-    "fait",
-    "faites",
-    "feront",
-    "fi",
-    "fins",
-    "flac",
-    "floc",
-    "fois",
-    "font",
-    "fora",
-    "fóra",
-    "forca",
-    "força",
-    "force",
-    "forem",
-    "fórem",
-    "foren",
-    "fores",
-    "foreu",
-    "fóreu",
-    "fos",
-    "fossim",
-    "fóssim",
-    "fossin",
-    "fossis",
-    "fossiu",
-    "fóssiu",
-    "fou",
-    "fra",
-    "fui",
-    "g",
-    "gaire",
-    "gairebe",
-    "gairebé",
-    "gaires",
-    "gens",
-    "girientorn",
-    "gratis",
-    "h",
-    "ha",
-    "hagi",
-    "hagim",
-    "hàgim",
-    "hagin",
-    "hagis",
-    "hagiu",
-    "hàgiu",
-    "haguda",
-    "hagudes",
-    "hague",
-    "hagué",
-    "haguerem",
-    "haguérem",
-    "hagueren",
-    "hagueres",
-    "haguereu",
-    "haguéreu",
-    "hagues",
-    "hagués",
-    "haguessim",
-    "haguéssim",
-    "haguessin",
-    "haguessis",
-    "haguessiu",
-    "haguéssiu",
-    "hagui",
-    "haguí",
-    "hagut",
-    "haguts",
-    "hala",
-    "han",
-    "has",
-    "haura",
-    "haurà",
-    "hauran",
-    "hauras",
-    "hauràs",
-    "haure",
-    "hauré",
-    "haurem",
-    "haureu",
-    "hauria",
-    "hauriem",
-    "hauríem",
-    "haurien",
-    "hauries",
-    "haurieu",
-    "hauríeu",
-    "haut",
-    "havem",
-    "havent",
-    "haver",
-    "haveu",
-    "havia",
-    "haviem",
-    "havíem",
-    "havien",
-    "havies",
-    "havieu",
-    "havíeu",
-    "he",
-    "hé",
-    "hein",
-    "helas",
-    "hélas",
-    "hem",
-    "hep",
-    "heu",
-    "hi",
-    "ho",
-    "hola",
-    "holà",
-    "hom",
-    "hop",
-    "hormis",
-    "hors",
-    "hou",
-    "houp",
-    "hue",
-    "hui",
-    "huit",
-    "huitieme",
-    "huitième",
-    "hum",
-    "hurrah",
-    "i",
-    "ici",
-    "idem",
-    "ídem",
-    "igual",
-    "iguals",
-    "il",
-    "ils",
-    "importe",
-    "inclusive",
-    "j",
-    "ja",
-    "jamai",
-    "je",
-    "jo",
-    "jusqu",
-    "jusque",
-    "juste",
-    "k",
-    "l",
-    "la",
-    "là",
-    "laquelle",
-    "las",
-    "le",
-    "lequel",
-    "leri-leri",
-    "lerileri",
-    "les",
-    "lès",
-    "lesquelles",
-    "lesquels",
-    "leur",
-    "leurs",
-    "li",
-    "lla",
-    "llavors",
-    "llevat",
-    "lluny",
-    "llur",
-    "llurs",
-    "lo",
-    "longtemps",
-    "lorsque",
-    "los",
-    "ls",
-    "lui-même",
-    "lui",
-    "luimeme",
-    "m",
-    "ma",
-    "mai",
-    "maint",
-    "maintenant",
-    "mais",
-    "mal",
-    "malament",
-    "malgrat",
-    "malgre",
-    "malgré",
-    "manco",
-    "mant",
-    "manta",
-    "mantes",
-    "mantinent",
-    "mants",
-    "massa",
-    "mateix",
-    "mateixa",
-    "mateixes",
-    "mateixos",
-    "me",
-    "meme",
-    "même",
-    "memes",
-    "mêmes",
-    "mentre",
-    "mentrestant",
-    "menys",
-    "merci",
-    "mes",
-    "més",
-    "meu",
-    "meua",
-    "meues",
-    "meus",
-    "meva",
-    "meves",
-    "mi",
-    "mien",
-    "mienne",
-    "miennes",
-    "miens",
-    "mig",
-    "mil",
-    "mille",
-    "mince",
-    "mine",
-    "mitges",
-    "mitja",
-    "mitjancant",
-    "mitjançant",
-    "mitjos",
-    "moi-même",
-    "moi",
-    "moimeme",
-    "moins",
-    "moixoni",
-    "molt",
-    "molta",
-    "moltes",
-    "molts",
-    "mon",
-    "mos",
-    "mot",
-    "moyennant",
-    "n",
-    "na",
-    "ne",
-    "neanmoins",
-    "néanmoins",
-    "neuf",
-    "neuvieme",
-    "neuvième",
-    "ni",
-    "ningu",
-    "ningú",
-    "no",
-    "nogensmenys",
-    "nombreuses",
-    "nombreux",
-    "nomes",
-    "només",
-    "nommes",
-    "nommés",
-    "non",
-    "noranta",
-    "nos",
-    "nós",
-    "nòs",
-    "nosaltres",
-    "nostra",
-    "nostre",
-    "nostres",
-    "notre",
-    "nôtre",
-    "notres",
-    "nôtres",
-    "nou",
-    "nous-mêmes",
-    "nous",
-    "nousmemes",
-    "nouveaux",
-    "nove",
-    "novè",
-    "novena",
-    "novenes",
-    "novens",
-    "ns",
-    "nul",
-    "o",
-    "ô",
-    "oh",
-    "ohe",
-    "ohé",
-    "oi",
-    "oida",
-    "oidà",
-    "ole",
-    "olé",
-    "olim",
-    "òlim",
-    "olle",
-    "ollé",
-    "on",
-    "onsevulga",
-    "onsevulla",
-    "ont",
-    "onze",
-    "onzieme",
-    "onzième",
-    "ore",
-    "ou",
-    "où",
-    "ouf",
-    "ouias",
-    "oust",
-    "ouste",
-    "outre",
-    "p",
-    "paf",
-    "pan",
-    "par",
-    "parce",
-    "parmi",
-    "parole",
-    "partant",
-    "particulier",
-    "particuliere",
-    "particulière",
-    "particulierement",
-    "particulièrement",
-    "pas",
-    "passe",
-    "passé",
-    "passim",
-    "pàssim",
-    "pendant",
-    "pengim-penjam",
-    "pengimpenjam",
-    "per",
-    "pero",
-    "però",
-    "perque",
-    "perquè",
-    "personne",
-    "personnes",
-    "pertot",
-    "peu",
-    "peut",
-    "peuvent",
-    "peux",
-    "pff",
-    "pfft",
-    "pfut",
-    "piano",
-    "piece",
-    "pièce",
-    "pif",
-    "pla",
-    "plein",
-    "plouf",
-    "plupart",
-    "plus",
-    "plusieurs",
-    "plutot",
-    "plutôt",
-    "poc",
-    "poca",
-    "pocs",
-    "poques",
-    "potser",
-    "pouah",
-    "pour",
-    "pourquoi",
-    "premier",
-    "premiere",
-    "première",
-    "premierement",
-    "premièrement",
-    "pres",
-    "près",
-    "prest",
-    "primer",
-    "primera",
-    "primeres",
-    "primers",
-    "pro",
-    "proche",
-    "prompte",
-    "prop",
-    "prou",
-    "psitt",
-    "puisque",
-    "puix",
-    "pus",
-    "q",
-    "qu",
-    "qual",
-    "quals",
-    "qualsevol",
-    "qualsevulla",
-    "qualssevol",
-    "qualssevulla",
-    "quan",
-    "quand",
-    "quant-à-soi",
-    "quant",
-    "quanta",
-    "quantasoi",
-    "quantes",
-    "quants",
-    "quaranta",
-    "quarante",
-    "quart",
-    "quarta",
-    "quartes",
-    "quarts",
-    "quasi",
-    "quatorze",
-    "quatre-vingt",
-    "quatre",
-    "quatrevingt",
-    "quatrieme",
-    "quatrième",
-    "quatriemement",
-    "quatrièmement",
-    "que",
-    "què",
-    "quel",
-    "quelcom",
-    "quelconque",
-    "quelle",
-    "quelles",
-    "quelqu'un",
-    "quelque",
-    "quelques",
-    "quelquun",
-    "quels",
-    "qui",
-    "quiconque",
-    "quin",
-    "quina",
-    "quines",
-    "quins",
-    "quinze",
-    "quisvulla",
-    "quoi",
-    "quoique",
-    "r",
-    "ran",
-    "re",
-    "rebe",
-    "rebé",
-    "renoi",
-    "rera",
-    "rere",
-    "res",
-    "retruc",
-    "revoici",
-    "revoila",
-    "revoilà",
-    "rien",
-    "s",
-    "sa",
-    "sacrebleu",
-    "salvament",
-    "salvant",
-    "salvat",
-    "sans",
-    "sapristi",
-    "sauf",
-    "se",
-    "segon",
-    "segona",
-    "segones",
-    "segons",
-    "seguida",
-    "seixanta",
-    "seize",
-    "selon",
-    "sempre",
-    "sengles",
-    "sens",
-    "sense",
-    "sept",
-    "septieme",
-    "septième",
-    "ser",
-    "sera",
-    "serà",
-    "seran",
-    "seras",
-    "seràs",
-    "sere",
-    "seré",
-    "serem",
-    "sereu",
-    "seria",
-    "seriem",
-    "seríem",
-    "serien",
-    "series",
-    "serieu",
-    "seríeu",
-    "seront",
-    "ses",
-    "set",
-    "setanta",
-    "sete",
-    "setè",
-    "setena",
-    "setenes",
-    "setens",
-    "setze",
-    "seu",
-    "seua",
-    "seues",
-    "seulement",
-    "seus",
-    "seva",
-    "seves",
-    "si",
-    "sí",
-    "sia",
-    "siau",
-    "sic",
-    "sien",
-    "sienne",
-    "siennes",
-    "siens",
-    "siguem",
-    "sigues",
-    "sigueu",
-    "sigui",
-    "siguin",
-    "siguis",
-    "sino",
-    "sinó",
-    "sinon",
-    "sis",
-    "sise",
-    "sisè",
-    "sisena",
-    "sisenes",
-    "sisens",
-    "six",
-    "sixieme",
-    "sixième",
-    "sobre",
-    "sobretot",
-    "soc",
-    "sóc",
-    "soi-même",
-    "soi",
-    "soimeme",
-    "soit",
-    "soixante",
-    "sol",
-    "sola",
-    "solament",
-    "soles",
-    "sols",
-    "som",
-    "son",
-    "són",
-    "sont",
-    "sos",
-    "sota",
-    "sots",
-    "sou",
-    "sous",
-    "sovint",
-    "soyez",
-    "stop",
-    "suara",
-    "suis",
-    "suivant",
-    "sujet",
-    "sur",
-    "surtout",
-    "t",
-    "ta",
-    "tac",
-    "tal",
-    "tals",
-    "tambe",
-    "també",
-    "tampoc",
-    "tan",
-    "tandis",
-    "tanmateix",
-    "tant",
-    "tanta",
-    "tantes",
-    "tantost",
-    "tants",
-    "te",
-    "té",
-    "tel",
-    "telle",
-    "tellement",
-    "telles",
-    "tels",
-    "tenant",
-    "tercer",
-    "tercera",
-    "terceres",
-    "tercers",
-    "tes",
-    "teu",
-    "teua",
-    "teues",
-    "teus",
-    "teva",
-    "teves",
-    "tic",
-    "tien",
-    "tienne",
-    "tiennes",
-    "tiens",
-    "toc",
-    "toi-même",
-    "toi",
-    "toimeme",
-    "ton",
-    "tos",
-    "tost",
-    "tostemps",
-    "tot",
-    "tota",
-    "total",
-    "totes",
-    "tothom",
-    "tothora",
-    "tots",
-    "touchant",
-    "toujours",
-    "tous",
-    "tout",
-    "toute",
-    "toutes",
-    "treize",
-    "trenta",
-    "trente",
-    "tres",
-    "très",
-    "tret",
-    "tretze",
-    "trois",
-    "troisieme",
-    "troisième",
-    "troisiemement",
-    "troisièmement",
-    "trop",
-    "tsoin",
-    "tsouin",
-    "tu",
-    "tururut",
-    "u",
-    "uf",
-    "ui",
-    "uix",
-    "ultim",
-    "últim",
-    "ultima",
-    "última",
-    "ultimes",
-    "últimes",
-    "ultims",
-    "últims",
-    "ultra",
-    "un",
-    "una",
-    "une",
-    "unes",
-    "unic",
-    "únic",
-    "unica",
-    "única",
-    "unics",
-    "únics",
-    "uniques",
-    "úniques",
-    "uns",
-    "up",
-    "upa",
-    "us",
-    "v",
-    "va",
-    "vagi",
-    "vagin",
-    "vagis",
-    "vaig",
-    "vair",
-    "vais",
-    "valeur",
-    "vam",
-    "van",
-    "vareig",
-    "vàreig",
-    "varem",
-    "vàrem",
-    "vares",
-    "vareu",
-    "vàreu",
-    "vas",
-    "vau",
-    "ve",
-    "vé",
-    "vem",
-    "verbigracia",
-    "verbigràcia",
-    "vers",
-    "ves",
-    "vés",
-    "vet",
-    "veu",
-    "via",
-    "vif",
-    "vifs",
-    "vingt",
-    "vint",
-    "vivat",
-    "vive",
-    "vives",
-    "vlan",
-    "voici",
-    "voie",
-    "voient",
-    "voila",
-    "voilà",
-    "vont",
-    "vora",
-    "vos",
-    "vós",
-    "vosaltres",
-    "voste",
-    "vostè",
-    "vostes",
-    "vostès",
-    "vostra",
-    "vostre",
-    "vostres",
-    "votre",
-    "vôtre",
-    "votres",
-    "vôtres",
-    "vous-mêmes",
-    "vous",
-    "vousmemes",
-    "vu",
-    "vuit",
-    "vuitanta",
-    "vuite",
-    "vuitè",
-    "vuitena",
-    "vuitenes",
-    "vuitens",
-    "w",
-    "x",
-    "xano-xano",
-    "xanoxano",
-    "xau-xau",
-    "xauxau",
-    "xec",
-    "y",
-    "z",
-    "zut",
-]
-
-GERMAN_STOPWORDS = [
-    "a",
-    "ab",
-    "aber",
-    "ach",
-    "acht",
-    "achte",
-    "achten",
-    "achter",
-    "achtes",
-    "ag",
-    "alle",
-    "allein",
-    "allem",
-    "allen",
-    "aller",
-    "allerdings",
-    "alles",
-    "allgemeinen",
-    "als",
-    "also",
-    "am",
-    "an",
-    "andere",
-    "anderen",
-    "andern",
-    "anders",
-    "au",
-    "auch",
-    "auf",
-    "aus",
-    "ausser",
-    "außer",
-    "ausserdem",
-    "außerdem",
-    "b",
-    "bald",
-    "bei",
-    "beide",
-    "beiden",
-    "beim",
-    "beispiel",
-    "bekannt",
-    "bereits",
-    "besonders",
-    "besser",
-    "besten",
-    "bin",
-    "bis",
-    "bisher",
-    "bist",
-    "c",
-    "d.h",
-    "d",
-    "da",
-    "dabei",
-    "dadurch",
-    "dafur",
-    "dafür",
-    "dagegen",
-    "daher",
-    "dahin",
-    "dahinter",
-    "damals",
-    "damit",
-    "danach",
-    "daneben",
-    "dank",
-    "dann",
-    "daran",
-    "darauf",
-    "daraus",
-    "darf",
-    "darfst",
-    "darin",
-    "daruber",
-    "darüber",
-    "darum",
-    "darunter",
-    "das",
-    "dasein",
-    "daselbst",
-    "dass",
-    "daß",
-    "dasselbe",
-    "davon",
-    "davor",
-    "dazu",
-    "dazwischen",
-    "dein",
-    "deine",
-    "deinem",
-    "deiner",
-    "dem",
-    "dementsprechend",
-    "demgegenuber",
-    "demgegenüber",
-    "demgemäss",
-    "demgemäß",
-    "demselben",
-    "demzufolge",
-    "den",
-    "denen",
-    "denn",
-    "denselben",
-    "der",
-    "deren",
-    "derjenige",
-    "derjenigen",
-    "dermassen",
-    "dermaßen",
-    "derselbe",
-    "derselben",
-    "des",
-    "deshalb",
-    "desselben",
-    "dessen",
-    "deswegen",
-    "dh",
-    "dich",
-    "die",
-    "diejenige",
-    "diejenigen",
-    "dies",
-    "diese",
-    "dieselbe",
-    "dieselben",
-    "diesem",
-    "diesen",
-    "dieser",
-    "dieses",
-    "dir",
-    "doch",
-    "dort",
-    "drei",
-    "drin",
-    "dritte",
-    "dritten",
-    "dritter",
-    "drittes",
-    "du",
-    "durch",
-    "durchaus",
-    "durfen",
-    "dürfen",
-    "durft",
-    "dürft",
-    "durfte",
-    "durften",
-    "e",
-    "eben",
-    "ebenso",
-    "ehrlich",
-    "ei",
-    "eigen",
-    "eigene",
-    "eigenen",
-    "eigener",
-    "eigenes",
-    "ein",
-    "einander",
-    "eine",
-    "einem",
-    "einen",
-    "einer",
-    "eines",
-    "einige",
-    "einigen",
-    "einiger",
-    "einiges",
-    "einmal",
-    "eins",
-    "elf",
-    "en",
-    "ende",
-    "endlich",
-    "entweder",
-    "er",
-    "ernst",
-    "ernst",
-    "erst",
-    "erste",
-    "ersten",
-    "erster",
-    "erstes",
-    "es",
-    "etwa",
-    "etwas",
-    "euch",
-    "euer",
-    "eure",
-    "f",
-    "fruher",
-    "früher",
-    "funf",
-    "fünf",
-    "funfte",
-    "fünfte",
-    "funften",
-    "fünften",
-    "funfter",
-    "fünfter",
-    "funftes",
-    "fünftes",
-    "fur",
-    "für",
-    "g",
-    "gab",
-    "ganz",
-    "ganze",
-    "ganzen",
-    "ganzer",
-    "ganzes",
-    "gar",
-    "gedurft",
-    "gegen",
-    "gegenuber",
-    "gegenüber",
-    "gehabt",
-    "gehen",
-    "geht",
-    "gekannt",
-    "gekonnt",
-    "gemacht",
-    "gemocht",
-    "gemusst",
-    "genug",
-    "gerade",
-    "gern",
-    "gesagt",
-    "geschweige",
-    "gewesen",
-    "gewollt",
-    "geworden",
-    "gibt",
-    "ging",
-    "gleich",
-    "gott",
-    "gross",
-    "groß",
-    "grosse",
-    "große",
-    "grossen",
-    "großen",
-    "grosser",
-    "großer",
-    "grosses",
-    "großes",
-    "gut",
-    "gute",
-    "guter",
-    "gutes",
-    "h",
-    "habe",
-    "haben",
-    "habt",
-    "hast",
-    "hat",
-    "hatte",
-    "hätte",
-    "hatten",
-    "hätten",
-    "hattest",
-    "hattet",
-    "heisst",
-    "her",
-    "heute",
-    "hier",
-    "hin",
-    "hinter",
-    "hoch",
-    "i",
-    "ich",
-    "ihm",
-    "ihn",
-    "ihnen",
-    "ihr",
-    "ihre",
-    "ihrem",
-    "ihren",
-    "ihrer",
-    "ihres",
-    "im",
-    "immer",
-    "in",
-    "indem",
-    "infolgedessen",
-    "ins",
-    "irgend",
-    "ist",
-    "j",
-    "ja",
-    "jahr",
-    "jahre",
-    "jahren",
-    "je",
-    "jede",
-    "jedem",
-    "jeden",
-    "jeder",
-    "jedermann",
-    "jedermanns",
-    "jedes",
-    "jedoch",
-    "jemand",
-    "jemandem",
-    "jemanden",
-    "jene",
-    "jenem",
-    "jenen",
-    "jener",
-    "jenes",
-    "jetzt",
-    "k",
-    "kam",
-    "kann",
-    "kannst",
-    "kaum",
-    "kein",
-    "keine",
-    "keinem",
-    "keinen",
-    "keiner",
-    "kleine",
-    "kleinen",
-    "kleiner",
-    "kleines",
-    "kommen",
-    "kommt",
-    "können",
-    "könnt",
-    "konnte",
-    "könnte",
-    "konnten",
-    "kurz",
-    "l",
-    "lang",
-    "lange",
-    "leicht",
-    "leide",
-    "lieber",
-    "los",
-    "m",
-    "machen",
-    "macht",
-    "machte",
-    "mag",
-    "magst",
-    "mahn",
-    "man",
-    "manche",
-    "manchem",
-    "manchen",
-    "mancher",
-    "manches",
-    "mann",
-    "mehr",
-    "mein",
-    "meine",
-    "meinem",
-    "meinen",
-    "meiner",
-    "meines",
-    "mensch",
-    "menschen",
-    "mich",
-    "mir",
-    "mit",
-    "mittel",
-    "mochte",
-    "möchte",
-    "mochten",
-    "mögen",
-    "möglich",
-    "mögt",
-    "morgen",
-    "muss",
-    "muß",
-    "mussen",
-    "müssen",
-    "musst",
-    "mußt",
-    "müsst",
-    "müßt",
-    "musste",
-    "mussten",
-    "n",
-    "na",
-    "nach",
-    "nachdem",
-    "nahm",
-    "naturlich",
-    "natürlich",
-    "neben",
-    "nein",
-    "neue",
-    "neuen",
-    "neun",
-    "neunte",
-    "neunten",
-    "neunter",
-    "neuntes",
-    "nicht",
-    "nichts",
-    "nie",
-    "niemand",
-    "niemandem",
-    "niemanden",
-    "noch",
-    "nun",
-    "nur",
-    "o",
-    "ob",
-    "oben",
-    "oder",
-    "offen",
-    "oft",
-    "ohne",
-    "ordnung",
-    "ordnung",
-    "p",
-    "q",
-    "r",
-    "recht",
-    "rechte",
-    "rechten",
-    "rechter",
-    "rechtes",
-    "richtig",
-    "rund",
-    "s",
-    "sa",
-    "sache",
-    "sagt",
-    "sagte",
-    "sah",
-    "satt",
-    "schlecht",
-    "schluss",
-    "schluss",
-    "schon",
-    "sechs",
-    "sechste",
-    "sechsten",
-    "sechster",
-    "sechstes",
-    "sehr",
-    "sei",
-    "seid",
-    "seien",
-    "sein",
-    "seine",
-    "seinem",
-    "seinen",
-    "seiner",
-    "seines",
-    "seit",
-    "seitdem",
-    "selbst",
-    "sich",
-    "sie",
-    "sieben",
-    "siebente",
-    "siebenten",
-    "siebenter",
-    "siebentes",
-    "sind",
-    "so",
-    "solang",
-    "solche",
-    "solchem",
-    "solchen",
-    "solcher",
-    "solches",
-    "soll",
-    "sollen",
-    "sollst",
-    "sollt",
-    "sollte",
-    "sollten",
-    "sondern",
-    "sonst",
-    "soweit",
-    "sowie",
-    "später",
-    "statt",
-    "t",
-    "tag",
-    "tage",
-    "tagen",
-    "tat",
-    "teil",
-    "tel",
-    "tritt",
-    "trotzdem",
-    "tun",
-    "u",
-    "uber",
-    "über",
-    "uberhaupt",
-    "überhaupt",
-    "ubrigens",
-    "übrigens",
-    "uhr",
-    "um",
-    "und?",
-    "und",
-    "uns",
-    "unser",
-    "unsere",
-    "unserer",
-    "unter",
-    "v",
-    "vergangenen",
-    "viel",
-    "viele",
-    "vielem",
-    "vielen",
-    "vielleicht",
-    "vier",
-    "vierte",
-    "vierten",
-    "vierter",
-    "viertes",
-    "vom",
-    "von",
-    "vor",
-    "w",
-    "wahr?",
-    "wahr",
-    "während",
-    "währenddem",
-    "währenddessen",
-    "wann",
-    "war",
-    "wäre",
-    "waren",
-    "wart",
-    "warum",
-    "was",
-    "wegen",
-    "weil",
-    "weit",
-    "weiter",
-    "weitere",
-    "weiteren",
-    "weiteres",
-    "welche",
-    "welchem",
-    "welchen",
-    "welcher",
-    "welches",
-    "wem",
-    "wen",
-    "wenig",
-    "wenige",
-    "weniger",
-    "weniges",
-    "wenigstens",
-    "wenn",
-    "wer",
-    "werde",
-    "werden",
-    "werdet",
-    "weshalb",
-    "wessen",
-    "wie",
-    "wieder",
-    "wieso",
-    "will",
-    "willst",
-    "wir",
-    "wird",
-    "wirklich",
-    "wirst",
-    "wo",
-    "woher",
-    "wohin",
-    "wohl",
-    "wollen",
-    "wollt",
-    "wollte",
-    "wollten",
-    "worden",
-    "wurde",
-    "würde",
-    "wurden",
-    "würden",
-    "x",
-    "y",
-    "z.b",
-    "z",
-    "zb",
-    "zehn",
-    "zehnte",
-    "zehnten",
-    "zehnter",
-    "zehntes",
-    "zeit",
-    "zu",
-    "zuerst",
-    "zugleich",
-    "zum",
-    "zunächst",
-    "zur",
-    "zuruck",
-    "zurück",
-    "zusammen",
-    "zwanzig",
-    "zwar",
-    "zwei",
-    "zweite",
-    "zweiten",
-    "zweiter",
-    "zweites",
-    "zwischen",
-    "zwölf",
-]
-
-ITALIAN_STOPWORDS = [
-    "a",
-    "a¨",
-    "ã¨",
-    "abbastanza",
-    "accidenti",
-    "ad",
-    "adesso",
-    "affinche",
-    "agli",
-    "ahima¨",
-    "ahimã¨",
-    "ahime",
-    "ai",
-    "al",
-    "alcuna",
-    "alcuni",
-    "alcuno",
-    "all",
-    "alla",
-    "alle",
-    "allo",
-    "allora",
-    "altre",
-    "altri",
-    "altrimenti",
-    "altro",
-    "altrui",
-    "anche",
-    "ancora",
-    "anni",
-    "anno",
-    "ansa",
-    "assai",
-    "attesa",
-    "avanti",
-    "avendo",
-    "avente",
-    "aver",
-    "avere",
-    "avete",
-    "aveva",
-    "avevano",
-    "avuta",
-    "avute",
-    "avuti",
-    "avuto",
-    "basta",
-    "ben",
-    "bene",
-    "benissimo",
-    "berlusconi",
-    "brava",
-    "bravo",
-    "buono",
-    "c",
-    "casa",
-    "caso",
-    "cento",
-    "certa",
-    "certe",
-    "certi",
-    "certo",
-    "che",
-    "chi",
-    "chicchessia",
-    "chiunque",
-    "ci",
-    "cia²",
-    "ciã²",
-    "ciascuna",
-    "ciascuno",
-    "cima",
-    "cinque",
-    "cio",
-    "cioa¨",
-    "cioã¨",
-    "cioe",
-    "circa",
-    "citta ",
-    "cittã ",
-    "citta",
-    "codesta",
-    "codesti",
-    "codesto",
-    "cogli",
-    "coi",
-    "col",
-    "colei",
-    "coll",
-    "coloro",
-    "colui",
-    "come",
-    "comprare",
-    "con",
-    "concernente",
-    "consecutivi",
-    "consecutivo",
-    "consiglio",
-    "contro",
-    "cortesia",
-    "cos",
-    "cosa",
-    "cosa¬",
-    "cosã¬",
-    "cosi",
-    "cui",
-    "d",
-    "da",
-    "dagli",
-    "dai",
-    "dal",
-    "dall",
-    "dalla",
-    "dalle",
-    "dallo",
-    "davanti",
-    "degli",
-    "dei",
-    "del",
-    "dell",
-    "della",
-    "delle",
-    "dello",
-    "dentro",
-    "detto",
-    "deve",
-    "devo",
-    "di",
-    "dice",
-    "dietro",
-    "dire",
-    "dirimpetto",
-    "dopo",
-    "doppio",
-    "dove",
-    "dovra ",
-    "dovrã ",
-    "dovra",
-    "due",
-    "dunque",
-    "durante",
-    "e",
-    "ecco",
-    "ed",
-    "egli",
-    "ella",
-    "eppure",
-    "era",
-    "erano",
-    "esse",
-    "essendo",
-    "esser",
-    "essere",
-    "essi",
-    "ex",
-    "fa",
-    "fare",
-    "fatto",
-    "favore",
-    "fin",
-    "finalmente",
-    "finche",
-    "fine",
-    "fino",
-    "forse",
-    "fra",
-    "fuori",
-    "gente",
-    "gia ",
-    "giã ",
-    "gia",
-    "giacche",
-    "giorni",
-    "giorno",
-    "giu",
-    "gli",
-    "gliela",
-    "gliele",
-    "glieli",
-    "glielo",
-    "gliene",
-    "governo",
-    "grande",
-    "grazie",
-    "gruppo",
-    "ha",
-    "hai",
-    "hanno",
-    "ho",
-    "i",
-    "ieri",
-    "il",
-    "improvviso",
-    "in",
-    "indietro",
-    "infatti",
-    "insieme",
-    "intanto",
-    "intorno",
-    "invece",
-    "io",
-    "l",
-    "la",
-    "lavoro",
-    "le",
-    "lei",
-    "li",
-    "lo",
-    "lontano",
-    "loro",
-    "lui",
-    "lungo",
-    "ma",
-    "macche",
-    "magari",
-    "mai",
-    "male",
-    "malgrado",
-    "malissimo",
-    "me",
-    "medesimo",
-    "mediante",
-    "meglio",
-    "meno",
-    "mentre",
-    "mesi",
-    "mezzo",
-    "mi",
-    "mia",
-    "mie",
-    "miei",
-    "mila",
-    "miliardi",
-    "milioni",
-    "ministro",
-    "mio",
-    "molta",
-    "molti",
-    "moltissimo",
-    "molto",
-    "mondo",
-    "nazionale",
-    "ne",
-    "negli",
-    "nei",
-    "nel",
-    "nell",
-    "nella",
-    "nelle",
-    "nello",
-    "nemmeno",
-    "neppure",
-    "nessuna",
-    "nessuno",
-    "niente",
-    "no",
-    "noi",
-    "nome",
-    "non",
-    "nondimeno",
-    "nostra",
-    "nostre",
-    "nostri",
-    "nostro",
-    "nove",
-    "nulla",
-    "nuovi",
-    "nuovo",
-    "o",
-    "od",
-    "oggi",
-    "ogni",
-    "ognuna",
-    "ognuno",
-    "oltre",
-    "oppure",
-    "ora",
-    "ore",
-    "osi",
-    "ossia",
-    "otto",
-    "paese",
-    "parecchi",
-    "parecchie",
-    "parecchio",
-    "parte",
-    "partendo",
-    "peccato",
-    "peggio",
-    "per",
-    "pera²",
-    "perã²",
-    "percha¨",
-    "perchã¨",
-    "perche",
-    "percia²",
-    "perciã²",
-    "percio",
-    "perfino",
-    "pero",
-    "persone",
-    "piedi",
-    "pieno",
-    "piglia",
-    "piu",
-    "po",
-    "pochissimo",
-    "poco",
-    "poi",
-    "poiche",
-    "press",
-    "prima",
-    "primo",
-    "promesso",
-    "proprio",
-    "puo",
-    "pure",
-    "purtroppo",
-    "qua",
-    "qualche",
-    "qualcuna",
-    "qualcuno",
-    "quale",
-    "quali",
-    "qualunque",
-    "quando",
-    "quanta",
-    "quante",
-    "quanti",
-    "quanto",
-    "quantunque",
-    "quarto",
-    "quasi",
-    "quattro",
-    "quel",
-    "quella",
-    "quelli",
-    "quello",
-    "quest",
-    "questa",
-    "queste",
-    "questi",
-    "questo",
-    "qui",
-    "quindi",
-    "quinto",
-    "riecco",
-    "rispetto",
-    "salvo",
-    "sara ",
-    "sarã ",
-    "sara",
-    "sarebbe",
-    "scopo",
-    "scorso",
-    "se",
-    "secondo",
-    "seguente",
-    "sei",
-    "sembra",
-    "sembrava",
-    "sempre",
-    "senza",
-    "sette",
-    "si",
-    "sia",
-    "siamo",
-    "siete",
-    "solito",
-    "solo",
-    "sono",
-    "sopra",
-    "soprattutto",
-    "sotto",
-    "sta",
-    "staranno",
-    "stata",
-    "state",
-    "stati",
-    "stato",
-    "stesso",
-    "su",
-    "sua",
-    "subito",
-    "successivo",
-    "sue",
-    "sugli",
-    "sui",
-    "sul",
-    "sull",
-    "sulla",
-    "sulle",
-    "sullo",
-    "suo",
-    "suoi",
-    "tale",
-    "talvolta",
-    "tanto",
-    "te",
-    "tempo",
-    "terzo",
-    "ti",
-    "torino",
-    "tra",
-    "tranne",
-    "tre",
-    "triplo",
-    "troppo",
-    "tu",
-    "tua",
-    "tue",
-    "tuo",
-    "tuoi",
-    "tutta",
-    "tuttavia",
-    "tutte",
-    "tutti",
-    "tutto",
-    "uguali",
-    "ultimo",
-    "un",
-    "una",
-    "uno",
-    "uomo",
-    "va",
-    "vai",
-    "vale",
-    "varia",
-    "varie",
-    "vario",
-    "verso",
-    "vi",
-    "via",
-    "vicino",
-    "visto",
-    "vita",
-    "voi",
-    "volta",
-    "volte",
-    "vostra",
-    "vostre",
-    "vostri",
-    "vostro",
-]
-
-JAPANESE_STOPWORDS = [
-     "それ",
-    "あそこ",
-    "あの",
-    "あのかた",
-    "あの人",
-    "あります",
-    "あれ",
-    "います",
-    "え",
-    "おります",
-    "が",
-    "から",
-    "ここ",
-    "こちら",
-    "この",
-    "これ",
-    "し",
-    "しかし",
-    "そこ",
-    "その",
-    "それで",
-    "だれ",
-    "で","を",
-    "です",
-    "と",
-    "どこ",
-    "どの",
-    "なに",
-    "なん",
-    "に",
-    "の",
-    "は",
-    "まで",
-    "も",
-    "より",
-    "何",
-    "彼",
-    "彼女",
-    "我々",
-    "私",
-    "私達",
-    "貴方",
-    "貴方方",
-]
-
-PORTUGUESE_STOPWORDS = [
-    "a",
-    "á",
-    "à",
-    "acaso",
-    "acerca",
-    "acha",
-    "acho",
-    "acola",
-    "acolá",
-    "adeus",
-    "ae",
-    "aé",
-    "aè",
-    "aê",
-    "aeh",
-    "agora",
-    "ah",
-    "ai",
-    "aí",
-    "aih",
-    "ainda",
-    "alem",
-    "além",
-    "algmas",
-    "algo",
-    "alguem",
-    "alguém",
-    "algum",
-    "alguma",
-    "algumas",
-    "alguns",
-    "ali",
-    "alo",
-    "alô",
-    "amanha",
-    "amanhã",
-    "ambos",
-    "ano",
-    "anos",
-    "ante",
-    "antemao",
-    "antemão",
-    "anteontem",
-    "antes",
-    "ao",
-    "aonde",
-    "aos",
-    "apenas",
-    "apoio",
-    "apontar",
-    "apos",
-    "após",
-    "aquela",
-    "àquela",
-    "aquelas",
-    "àquelas",
-    "aquele",
-    "àquele",
-    "aqueles",
-    "àqueles",
-    "aqui",
-    "aquilo",
-    "àquilo",
-    "area",
-    "área",
-    "as",
-    "ás",
-    "às",
-    "assaz",
-    "assim",
-    "ate",
-    "até",
-    "ateh",
-    "atras",
-    "atrás",
-    "atraves",
-    "através",
-    "aug",
-    "avante",
-    "axovc",
-    "baixo",
-    "basta",
-    "bastante",
-    "bem",
-    "bis",
-    "boa",
-    "boas",
-    "bom",
-    "bons",
-    "breve",
-    "ca",
-    "cá",
-    "cada",
-    "cade",
-    "cadê",
-    "caminho",
-    "catorze",
-    "ce",
-    "cê",
-    "cedo",
-    "cento",
-    "certa",
-    "certamente",
-    "certas",
-    "certeza",
-    "certo",
-    "certos",
-    "chi",
-    "cima",
-    "cinco",
-    "coisa",
-    "com",
-    "comigo",
-    "como",
-    "comprido",
-    "conforme",
-    "conhecido",
-    "conosco",
-    "conseguinte",
-    "conselho",
-    "consigo",
-    "contigo",
-    "contra",
-    "contudo",
-    "convosco",
-    "corrente",
-    "cuja",
-    "cujas",
-    "cujo",
-    "cujos",
-    "custa",
-    "da",
-    "dá",
-    "dah",
-    "daki",
-    "dao",
-    "dão",
-    "daqi",
-    "daquela",
-    "daquelas",
-    "daquele",
-    "daqueles",
-    "daqui",
-    "daquilo",
-    "dar",
-    "das",
-    "de",
-    "debaixo",
-    "debalde",
-    "dela",
-    "delas",
-    "dele",
-    "delepara",
-    "deles",
-    "demais",
-    "dentro",
-    "depois",
-    "desde",
-    "desligado",
-    "dessa",
-    "dessas",
-    "desse",
-    "desses",
-    "desta",
-    "destas",
-    "deste",
-    "destes",
-    "deve",
-    "devem",
-    "devemos",
-    "devera",
-    "deverá",
-    "deveras",
-    "deverás",
-    "dez",
-    "dezanove",
-    "dezasseis",
-    "dezassete",
-    "dezoito",
-    "dia",
-    "diante",
-    "disso",
-    "disto",
-    "diz",
-    "dizem",
-    "dizer",
-    "do",
-    "dois",
-    "dos",
-    "doze",
-    "duas",
-    "dum",
-    "duma",
-    "dumas",
-    "duns",
-    "durante",
-    "duvida",
-    "dúvida",
-    "e",
-    "é",
-    "eh",
-    "ei",
-    "eia",
-    "ela",
-    "elas",
-    "elaslhe",
-    "ele",
-    "eles",
-    "em",
-    "embora",
-    "enfim",
-    "enquanto",
-    "entanto",
-    "entao",
-    "então",
-    "entaum",
-    "entaun",
-    "entre",
-    "entretanto",
-    "era",
-    "eram",
-    "eramos",
-    "éramos",
-    "eras",
-    "ereis",
-    "éreis",
-    "es",
-    "és",
-    "essa",
-    "essas",
-    "esse",
-    "esses",
-    "esta",
-    "está",
-    "estado",
-    "estah",
-    "estai",
-    "estais",
-    "estáis",
-    "estamos",
-    "estando",
-    "estao",
-    "estão",
-    "estar",
-    "estara",
-    "estará",
-    "estarao",
-    "estarão",
-    "estaras",
-    "estarás",
-    "estardes",
-    "estarei",
-    "estareis",
-    "estaremos",
-    "estares",
-    "estaria",
-    "estariam",
-    "estariamos",
-    "estaríamos",
-    "estarias",
-    "estarieis",
-    "estaríeis",
-    "estarmos",
-    "estas",
-    "estás",
-    "estava",
-    "estavam",
-    "estavamos",
-    "estávamos",
-    "estavas",
-    "este",
-    "esteja",
-    "estejais",
-    "estejam",
-    "estejamos",
-    "estejas",
-    "estes",
-    "esteve",
-    "estive",
-    "estivemos",
-    "estiver",
-    "estivera",
-    "estiveram",
-    "estiveramos",
-    "estivéramos",
-    "estiveras",
-    "estiverdes",
-    "estivereis",
-    "estivéreis",
-    "estiverem",
-    "estiveres",
-    "estivermos",
-    "estivesse",
-    "estivesseis",
-    "estivésseis",
-    "estivessem",
-    "estivessemos",
-    "estivéssemos",
-    "estivesses",
-    "estiveste",
-    "estivestes",
-    "estou",
-    "eu",
-    "exceto",
-    "exemplo",
-    "faco",
-    "faço",
-    "fala",
-    "falta",
-    "fara",
-    "fará",
-    "favor",
-    "faz",
-    "fazeis",
-    "fazem",
-    "fazemos",
-    "fazer",
-    "fazes",
-    "fazia",
-    "fez",
-    "fim",
-    "final",
-    "foi",
-    "fomos",
-    "for",
-    "fora",
-    "foram",
-    "foramos",
-    "fôramos",
-    "foras",
-    "fordes",
-    "foreis",
-    "fôreis",
-    "forem",
-    "fores",
-    "forma",
-    "formos",
-    "fosse",
-    "fosseis",
-    "fôsseis",
-    "fossem",
-    "fossemos",
-    "fôssemos",
-    "fosses",
-    "foste",
-    "fostes",
-    "fui",
-    "geral",
-    "grande",
-    "grandes",
-    "grupo",
-    "ha",
-    "há",
-    "haha",
-    "hahah",
-    "hahaha",
-    "hahahah",
-    "hahahaha",
-    "hehe",
-    "heheh",
-    "hehehe",
-    "hein",
-    "hem",
-    "hihi",
-    "hihihi",
-    "hohohohoho",
-    "hoje",
-    "hora",
-    "horas",
-    "hum",
-    "ia",
-    "iá",
-    "ih",
-    "iniciar",
-    "inicio",
-    "ir",
-    "ira",
-    "irá",
-    "iria",
-    "isso",
-    "ista",
-    "iste",
-    "isto",
-    "ja",
-    "já",
-    "jah",
-    "jamais",
-    "la",
-    "lá",
-    "lado",
-    "lah",
-    "lhe",
-    "lhes",
-    "ligado",
-    "local",
-    "logo",
-    "longe",
-    "lugar",
-    "maior",
-    "maioria",
-    "maiorias",
-    "mais",
-    "mal",
-    "manda",
-    "mas",
-    "maximo",
-    "máximo",
-    "me",
-    "meio",
-    "menor",
-    "menos",
-    "mes",
-    "mês",
-    "meses",
-    "mesma",
-    "mesmas",
-    "mesmo",
-    "mesmos",
-    "meu",
-    "meus",
-    "mil",
-    "mim",
-    "minha",
-    "minhas",
-    "momento",
-    "mt",
-    "mto",
-    "mtu",
-    "muita",
-    "muitas",
-    "muito",
-    "muitos",
-    "na",
-    "nada",
-    "nao",
-    "não",
-    "naquela",
-    "naquelas",
-    "naquele",
-    "naqueles",
-    "naquilo",
-    "nas",
-    "naum",
-    "ne",
-    "né",
-    "neh",
-    "nem",
-    "nenhum",
-    "nenhuma",
-    "nessa",
-    "nessas",
-    "nesse",
-    "nesses",
-    "nesta",
-    "nestas",
-    "neste",
-    "nestes",
-    "ninguem",
-    "ninguém",
-    "nisso",
-    "nisto",
-    "nivel",
-    "nível",
-    "no",
-    "nois",
-    "nóis",
-    "noite",
-    "noix",
-    "nome",
-    "nos",
-    "nós",
-    "nossa",
-    "nossas",
-    "nosso",
-    "nossos",
-    "nova",
-    "novas",
-    "nove",
-    "novo",
-    "novos",
-    "num",
-    "numa",
-    "numas",
-    "numero",
-    "número",
-    "nunca",
-    "nuns",
-    "o",
-    "oba",
-    "obra",
-    "obrigada",
-    "obrigado",
-    "oh",
-    "oi",
-    "oitava",
-    "oitavo",
-    "oito",
-    "ola",
-    "olá",
-    "onde",
-    "ontem",
-    "onze",
-    "opa",
-    "ora",
-    "oras",
-    "os",
-    "ou",
-    "outra",
-    "outras",
-    "outrem",
-    "outro",
-    "outrora",
-    "outros",
-    "para",
-    "parece",
-    "parte",
-    "partir",
-    "paucas",
-    "pegar",
-    "pela",
-    "pelas",
-    "pelo",
-    "pelos",
-    "perto",
-    "pessoas",
-    "pode",
-    "pôde",
-    "podem",
-    "poder",
-    "podera",
-    "poderá",
-    "podia",
-    "poe",
-    "põe",
-    "poem",
-    "põem",
-    "pois",
-    "ponto",
-    "pontos",
-    "por",
-    "pôr",
-    "porem",
-    "porém",
-    "porque",
-    "porquê",
-    "portanto",
-    "porventura",
-    "posicao",
-    "posição",
-    "possivel",
-    "possível",
-    "possivelmente",
-    "posso",
-    "pouca",
-    "poucas",
-    "pouco",
-    "poucos",
-    "povo",
-    "pq",
-    "pra",
-    "primeira",
-    "primeiras",
-    "primeiro",
-    "primeiros",
-    "pro",
-    "promeiro",
-    "propria",
-    "própria",
-    "proprias",
-    "próprias",
-    "proprio",
-    "próprio",
-    "proprios",
-    "próprios",
-    "proxima",
-    "próxima",
-    "proximas",
-    "próximas",
-    "proximo",
-    "próximo",
-    "proximos",
-    "próximos",
-    "psit",
-    "psiu",
-    "puderam",
-    "qt",
-    "quais",
-    "quáis",
-    "quaisquer",
-    "qual",
-    "qualquer",
-    "quando",
-    "quanta",
-    "quantas",
-    "quanto",
-    "quantos",
-    "quarta",
-    "quarto",
-    "quase",
-    "quatro",
-    "que",
-    "quê",
-    "quem",
-    "quer",
-    "quereis",
-    "querem",
-    "queremas",
-    "queres",
-    "quero",
-    "questao",
-    "questão",
-    "quica",
-    "quieto",
-    "quinta",
-    "quinto",
-    "quinze",
-    "raro",
-    "relacao",
-    "relação",
-    "relnofollowfacebooka",
-    "relnofollowtwitter",
-    "rt",
-    "sabe",
-    "sabem",
-    "saber",
-    "sao",
-    "são",
-    "se",
-    "sê",
-    "segunda",
-    "segundo",
-    "sei",
-    "seis",
-    "seja",
-    "sejais",
-    "sejam",
-    "sejamos",
-    "sejas",
-    "sem",
-    "sempre",
-    "sendo",
-    "ser",
-    "sera",
-    "será",
-    "serao",
-    "serão",
-    "seras",
-    "serás",
-    "serdes",
-    "serei",
-    "sereis",
-    "serem",
-    "seremos",
-    "seres",
-    "seria",
-    "seriam",
-    "seriamos",
-    "seríamos",
-    "serias",
-    "serieis",
-    "seríeis",
-    "sermos",
-    "sete",
-    "setima",
-    "sétima",
-    "setimo",
-    "sétimo",
-    "seu",
-    "seus",
-    "sexta",
-    "sexto",
-    "sido",
-    "sim",
-    "sistema",
-    "so",
-    "só",
-    "sob",
-    "sobre",
-    "sobreser",
-    "soh",
-    "sois",
-    "somente",
-    "somos",
-    "sou",
-    "sua",
-    "suas",
-    "ta",
-    "tá",
-    "tabem",
-    "taben",
-    "tah",
-    "tais",
-    "tal",
-    "talvez",
-    "tambem",
-    "também",
-    "tamem",
-    "tamen",
-    "tanta",
-    "tantas",
-    "tanto",
-    "tantos",
-    "tao",
-    "tão",
-    "tarde",
-    "tava",
-    "tb",
-    "tbm",
-    "tchau",
-    "te",
-    "tem",
-    "têm",
-    "temos",
-    "tempo",
-    "tendes",
-    "tenho",
-    "tens",
-    "tentar",
-    "tentaram",
-    "tente",
-    "tentei",
-    "ter",
-    "terceira",
-    "terceiro",
-    "terde",
-    "teu",
-    "teus",
-    "teve",
-    "tipo",
-    "tive",
-    "tivemos",
-    "tiveram",
-    "tiveste",
-    "tivestes",
-    "to",
-    "tô",
-    "toda",
-    "todas",
-    "todavia",
-    "todo",
-    "todos",
-    "tomem",
-    "tres",
-    "três",
-    "treze",
-    "tu",
-    "tua",
-    "tuas",
-    "tudo",
-    "ue",
-    "ué",
-    "uh",
-    "ui",
-    "ultimo",
-    "último",
-    "um",
-    "uma",
-    "umas",
-    "uns",
-    "usa",
-    "usar",
-    "vai",
-    "vais",
-    "valor",
-    "vamo",
-    "vamos",
-    "vao",
-    "vão",
-    "varia",
-    "varias",
-    "várias",
-    "varios",
-    "vários",
-    "vc",
-    "vcs",
-    "veio",
-    "veja",
-    "vem",
-    "vêm",
-    "vens",
-    "ver",
-    "verdade",
-    "verdadeiro",
-    "vez",
-    "vezes",
-    "via",
-    "viagem",
-    "vier",
-    "vim",
-    "vin",
-    "vindo",
-    "vinte",
-    "vir",
-    "voce",
-    "você",
-    "voces",
-    "vocês",
-    "vos",
-    "vós",
-    "vossa",
-    "vossas",
-    "vosso",
-    "vossos",
-    "vou",
-    "xi",
-    "zero",
-]
-
-RUSSIAN_STOPWORDS = [
-    "а",
-    "алло",
-    "без",
-    "близко",
-    "более",
-    "больше",
-    "будем",
-    "будет",
-    "будете",
-    "будешь",
-    "будто",
-    "буду",
-    "будут",
-    "будь",
-    "бы","бывает",
-    "бывь",
-    "был",
-    "была",
-    "были",
-    "было",
-    "быть",
-    "в",
-    "важная",
-    "важное",
-    "важные",
-    "важный",
-    "вам",
-    "вами",
-    "вас",
-    "ваш",
-    "ваша",
-    "ваше",
-    "ваши",
-    "вверх",
-    "вдали",
-    "вдруг",
-    "ведь",
-    "везде",
-    "весь",
-    "вниз",
-    "внизу",
-    "во",
-    "вокруг",
-    "вон",
-    "восемнадцатый",
-    "восемнадцать",
-    "восемь",
-    "восьмой",
-    "вот",
-    "впрочем",
-    "времени",
-    "время",
-    "все",
-    "всё",
-    "всегда",
-    "всего",
-    "всем",
-    "всеми",
-    "всему",
-    "всех",
-    "всею",
-    "всю",
-    "всюду",
-    "вся",
-    "второй",
-    "вы",
-    "г",
-    "где",
-    "говорил",
-    "говорит",
-    "год",
-    "года",
-    "году",
-    "да",
-    "давно",
-    "даже",
-    "далеко",
-    "дальше",
-    "даром",
-    "два",
-    "двадцатый",
-    "двадцать",
-    "две",
-    "двенадцатый",
-    "двенадцать",
-    "двух",
-    "девятнадцатый",
-    "девятнадцать",
-    "девятый",
-    "девять",
-    "действительно",
-    "дел",
-    "день",
-    "десятый",
-    "десять",
-    "для",
-    "до",
-    "довольно",
-    "долго",
-    "должно",
-    "другая",
-    "другие",
-    "других",
-    "друго",
-    "другое",
-    "другой",
-    "е",
-    "его",
-    "ее",
-    "её",
-    "ей",
-    "ему",
-    "если",
-    "есть",
-    "еще",
-    "ещё",
-    "ею",
-    "ж",
-    "же",
-    "жизнь",
-    "за",
-    "занят",
-    "занята",
-    "занято",
-    "заняты",
-    "затем",
-    "зато",
-    "зачем",
-    "здесь",
-    "значит",
-    "и",
-    "из",
-    "или",
-    "им",
-    "именно",
-    "иметь",
-    "ими",
-    "имя",
-    "иногда",
-    "их",
-    "к",
-    "каждая",
-    "каждое",
-    "каждые",
-    "каждый",
-    "кажется",
-    "как",
-    "какая",
-    "какой",
-    "кем",
-    "когда",
-    "кого",
-    "ком",
-    "кому",
-    "конечно",
-    "которая",
-    "которого",
-    "которой",
-    "которые",
-    "который",
-    "которых",
-    "кроме",
-    "кругом",
-    "кто",
-    "куда",
-    "лет",
-    "ли",
-    "лишь",
-    "лучше",
-    "люди",
-    "м",
-    "мало",
-    "между",
-    "меля",
-    "менее",
-    "меньше",
-    "меня",
-    "миллионов",
-    "мимо",
-    "мира",
-    "мне",
-    "много",
-    "многочисленная",
-    "многочисленное",
-    "многочисленные",
-    "многочисленный",
-    "мной",
-    "мною",
-    "мог",
-    "могут",
-    "моё",
-    "мож",
-    "может",
-    "можно",
-    "можхо",
-    "мои",
-    "мой",
-    "мор",
-    "мочь",
-    "моя",
-    "мы",
-    "на",
-    "наверху",
-    "над",
-    "надо",
-    "назад",
-    "наиболее",
-    "наконец",
-    "нам",
-    "нами",
-    "нас",
-    "начала",
-    "наш",
-    "наша",
-    "наше",
-    "наши",
-    "не",
-    "него",
-    "недавно",
-    "недалеко",
-    "нее",
-    "неё",
-    "ней",
-    "нельзя",
-    "нем",
-    "немного",
-    "нему",
-    "непрерывно",
-    "нередко",
-    "несколько",
-    "нет",
-    "нею",
-    "ни",
-    "нибудь",
-    "ниже",
-    "низко",
-    "никогда",
-    "никуда",
-    "ними",
-    "них",
-    "ничего",
-    "но",
-    "ну",
-    "нужно",
-    "нх",
-    "о",
-    "об",
-    "оба",
-    "обычно",
-    "один",
-    "одиннадцатый",
-    "одиннадцать",
-    "однажды",
-    "однако",
-    "одного",
-    "одной",
-    "около",
-    "он",
-    "она",
-    "они",
-    "оно",
-    "опять",
-    "особенно",
-    "от",
-    "отовсюду",
-    "отсюда",
-    "очень",
-    "первый",
-    "перед",
-    "по",
-    "под",
-    "пожалуйста",
-    "позже",
-    "пока",
-    "пор",
-    "пора",
-    "после",
-    "посреди",
-    "потом",
-    "потому",
-    "почему",
-    "почти",
-    "прекрасно",
-    "при",
-    "про",
-    "просто",
-    "против",
-    "процентов",
-    "пятнадцатый",
-    "пятнадцать",
-    "пятый",
-    "пять",
-    "раз",
-    "разве",
-    "рано",
-    "раньше",
-    "рядом",
-    "с",
-    "сам",
-    "сама",
-    "сами",
-    "самим",
-    "самими",
-    "самих",
-    "само",
-    "самого",
-    "самой",
-    "самом",
-    "самому",
-    "саму",
-    "свое",
-    "своего",
-    "своей",
-    "свои",
-    "своих",
-    "свою",
-    "сеаой",
-    "себе",
-    "себя",
-    "сегодня",
-    "седьмой",
-    "сейчас",
-    "семнадцатый",
-    "семнадцать",
-    "семь",
-    "сих",
-    "сказал",
-    "сказала",
-    "сказать",
-    "сколько",
-    "слишком",
-    "сначала",
-    "снова",
-    "со",
-    "собой",
-    "собою",
-    "совсем",
-    "спасибо",
-    "стал",
-    "суть",
-    "т",
-    "та",
-    "так",
-    "такая",
-    "также",
-    "такие",
-    "такое",
-    "такой",
-    "там",
-    "твоё",
-    "твой",
-    "твоя",
-    "те",
-    "тебе",
-    "тебя",
-    "тем",
-    "теми",
-    "теперь",
-    "тех",
-    "то",
-    "тобой",
-    "тобою",
-    "тогда",
-    "того",
-    "тоже",
-    "только",
-    "том",
-    "тому",
-    "тот",
-    "тою",
-    "третий",
-    "три",
-    "тринадцатый",
-    "тринадцать",
-    "ту",
-    "туда",
-    "тут",
-    "ты",
-    "тысяч",
-    "у",
-    "уж",
-    "уже",
-    "уметь",
-    "хорошо",
-    "хотеть",
-    "хоть",
-    "хотя",
-    "хочешь",
-    "часто",
-    "чаще",
-    "чего",
-    "человек",
-    "чем",
-    "чему",
-    "через",
-    "четвертый",
-    "четыре",
-    "четырнадцатый",
-    "четырнадцать",
-    "что",
-    "чтоб",
-    "чтобы",
-    "чуть",
-    "шестнадцатый",
-    "шестнадцать",
-    "шестой",
-    "шесть",
-    "эта",
-    "эти",
-    "этим",
-    "этими",
-    "этих",
-    "это",
-    "этого",
-    "этой",
-    "этом",
-    "этому",
-    "этот",
-    "эту",
-    "я",
-]
-
-SPANISH_STOPWORDS = [
-    "a",
-    "actualmente",
-    "adelante",
-    "ademas",
-    "además",
-    "afirmo",
-    "afirmó",
-    "agrego",
-    "agregó",
-    "ahi",
-    "ahí",
-    "ahora",
-    "al",
-    "algo",
-    "algun",
-    "algún",
-    "alguna",
-    "algunas",
-    "alguno",
-    "algunos",
-    "alrededor",
-    "ambos",
-    "ampleamos",
-    "anadio",
-    "añadió",
-    "ante",
-    "anterior",
-    "antes",
-    "apenas",
-    "aproximadamente",
-    "aquel",
-    "aquellas",
-    "aquellos",
-    "aqui",
-    "aquí",
-    "arriba",
-    "aseguro",
-    "aseguró",
-    "asi",
-    "así",
-    "atras",
-    "aun",
-    "aún",
-    "aunque",
-    "ayer",
-    "bajo",
-    "bastante",
-    "bien",
-    "buen",
-    "buena",
-    "buenas",
-    "bueno",
-    "buenos",
-    "cada",
-    "casi",
-    "cerca",
-    "cierta",
-    "ciertas",
-    "cierto",
-    "ciertos",
-    "cinco",
-    "comento",
-    "comentó",
-    "como",
-    "cómo",
-    "con",
-    "conocer",
-    "conseguimos",
-    "conseguir",
-    "considera",
-    "considero",
-    "consideró",
-    "consigo",
-    "consigue",
-    "consiguen",
-    "consigues",
-    "contra",
-    "cosas",
-    "creo",
-    "cual",
-    "cuales",
-    "cualquier",
-    "cuando",
-    "cuanto",
-    "cuatro",
-    "cuenta",
-    "da",
-    "dado",
-    "dan",
-    "dar",
-    "de",
-    "debe",
-    "deben",
-    "debido",
-    "decir",
-    "dejo",
-    "dejó",
-    "del",
-    "demas",
-    "demás",
-    "dentro",
-    "desde",
-    "despues",
-    "después",
-    "dice",
-    "dicen",
-    "dicho",
-    "dieron",
-    "diferente",
-    "diferentes",
-    "dijeron",
-    "dijo",
-    "dio",
-    "donde",
-    "dos",
-    "durante",
-    "e",
-    "ejemplo",
-    "el",
-    "él",
-    "ella",
-    "ellas",
-    "ello",
-    "ellos",
-    "embargo",
-    "empleais",
-    "emplean",
-    "emplear",
-    "empleas",
-    "empleo",
-    "en",
-    "encima",
-    "encuentra",
-    "entonces",
-    "entre",
-    "era",
-    "eramos",
-    "eran",
-    "eras",
-    "eres",
-    "es",
-    "esa",
-    "esas",
-    "ese",
-    "eso",
-    "esos",
-    "esta",
-    "está",
-    "ésta",
-    "estaba",
-    "estaban",
-    "estado",
-    "estais",
-    "estamos",
-    "estan",
-    "están",
-    "estar",
-    "estara",
-    "estará",
-    "estas",
-    "éstas",
-    "este",
-    "éste",
-    "esto",
-    "estos",
-    "éstos",
-    "estoy",
-    "estuvo",
-    "ex",
-    "existe",
-    "existen",
-    "explico",
-    "explicó",
-    "expreso",
-    "expresó",
-    "fin",
-    "fue",
-    "fuera",
-    "fueron",
-    "fui",
-    "fuimos",
-    "gran",
-    "grandes",
-    "gueno",
-    "ha",
-    "haber",
-    "habia",
-    "había",
-    "habian",
-    "habían",
-    "habra",
-    "habrá",
-    "hace",
-    "haceis",
-    "hacemos",
-    "hacen",
-    "hacer",
-    "hacerlo",
-    "haces",
-    "hacia",
-    "haciendo",
-    "hago",
-    "han",
-    "hasta",
-    "hay",
-    "haya",
-    "he",
-    "hecho",
-    "hemos",
-    "hicieron",
-    "hizo",
-    "hoy",
-    "hubo",
-    "igual",
-    "incluso",
-    "indico",
-    "indicó",
-    "informo",
-    "informó",
-    "intenta",
-    "intentais",
-    "intentamos",
-    "intentan",
-    "intentar",
-    "intentas",
-    "intento",
-    "ir",
-    "junto",
-    "la",
-    "lado",
-    "largo",
-    "las",
-    "le",
-    "les",
-    "llego",
-    "llegó",
-    "lleva",
-    "llevar",
-    "lo",
-    "los",
-    "luego",
-    "lugar",
-    "manera",
-    "manifesto",
-    "manifestó",
-    "mas",
-    "más",
-    "mayor",
-    "me",
-    "mediante",
-    "mejor",
-    "menciono",
-    "mencionó",
-    "menos",
-    "mi",
-    "mientras",
-    "mio",
-    "misma",
-    "mismas",
-    "mismo",
-    "mismos",
-    "modo",
-    "momento",
-    "mucha",
-    "muchas",
-    "mucho",
-    "muchos",
-    "muy",
-    "nada",
-    "nadie",
-    "ni",
-    "ningun",
-    "ningún",
-    "ninguna",
-    "ningunas",
-    "ninguno",
-    "ningunos",
-    "no",
-    "nos",
-    "nosotras",
-    "nosotros",
-    "nuestra",
-    "nuestras",
-    "nuestro",
-    "nuestros",
-    "nueva",
-    "nuevas",
-    "nuevo",
-    "nuevos",
-    "nunca",
-    "o",
-    "ocho",
-    "otra",
-    "otras",
-    "otro",
-    "otros",
-    "para",
-    "parece",
-    "parte",
-    "partir",
-    "pasada",
-    "pasado",
-    "pero",
-    "pesar",
-    "poca",
-    "pocas",
-    "poco",
-    "pocos",
-    "podeis",
-    "podemos",
-    "poder",
-    "podra",
-    "podrá",
-    "podran",
-    "podrán",
-    "podria",
-    "podría",
-    "podriais",
-    "podriamos",
-    "podrian",
-    "podrían",
-    "podrias",
-    "poner",
-    "por que",
-    "por qué",
-    "por",
-    "porque",
-    "posible",
-    "primer",
-    "primera",
-    "primero",
-    "primeros",
-    "principalmente",
-    "propia",
-    "propias",
-    "propio",
-    "propios",
-    "proximo",
-    "próximo",
-    "proximos",
-    "próximos",
-    "pudo",
-    "pueda",
-    "puede",
-    "pueden",
-    "puedo",
-    "pues",
-    "que",
-    "qué",
-    "quedo",
-    "quedó",
-    "queremos",
-    "quien",
-    "quién",
-    "quienes",
-    "quiere",
-    "realizado",
-    "realizar",
-    "realizo",
-    "realizó",
-    "respecto",
-    "sabe",
-    "sabeis",
-    "sabemos",
-    "saben",
-    "saber",
-    "sabes",
-    "se",
-    "sea",
-    "sean",
-    "segun",
-    "según",
-    "segunda",
-    "segundo",
-    "seis",
-    "senalo",
-    "señaló",
-    "ser",
-    "sera",
-    "será",
-    "seran",
-    "serán",
-    "seria",
-    "sería",
-    "si",
-    "sí",
-    "sido",
-    "siempre",
-    "siendo",
-    "siete",
-    "sigue",
-    "siguiente",
-    "sin",
-    "sino",
-    "sobre",
-    "sois",
-    "sola",
-    "solamente",
-    "solas",
-    "solo",
-    "sólo",
-    "solos",
-    "somos",
-    "son",
-    "soy",
-    "su",
-    "sus",
-    "tal",
-    "tambien",
-    "también",
-    "tampoco",
-    "tan",
-    "tanto",
-    "tendra",
-    "tendrá",
-    "tendran",
-    "tendrán",
-    "teneis",
-    "tenemos",
-    "tener",
-    "tenga",
-    "tengo",
-    "tenia",
-    "tenía",
-    "tenido",
-    "tercera",
-    "tiempo",
-    "tiene",
-    "tienen",
-    "toda",
-    "todas",
-    "todavia",
-    "todavía",
-    "todo",
-    "todos",
-    "total",
-    "trabaja",
-    "trabajais",
-    "trabajamos",
-    "trabajan",
-    "trabajar",
-    "trabajas",
-    "trabajo",
-    "tras",
-    "trata",
-    "traves",
-    "través",
-    "tres",
-    "tuvo",
-    "tuyo",
-    "ultima",
-    "última",
-    "ultimas",
-    "últimas",
-    "ultimo",
-    "último",
-    "ultimos",
-    "últimos",
-    "un",
-    "una",
-    "unas",
-    "uno",
-    "unos",
-    "usa",
-    "usais",
-    "usamos",
-    "usan",
-    "usar",
-    "usas",
-    "uso",
-    "usted",
-    "va",
-    "vais",
-    "valor",
-    "vamos",
-    "van",
-    "varias",
-    "varios",
-    "vaya",
-    "veces",
-    "ver",
-    "verdad",
-    "verdadera",
-    "verdadero",
-    "vez",
-    "vosotras",
-    "vosotros",
-    "voy",
-    "y",
-    "ya",
-    "yo",
-]
-
-ALL_STOPWORDS = set(
-    CATALAN_STOPWORDS +
-    CHINESE_STOPWORDS +
-    COMMON_STOPWORDS +
-    ENGLISH_STOPWORDS +
-    FRENCH_STOPWORDS +
-    GERMAN_STOPWORDS +
-    ITALIAN_STOPWORDS +
-    JAPANESE_STOPWORDS +
-    PORTUGUESE_STOPWORDS +
-    RUSSIAN_STOPWORDS +
-    SPANISH_STOPWORDS
-)
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""
+Total stopword count: 4579 strings.
+
+    Catalan:    825
+    Chinese:    119
+    English:    777
+    French:     1317
+    German:     616
+    Italian:    443
+    Japanese:   44
+    Portuguese: 806
+    Russian:    421
+    Spanish:    491
+
+Stopwords are stored as one UTF-8 text file per language (one word per line)
+and only loaded on first use, e.g. `load("english")` or `ENGLISH_STOPWORDS`.
+Languages and user-supplied files are combined with `combine()`.
+"""
+
+from functools import lru_cache
+from os import listdir
+from os.path import abspath, dirname, isfile, realpath, splitext
+from typing import Union
+
+PATH = abspath(dirname(realpath(__file__)))
+
+LANGUAGES = sorted(splitext(f)[0] for f in listdir(PATH) if f.endswith(".txt"))
+
+
+def load(lang: str) -> frozenset:
+    """ Returns stopwords for a language, or for all languages if "all". """
+    return _load(lang.lower())
+
+
+@lru_cache(maxsize=None)
+def _load(lang: str) -> frozenset:
+    if lang == "all":
+        return frozenset(w for l in LANGUAGES for w in _read(l))
+
+    if lang not in LANGUAGES:
+        raise ValueError(f"Stopwords for '{lang}' not found (available: {LANGUAGES}).")
+
+    return frozenset(_read(lang))
+
+
+def combine(names: Union[str, list]) -> frozenset:
+    """
+    Returns a single set of stopwords from language names and/or paths to
+    user-supplied files (one word per line), e.g. "portuguese,english".
+    """
+    words = set()
+
+    for name in (names.split(",") if type(names) == str else names):
+        if isfile(name):
+            with open(name, "r", encoding="utf-8") as f:
+                words.update(w.strip().lower() for w in f if w.strip())
+        else:
+            words.update(load(name.strip()))
+
+    return frozenset(words)
+
+
+def _read(lang: str) -> list:
+    with open(f"{PATH}/{lang}.txt", "r", encoding="utf-8") as f:
+        return f.read().rstrip("\n").split("\n")
+
+
+def __getattr__(name):
+    if name.endswith("_STOPWORDS") and name.isupper():
+        try:
+            return load(name[:-len("_STOPWORDS")])
+        except ValueError:
+            pass
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
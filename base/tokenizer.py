@@ -1,15 +1,29 @@
 import re
 import string
+import unicodedata
+from collections import Counter
+
+import numpy as np
+import pandas as pd
 
 from .base import Transformer
 
-ACCENT_REPLACEMENTS = {
-    ord("á"): "a", ord("ã"): "a", ord("â"): "a",
-    ord("à"): "a", ord("è"): "e", ord("ê"): "e",
-    ord("é"): "e", ord("í"): "i", ord("ì"): "i",
-    ord("ñ"): "n", ord("ò"): "o", ord("ó"): "o",
-    ord("ô"): "o", ord("õ"): "o", ord("ù"): "u",
-    ord("ú"): "u", ord("ü"): "u", ord("ç"): "c"}
+
+class AccentFolding(dict):
+    """
+    Translation table folding characters whose NFKD decomposition is made of
+    ASCII letters (plus combining marks) into those letters, e.g. "é" -> "e"
+    or "ｆ" -> "f". Other scripts are kept as they are, e.g. "й" or "が".
+    Each code point is decomposed once, on first lookup, and then cached.
+    """
+    def __missing__(self, key: int):
+        char = chr(key)
+        folded = "".join(c for c in unicodedata.normalize("NFKD", char) if not unicodedata.combining(c))
+        self[key] = folded.lower() if folded != char and folded.isascii() and folded.isalpha() else char
+        return self[key]
+
+
+ACCENT_REPLACEMENTS = AccentFolding()
 
 VALID_CHARACTERS = "@#"
 INVALID_CHARACTERS = "\\\"'’…|–—“”‘„•¿¡"
@@ -17,6 +31,42 @@ INVALID_CHARACTERS = "\\\"'’…|–—“”‘„•¿¡"
 CHARACTER_REPLACEMENTS = str.maketrans("", "", "".join(
     set(string.punctuation + INVALID_CHARACTERS) - set(VALID_CHARACTERS)))
 
+# Accent folding and character removal in a single table.
+REPLACEMENTS = AccentFolding(CHARACTER_REPLACEMENTS)
+
+EMOJI = (
+    "\u00A9\u00AE\u203C\u2049\u2122\u2139"  # legacy symbols (©, ®, ‼, ⁉, ™, ℹ)
+    "\u2194-\u2199\u21A9\u21AA\u2934\u2935\u2B05-\u2B07"  # arrows
+    "\u231A\u231B\u2328\u23CF\u23E9-\u23F3\u23F8-\u23FA"  # misc technical
+    "\u24C2\u25AA\u25AB\u25B6\u25C0\u25FB-\u25FE\u2B1B\u2B1C\u2B50\u2B55"  # geometric shapes
+    "\u2600-\u27BF"  # misc symbols & dingbats
+    "\u3030\u303D\u3297\u3299"  # CJK symbols (〰, 〽, ㊗, ㊙)
+    "\U0001F000-\U0001FAFF"  # tiles, cards, flags, pictographs, emoticons, transport...
+)
+EMOJI_COMPONENTS = (
+    "\u200B-\u200D"  # zero width (joiner)
+    "\u20E3"  # combining keycap
+    "\uFE0E\uFE0F"  # variation selectors
+    "\U000E0020-\U000E007F"  # tags (subdivision flags)
+)
+EMOJIS = re.compile(f"[{EMOJI}{EMOJI_COMPONENTS}]+")
+
+EMOJI_MODIFIERS = "\U0001F3FB-\U0001F3FF\u20E3\uFE0E\uFE0F\U000E0020-\U000E007F"
+
+STREAMS = {
+    "emojis": re.compile(
+        rf"[\U0001F1E6-\U0001F1FF]{{2}}|[{EMOJI}][{EMOJI_MODIFIERS}]*(?:\u200D[{EMOJI}][{EMOJI_MODIFIERS}]*)*"
+    ),
+    "hashtags": re.compile(r"(?<!\w)#\w+"),
+    "mentions": re.compile(r"(?<!\w)@\w+"),
+    "urls": re.compile(r"(?:https?://|www\.)[^\s<>\"']*[^\s<>\"'.,;:!?)\]]"),
+}
+
+# Same strings accepted by int() or float(), e.g. "1_000", "-.5e3", "nan".
+DIGITS = r"\d(?:_?\d)*"
+NUMBER = rf"[+-]?(?:(?:{DIGITS}(?:\.(?:{DIGITS})?)?|\.{DIGITS})(?:e[+-]?{DIGITS})?|inf(?:inity)?|nan)"
+NUMBERS = re.compile(NUMBER)
+
 class Tokenizer(Transformer):
 
     def __init__(
@@ -24,60 +74,135 @@ class Tokenizer(Transformer):
         ignore_startswith: list = [],
         min_word_len: int = 0,
         stop_words: list = [],
+        streams: list = [],
     ):
         self.ignore_startswith = ignore_startswith
         self.min_word_len = min_word_len
         self.stop_words = stop_words
+        self.streams = streams
+
+    def fit(self, X, y=None):
+        """ Resets counts of token streams. """
+        for stream in self.streams:
+            if stream not in STREAMS:
+                raise ValueError(f"Unknown token stream '{stream}' (available: {list(STREAMS)}).")
+        self.counts_ = {stream: Counter() for stream in self.streams}
+        return self
 
     def transform(self, X):
+        if self.streams:
+            self._count_streams(X)
+
+        pattern = self._token_pattern(self.min_word_len, self.ignore_startswith)
+        stop_words = self.stop_words if isinstance(self.stop_words, (set, frozenset)) else set(self.stop_words)
+
         return [
             "\n".join(
                 " ".join([
                     w
-                    .replace("](", " ")  # Markdown
-                    .translate(ACCENT_REPLACEMENTS)
-                    .translate(CHARACTER_REPLACEMENTS)
                     for w in
-                        self._clear_emojis(sent)
-                        .lower()
-                        .split()
+                        pattern.findall(sent)
                     if
-                        len(w) >= self.min_word_len
-                    and
-                        not self._is_number(w)
-                    and
-                        not any(w.startswith(_) for _ in self.ignore_startswith)
-                    and
-                        w.strip(VALID_CHARACTERS) not in self.stop_words
+                        w.strip(VALID_CHARACTERS) not in stop_words
                 ])
                 for sent in (
-                    x.split("\n")
+                    self._clear_emojis(x)
+                    .lower()
+                    .split("\n")
                 )
             )
+            .replace("](", " ")  # Markdown
+            .translate(REPLACEMENTS)
             for x in X
         ]
 
+    def _count_streams(self, X) -> None:
+        """
+        Counts emojis, hashtags, mentions and/or URLs from the same documents
+        into `counts_`, one frequency table per stream.
+        """
+        if not hasattr(self, "counts_"):
+            self.fit(X)
+
+        for stream in self.streams:
+            pattern, counter = STREAMS[stream], self.counts_[stream]
+            for x in X:
+                counter.update(pattern.findall(x if stream in ("emojis", "urls") else x.lower()))
+
     @staticmethod
     def _is_number(str_word):
-        try:
-            int(str_word)
-        except:
-            try:
-                float(str_word)
-            except:
-                return False
-        return True
+        return NUMBERS.fullmatch(str_word.lower()) is not None
 
     @staticmethod
     def _clear_emojis(str_text, replace_with=r' '):
-        return re\
-            .compile("["
-                u"\U0001F600-\U0001F64F"  # emoticons
-                u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-                u"\U0001F680-\U0001F6FF"  # transport & map symbols
-                u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
-                u"\U00002702-\U000027B0"  # extra (1)
-                u"\U000024C2-\U0001F251"  # extra (2)
-                u"\U0000200B-\U0000200D"  # zero width
-                "]+", flags=re.UNICODE)\
-            .sub(replace_with, str_text)
\ No newline at end of file
+        return EMOJIS.sub(replace_with, str_text)
+
+    @staticmethod
+    def _token_pattern(min_word_len: int = 0, ignore_startswith: list = []):
+        """
+        Returns a compiled regex matching whitespace-separated words with at
+        least `min_word_len` characters that are neither numbers nor start
+        with any of `ignore_startswith`.
+        """
+        return re.compile(
+            r"(?<!\S)"
+            rf"(?!{NUMBER}(?!\S))" +
+            (f"(?!{'|'.join(re.escape(_) for _ in ignore_startswith)})" if ignore_startswith else "") +
+            rf"\S{{{max(min_word_len, 1)},}}"
+        )
+
+
+class PandasTokenizer(Tokenizer):
+    """
+    Vectorized tokenizer with the same output as `Tokenizer`, normalizing
+    whole columns with pandas string methods instead of word by word.
+    """
+    def transform(self, X):
+        X = pd.Series(X, dtype=object)
+
+        if self.streams:
+            self._count_streams(X)
+
+        sents = X\
+            .reset_index(drop=True)\
+            .str.replace(EMOJIS, " ", regex=True)\
+            .str.lower()\
+            .str.split("\n")\
+            .explode()
+        docs = sents.index.values
+        sents = sents.reset_index(drop=True)
+
+        words = sents\
+            .str.findall(self._token_pattern(self.min_word_len, self.ignore_startswith))\
+            .explode()\
+            .dropna()
+        words = words[~words.str.strip(VALID_CHARACTERS).isin(self.stop_words)]
+
+        sents = pd.Series(
+            self._join(words.values, words.index.values, len(sents), " "),
+            dtype=object,
+        )\
+            .str.replace("](", " ", regex=False)\
+            .str.translate(REPLACEMENTS)
+
+        return self._join(sents.values, docs, len(X), "\n")
+
+    def _count_streams(self, X) -> None:
+        if not hasattr(self, "counts_"):
+            self.fit(X)
+
+        for stream in self.streams:
+            self.counts_[stream].update(
+                (X if stream in ("emojis", "urls") else X.str.lower())
+                .str.findall(STREAMS[stream])
+                .explode()
+                .dropna()
+                .value_counts()
+                .to_dict()
+            )
+
+    @staticmethod
+    def _join(values, groups, n: int, sep: str) -> list:
+        """ Joins sorted `values` by their group number, from 0 to `n`-1. """
+        bounds = np.searchsorted(groups, np.arange(n + 1))
+        return [sep.join(values[a:b]) for a, b in zip(bounds[:-1], bounds[1:])]
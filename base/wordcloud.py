@@ -1,25 +1,47 @@
 import json
+import logging as log
+from collections import Counter, deque
+from functools import lru_cache
+from math import gcd
 from os.path import abspath, dirname, isfile, realpath
 from urllib.request import urlopen
 
+import numpy as np
 import pandas as pd
 
+from . import runs
 from .base import Transformer
+from .counter import SpaceSaving, SpillCounter
+from .defaults import AVAILABLE_SCORES
 
 D3JS = abspath(dirname(realpath(__file__))+'/d3.layout.cloud.js')
 D3HTML = abspath(dirname(realpath(__file__))+'/d3.layout.cloud.html')
 
 URL = 'https://raw.githubusercontent.com/jasondavies/d3-cloud/master/build/d3.layout.cloud.js'
 
+PHRASE_SCORES = {"llr": 10.83, "npmi": 0.0, "pmi": 0.0}  # Minimum score of significant phrases.
+
 class Wordcloud(Transformer):
 
     def __init__(
         self,
+        approx_counters: int = None,
+        approx_error: float = None,
         exclude_words: list = [],
         max_words: int = None,
+        min_count: int = 5,
+        reference: str = None,
+        score: str = "count",
+        spill_memory: int = None,
     ):
+        self.approx_counters = approx_counters
+        self.approx_error = approx_error
         self.exclude_words = exclude_words
         self.max_words = max_words
+        self.min_count = min_count
+        self.spill_memory = spill_memory
+        self.reference = reference
+        self.score = score
 
     def transform(self, X):
         return self._wordcloud(
@@ -27,20 +49,404 @@ class Wordcloud(Transformer):
                 X,
                 max_words=self.max_words,
                 exclude_words=self.exclude_words,
-            ),
+                approx_counters=self.approx_counters,
+                approx_error=self.approx_error,
+                score=self.score,
+                reference=self.reference,
+                min_count=self.min_count,
+                spill_memory=self.spill_memory,
+            ).to_dict(),
+        )
+
+    def _wordcloud(self, dct: dict, render: bool = True, groups: dict = None):
+        return self._render(self.__normalize(dct, groups)) if render else dct
+
+    @staticmethod
+    def _wordcount(
+        X,
+        max_words: int = None,
+        exclude_words: list = [],
+        approx_counters: int = None,
+        approx_error: float = None,
+        score: str = "count",
+        reference: str = None,
+        min_count: int = 5,
+        spill_memory: int = None,
+    ):
+        """
+        Counts words in a single pass over documents, returning the top
+        `max_words` by raw count, TF-IDF or log-likelihood keyness against
+        a `reference` frequency table (path or dictionary). With phrase
+        scores (PMI, NPMI, log-likelihood ratio), counts words and adjacent
+        word pairs instead, returning significant phrases seen at least
+        `min_count` times. With `spill_memory` (bytes), counts words exactly
+        within bounded memory, spilling them to disk as needed. With
+        approximate counters, returns only the top words in guaranteed
+        order, with guaranteed (minimum) counts.
+        """
+        Wordcloud._check(
+            max_words=max_words,
+            approx_counters=approx_counters,
+            approx_error=approx_error,
+            score=score,
+            reference=reference,
+            spill_memory=spill_memory,
+        )
+        exclude_words = set(exclude_words)
+
+        if approx_counters or approx_error:
+            counter = SpaceSaving(capacity=approx_counters, error=approx_error)
+            for x in X:
+                counter.update(
+                    w for w in (x.split() if type(x) == str else x) if w not in exclude_words
+                )
+            items = counter.most_common_guaranteed(max_words)
+            if len(items) < min(max_words or len(counter), len(counter)):
+                log.warning(
+                    f"SpaceSaving: only the top {len(items)} words are in guaranteed order, out of "
+                    f"{min(max_words or len(counter), len(counter))} (counters={counter.capacity}, "
+                    f"max_error={counter.max_error():.1f}); increase counters for more."
+                )
+            return Wordcloud._series(items)
+        elif spill_memory:
+            counter = SpillCounter(max_memory=spill_memory)
+            try:
+                for x in X:
+                    counter.update(
+                        w for w in (x.split() if type(x) == str else x) if w not in exclude_words
+                    )
+                log.info(f"SpillCounter: {len(counter.runs)} runs spilled to disk.")
+                return Wordcloud._series(counter.most_common(max_words))
+            finally:
+                counter.close()
+        else:
+            counter, documents, n_documents = Counter(), Counter(), 0
+            for x in X:
+                tokens = x.split() if type(x) == str else x
+                counter.update(tokens)
+                if score == "tfidf":
+                    documents.update(set(tokens))
+                    n_documents += 1
+                elif score in PHRASE_SCORES:
+                    documents.update(zip(tokens, tokens[1:]))
+
+            if score in PHRASE_SCORES:
+                return Wordcloud._phrases(
+                    counter,
+                    documents,
+                    max_words=max_words,
+                    score=score,
+                    min_count=min_count,
+                    exclude_words=exclude_words,
+                )
+
+            for w in exclude_words:
+                counter.pop(w, None)
+
+            if score != "count":
+                return Wordcloud._score(
+                    counter,
+                    max_words=max_words,
+                    score=score,
+                    documents=documents,
+                    n_documents=n_documents,
+                    reference=Wordcloud._reference(reference) if type(reference) == str else reference,
+                )
+
+        return Wordcloud._topk(counter, max_words)
+
+    @staticmethod
+    def _check(
+        max_words: int = None,
+        approx_counters: int = None,
+        approx_error: float = None,
+        score: str = "count",
+        reference: str = None,
+        spill_memory: int = None,
+    ) -> None:
+        """ Checks that word count options are compatible, raising ValueError otherwise. """
+        if score not in AVAILABLE_SCORES:
+            raise ValueError(f"Unknown score '{score}' (available: {AVAILABLE_SCORES}).")
+        if score != "count" and (approx_counters or approx_error):
+            raise ValueError(f"Score '{score}' requires exact word count (without approximate counters).")
+        if score == "keyness" and not reference:
+            raise ValueError("Score 'keyness' requires a reference frequency table.")
+        if spill_memory and (score != "count" or approx_counters or approx_error):
+            raise ValueError("Spilling to disk requires exact word count (without scores or approximate counters).")
+        if spill_memory and max_words is None:
+            raise ValueError("Spilling to disk requires a finite number of words (`max_words`).")
+
+    @staticmethod
+    def _mapcount(X, path: str, spill_memory: int = None) -> None:
+        """
+        Counts all words from documents into a run (sorted "word<TAB>count"
+        file) at `path`, to merge later with other runs. With `spill_memory`
+        (bytes), counts within bounded memory, spilling to disk as needed.
+        """
+        if not spill_memory:
+            counter = Counter()
+            for x in X:
+                counter.update(x.split() if type(x) == str else x)
+            return runs.write(path, counter.items())
+
+        counter = SpillCounter(max_memory=spill_memory)
+        try:
+            for x in X:
+                counter.update(x.split() if type(x) == str else x)
+            runs.write(path, counter.items(), is_sorted=True)
+        finally:
+            counter.close()
+
+    @staticmethod
+    def _score(
+        counter: Counter,
+        max_words: int = None,
+        score: str = "tfidf",
+        documents: Counter = None,
+        n_documents: int = 0,
+        reference: dict = None,
+    ):
+        """
+        Scores words with vectorized arrays over the counter, as smoothed
+        TF-IDF or as signed log-likelihood (G2) keyness, which is negative
+        for words relatively less frequent than in the reference.
+        """
+        words = np.array(list(counter), dtype=object)
+        tf = np.fromiter(counter.values(), dtype=float, count=len(words))
+
+        if score == "tfidf":
+            df = np.fromiter((documents[w] for w in words), dtype=float, count=len(words))
+            scores = tf * (np.log((1 + n_documents) / (1 + df)) + 1)
+        else:
+            ref = np.fromiter((reference.get(w, 0) for w in words), dtype=float, count=len(words))
+            c, d = tf.sum(), float(sum(reference.values())) or 1.0
+            expected_tf = c * (tf + ref) / (c + d)
+            expected_ref = d * (tf + ref) / (c + d)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                g2 = 2 * (
+                    tf * np.log(tf / expected_tf) +
+                    np.where(ref > 0, ref * np.log(ref / expected_ref), 0)
+                )
+            scores = np.where(tf / c >= ref / d, g2, -g2)
+
+        top = np.argsort(-scores, kind="stable")[:max_words]
+        wordcount = pd.Series(
+            scores[top].round(3),
+            index=pd.Index(words[top], dtype=object),
+            dtype=float,
+        )
+        wordcount.index.name = "index"
+        wordcount.name = "value"
+        return wordcount
+
+    @staticmethod
+    def _phrases(
+        counter: Counter,
+        bigrams: Counter,
+        max_words: int = None,
+        score: str = "npmi",
+        min_count: int = 5,
+        exclude_words: set = set(),
+    ):
+        """
+        Scores word pairs seen at least `min_count` times by (normalized)
+        pointwise mutual information or log-likelihood ratio (G2) of their
+        2x2 contingency table, returning the top `max_words` significant
+        phrases, i.e. scored above PHRASE_SCORES.
+        """
+        pairs = [
+            pair for pair, count in bigrams.items()
+            if count >= min_count and pair[0] not in exclude_words and pair[1] not in exclude_words
+        ]
+        n = float(sum(counter.values()))
+        k11 = np.fromiter((bigrams[p] for p in pairs), dtype=float, count=len(pairs))
+        c1 = np.fromiter((counter[p[0]] for p in pairs), dtype=float, count=len(pairs))
+        c2 = np.fromiter((counter[p[1]] for p in pairs), dtype=float, count=len(pairs))
+
+        pmi = np.log2(k11 * n / (c1 * c2))
+        if score == "pmi":
+            scores = pmi
+        elif score == "npmi":
+            with np.errstate(divide="ignore", invalid="ignore"):
+                scores = np.nan_to_num(pmi / -np.log2(k11 / n), nan=1.0)
+        else:
+            k12, k21 = c1 - k11, c2 - k11
+            k22 = n - c1 - c2 + k11
+            with np.errstate(divide="ignore", invalid="ignore"):
+                scores = 2 * sum(
+                    np.where(k > 0, k * np.log(k * n / (row * col)), 0)
+                    for k, row, col in (
+                        (k11, c1, c2),
+                        (k12, c1, n - c2),
+                        (k21, n - c1, c2),
+                        (k22, n - c1, n - c2),
+                    )
+                )
+            scores = np.where(pmi > 0, scores, -scores)
+
+        keep = np.flatnonzero(scores > PHRASE_SCORES[score])
+        top = keep[np.argsort(-scores[keep], kind="stable")][:max_words]
+        wordcount = pd.Series(
+            scores[top].round(3),
+            index=pd.Index([" ".join(pairs[i]) for i in top], dtype=object),
+            dtype=float,
         )
+        wordcount.index.name = "index"
+        wordcount.name = "value"
+        return wordcount
 
-    def _wordcloud(self, dct: dict, render: bool = True):
-        return self._render(self.__normalize(dct)) if render else dct
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _reference(path: str) -> dict:
+        """ Loads a reference frequency table (e.g. a previous output) with word and count columns. """
+        df = (
+            pd.read_excel(path, index_col=0) if path.endswith(".xlsx") else
+            pd.read_csv(path, index_col=0, sep=None, engine="python")
+        )
+        return dict(zip(df.index.astype(str), df.iloc[:, 0]))
 
     @staticmethod
-    def _wordcount(X, max_words: int = None, exclude_words: list = []):
-        wordcount = pd\
-            .Series(X, dtype=object)\
-            .apply(lambda x: x.split() if type(x) == str else x)\
-            .explode()\
-            .value_counts()[:max_words]\
-            .drop(exclude_words, errors="ignore")
+    def _comparecount(
+        corpora: list,
+        names: list,
+        exclude_words: list = [],
+        batch_size: int = 1 << 20,
+    ) -> pd.DataFrame:
+        """
+        Counts words from each corpus (iterable of documents) against a single
+        shared vocabulary, returning a table with counts per corpus, and the
+        log-ratio (binary log of relative frequencies, smoothed by 0.5) and
+        difference of relative frequencies (per million words) of each corpus
+        against all others.
+        """
+        vocabulary = {}
+        counts = [np.zeros(0, dtype=np.int64) for _ in corpora]
+
+        def flush(k, ids):
+            bins = np.bincount(np.asarray(ids, dtype=np.int64), minlength=len(vocabulary))
+            bins[:len(counts[k])] += counts[k]
+            counts[k] = bins
+            ids.clear()
+
+        for k, X in enumerate(corpora):
+            ids = []
+            for x in X:
+                ids.extend(vocabulary.setdefault(w, len(vocabulary)) for w in (x.split() if type(x) == str else x))
+                if len(ids) >= batch_size:
+                    flush(k, ids)
+            flush(k, ids)
+
+        counts = np.vstack([np.pad(c, (0, len(vocabulary) - len(c))) for c in counts])
+        words = np.array(list(vocabulary), dtype=object)
+
+        keep = ~np.isin(words, list(exclude_words))
+        words, counts = words[keep], counts[:, keep]
+
+        total = counts.sum(axis=0)
+        sizes = counts.sum(axis=1, keepdims=True)
+        rest = total - counts
+        rest_sizes = np.maximum(sizes.sum() - sizes, 1)
+        sizes = np.maximum(sizes, 1)
+
+        table = pd.DataFrame(index=pd.Index(words, name="index"))
+        for k, name in enumerate(names):
+            table[name] = counts[k]
+        for k, name in enumerate(names):
+            table[f"{name}_log_ratio"] = np.log2(
+                ((counts[k] + 0.5) / sizes[k]) / ((rest[k] + 0.5) / rest_sizes[k])
+            ).round(3)
+            table[f"{name}_difference"] = (
+                (counts[k] / sizes[k] - rest[k] / rest_sizes[k]) * 1e6
+            ).round(3)
+
+        return table.iloc[np.argsort(-total, kind="stable")]
+
+    @staticmethod
+    def _windowcount(
+        X,
+        window: str,
+        slide: str = None,
+        max_words: int = None,
+        exclude_words: list = [],
+    ):
+        """
+        Counts words over time windows from Series of documents indexed by
+        timestamps in ascending order, yielding (start, end, top words) per
+        window. Windows are tumbling, or sliding every `slide` if shorter.
+
+        Counts are kept per pane (the greatest common divisor of window and
+        slide), so each window is updated by adding the newest pane and
+        subtracting the expired ones, instead of recounting.
+        """
+        window = pd.Timedelta(window)
+        slide = pd.Timedelta(slide or window)
+        if slide > window:
+            raise ValueError(f"Expected window slide ({slide}) not to exceed window ({window}).")
+        pane = pd.Timedelta(gcd(window.value, slide.value), unit="ns")
+
+        exclude_words = set(exclude_words)
+        counter, panes = Counter(), deque()
+        origin = start = current = None
+
+        def close():
+            """ Adds current pane to window, expires old panes, returns whether to emit. """
+            counter.update(current)
+            panes.append((start, current))
+            while panes[0][0] < start + pane - window:
+                for w, n in panes.popleft()[1].items():
+                    if counter[w] == n:
+                        del counter[w]
+                    else:
+                        counter[w] -= n
+            return (start + pane - origin) % slide == pd.Timedelta(0)
+
+        def emit():
+            end = start + pane
+            return (max(origin, end - window), end, Wordcloud._topk(counter, max_words))
+
+        for Xt in X:
+            for t, x in zip(Xt.index, Xt):
+                if pd.isna(t):
+                    continue
+                if origin is None:
+                    origin = start = t.floor(slide)
+                    current = Counter()
+                elif t < start:
+                    raise ValueError(
+                        f"Expected records in time order, found {t} after {start} "
+                        f"(sort by the time column in ascending order)."
+                    )
+                while t >= start + pane:
+                    if close():
+                        yield emit()
+                    start, current = start + pane, Counter()
+                current.update(w for w in (x.split() if type(x) == str else x) if w not in exclude_words)
+
+        if origin is not None:
+            close()
+            yield emit()
+
+    @staticmethod
+    def _compare(table: pd.DataFrame, name: str, max_words: int = None) -> pd.Series:
+        """ Returns the top `max_words` overrepresented in a corpus by log-ratio. """
+        scores = table.loc[table[name] > 0, f"{name}_log_ratio"]
+        scores = scores[scores > 0].sort_values(ascending=False, kind="stable")[:max_words]
+        scores.name = "value"
+        return scores
+
+    @staticmethod
+    def _topk(counter, max_words: int = None):
+        """ Selects the top `max_words` with a heap, avoiding a full sort. """
+        return Wordcloud._series(counter.most_common(max_words))
+
+    @staticmethod
+    def _series(items: list):
+        """ Returns (word, count) items, already sorted, as a word count series. """
+        wordcount = pd.Series(
+            [count for word, count in items],
+            index=pd.Index([word for word, count in items], dtype=object),
+            dtype=int,
+        )
         wordcount.index.name = "index"
         wordcount.name = "value"
         return wordcount
@@ -61,10 +467,13 @@ class Wordcloud(Transformer):
         return str(d3html % (d3js, json.dumps(dct, indent=2)))
 
     @staticmethod
-    def __normalize(dct: dict):
+    def __normalize(dct: dict, groups: dict = None):
+        # Draws only positive scores, e.g. not words underused against a reference (negative keyness).
+        dct = {key: value for key, value in dct.items() if value > 0}
         count_range = (max(dct.values()) - min(dct.values()) + 1) if dct else 1
         size_ratio = 100.0 / count_range
         return [{
             'text': key,
             'size': int(value*size_ratio)+10,
+            **({'group': groups[key]} if groups else {}),
         } for key, value in dct.items()]
@@ -0,0 +1,35 @@
+from collections import Counter
+
+import pytest
+
+from base.counter import SpaceSaving, SpillCounter
+
+WORDS = ["a"] * 100 + ["b"] * 60 + ["c"] * 5 + ["x", "y", "z"] + ["d"] * 3
+
+
+def test_space_saving_guaranteed_when_full():
+    counter = SpaceSaving(capacity=2)
+    counter.update(WORDS)
+
+    assert counter.most_common_guaranteed(2) == [("a", 100)]
+
+
+@pytest.mark.parametrize("n", [None, 1, 3])
+def test_space_saving_exact_when_not_full(n):
+    counter = SpaceSaving(capacity=10)
+    counter.update(WORDS)
+
+    assert counter.most_common_guaranteed(n) == Counter(WORDS).most_common(n)
+
+
+@pytest.mark.parametrize("max_size", [1, 2, 100])
+def test_spill_counter_exact(max_size):
+    counter = SpillCounter(max_size=max_size)
+    try:
+        for i in range(0, len(WORDS), 7):
+            counter.update(WORDS[i:i+7])
+
+        assert dict(counter.items()) == Counter(WORDS)
+        assert dict(counter.most_common(3)) == dict(Counter(WORDS).most_common(3))
+    finally:
+        counter.close()
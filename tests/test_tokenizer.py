@@ -0,0 +1,40 @@
+import pytest
+
+from base.tokenizer import PandasTokenizer, Tokenizer
+
+DOCUMENTS = [
+    "Café, naïve façade and ÉCOLE élève; ｆｕｌｌｗｉｄｔｈ letters but й and が kept",
+    "Emojis 😀👍🏽 between👨‍👩‍👧words 🇧🇷 flag and ©️ symbols ❤️❤️",
+    "Numbers 42 -3.5 1_000 .5e3 nan inf 3rd 4x4 2021-01-01 and v2",
+    "See [the docs](https://example.com/docs) or www.example.com now",
+    "@user #hashtag mention@ kk_ignored http://x.y/z",
+    "First line\n\nThird line after an empty one\n",
+    "",
+    "   ",
+    "\n",
+    "a an the of is to it in",
+    "Punctuation!!! quotes “double” ‘single’ — dashes… ¿qué? ¡sí!",
+]
+
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"min_word_len": 3},
+    {"ignore_startswith": ["http", "www", "kk"], "min_word_len": 2},
+    {"stop_words": ["the", "and", "or", "an"], "min_word_len": 2},
+    {"streams": ["emojis", "hashtags", "mentions", "urls"]},
+])
+def test_pandas_tokenizer_parity(kwargs):
+    tokenizer, pandas_tokenizer = Tokenizer(**kwargs), PandasTokenizer(**kwargs)
+
+    assert pandas_tokenizer.transform(DOCUMENTS) == tokenizer.transform(DOCUMENTS)
+    assert getattr(pandas_tokenizer, "counts_", {}) == getattr(tokenizer, "counts_", {})
+
+
+@pytest.mark.parametrize("documents", [
+    [],
+    [""],
+    ["\n\n"],
+])
+def test_pandas_tokenizer_parity_empty(documents):
+    assert PandasTokenizer().transform(documents) == Tokenizer().transform(documents)
@@ -9,152 +9,29 @@ Original d3.js wordcloud code by Jason Davies:
 """
 
 from argparse import ArgumentParser
+from itertools import chain
 from os import listdir, mkdir
 from os.path import basename, dirname, isdir, isfile, splitext
 
-from sklearn.pipeline import Pipeline
-from typing import Callable, Union
-
-import base.stopwords as stopwords
-from base.base import PandasTransformer
-from base.lemmatizer import Lemmatizer
-from base.ngrams import NGrams
-from base.stemmer import Stemmer
-from base.tokenizer import Tokenizer
-from base.wordcloud import Wordcloud
-
-ENCODING = "utf-8"
-IGNORE_STARTSWITH = ["http", "www", "kk"]
-IGNORE_STARTSWITH_CHARS = "@#"
-MAX_WORDS = 100
-MIN_WORD_LEN = 2
-N_GRAMS = 1
-
-AVAILABLE_STOPWORDS = [
-    "all",
-    "catalan",
-    "chinese",
-    "common",
-    "english",
-    "french",
-    "german",
-    "italian",
-    "japanese",
-    "portuguese",
-    "russian",
-    "spanish",
-]
-
-class WordcloudNLP(Pipeline):
-
-    def __init__(
-        self,
-        applymap: Callable = lambda x: x,
-        column: Union[str, list] = None,
-        drop_duplicates: bool = False,
-        dropna: bool = False,
-        exclude_words: list = [],
-        ignore_startswith: list = IGNORE_STARTSWITH,
-        ignore_startswith_chars: str = IGNORE_STARTSWITH_CHARS,
-        ignore_stopwords: bool = True,
-        json_records: bool = True,
-        lang: str = None,
-        low_memory: bool = False,
-        max_words: int = MAX_WORDS,
-        min_word_len: int = MIN_WORD_LEN,
-        model: str = None,
-        n_grams: int = N_GRAMS,
-        sep: str = None,
-        skiprows: int = None,
-        sort: list = [],
-        stop_words: Union[str, list] = [],
-        use_lemmas: bool = False,
-        use_pandas: bool = False,
-        use_stemmer: bool = False,
-        use_tokens: bool = False,
-        use_wordcloud: bool = True,
-    ):
-        steps = []
-
-        self.applymap = applymap
-        self.column = column
-        self.drop_duplicates = drop_duplicates
-        self.dropna = dropna
-        self.exclude_words = exclude_words
-        self.ignore_stopwords = ignore_stopwords
-        self.ignore_startswith = ignore_startswith
-        self.ignore_startswith_chars = ignore_startswith_chars
-        self.json_records = json_records
-        self.lang = lang
-        self.low_memory = low_memory
-        self.max_words = max_words
-        self.min_word_len = min_word_len
-        self.model = model
-        self.n_grams = n_grams
-        self.sep = sep
-        self.skiprows = skiprows
-        self.sort = sort
-        self.stop_words = stop_words
-        self.use_lemmas = use_lemmas
-        self.use_pandas= use_pandas
-        self.use_stemmer = use_stemmer
-        self.use_tokens = use_tokens
-        self.use_wordcloud = use_wordcloud
-
-        if self.use_pandas:
-            steps.append(
-                ('pandas', PandasTransformer(
-                    applymap=self.applymap,
-                    column=self.column,
-                    drop_duplicates=self.drop_duplicates,
-                    dropna=self.dropna,
-                    json_records=self.json_records,
-                    low_memory=self.low_memory,
-                    sep=self.sep,
-                    skiprows=self.skiprows,
-                    sort=self.sort,
-                ))
-            )
-        if self.use_tokens:
-            steps.append(
-                ('token', Tokenizer(
-                    ignore_startswith=self.ignore_startswith,
-                    min_word_len=self.min_word_len,
-                    stop_words=self.__stopwords(self.stop_words),
-                ))
-            )
-        if self.use_lemmas:
-            steps.append(
-                ('lemma', Lemmatizer(
-                    model=self.model,
-                ))
-            )
-        if self.use_stemmer:
-            steps.append(
-                ('stem', Stemmer(
-                    ignore_startswith=self.ignore_startswith_chars,
-                    ignore_stopwords=self.ignore_stopwords,
-                    lang=self.lang,
-                ))
-            )
-        if self.n_grams:
-            steps.append(
-                ('ngrams', NGrams(
-                    n_grams=self.n_grams,
-                ))
-            )
-        if self.use_wordcloud:
-            steps.append(
-                ('wordcloud', Wordcloud(
-                    exclude_words=self.exclude_words,
-                    max_words=self.max_words,
-                ))
-            )
-        super().__init__(steps=steps)
+from base.defaults import (
+    AVAILABLE_SCORES,
+    AVAILABLE_STOPWORDS,
+    AVAILABLE_STREAMS,
+    IGNORE_STARTSWITH,
+    IGNORE_STARTSWITH_CHARS,
+    MAX_TABLE_WORDS,
+    MAX_WORDS,
+    MIN_WORD_LEN,
+    N_GRAMS,
+)
 
-    @staticmethod
-    def __stopwords(s):
-        return getattr(stopwords, f"{s.upper()}_STOPWORDS") if s and type(s) == str else []
+
+def __getattr__(name):
+    # Pipeline is imported on demand, keeping the command line interface fast.
+    if name == "WordcloudNLP":
+        from base.pipeline import WordcloudNLP
+        return WordcloudNLP
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
 def getargs():
@@ -162,7 +39,7 @@ def getargs():
 
     argparser.add_argument("input",
                            help="Input file names or folder",
-                           nargs="+")
+                           nargs="*")
 
     argparser.add_argument("-o", "--output-name",
                            dest="output",
@@ -183,14 +60,56 @@ def getargs():
                            help=f"Extra words to ignore for word cloud (comma separated)",
                            type=lambda x: x.split(","))
 
+    argparser.add_argument("--approx-counters",
+                           help=f"Maximum counters for approximate (Space-Saving) word count (optional)",
+                           type=int)
+
+    argparser.add_argument("--approx-error",
+                           help=f"Maximum error ratio for approximate (Space-Saving) word count (optional)",
+                           type=float)
+
     argparser.add_argument("--column",
                            help=f"Column names or positions (comma separated)",
                            type=lambda x: x.split(","))
 
+    argparser.add_argument("--compare",
+                           action="store_true",
+                           help=f"Compare inputs as separate corpora (files or folders) by log-ratio of word frequencies")
+
+    argparser.add_argument("--cooccurrence-max-pairs",
+                           help=f"Maximum word pairs to keep for co-occurrence, pruning the rarest (default: all)",
+                           type=int)
+
+    argparser.add_argument("--cooccurrence-min-count",
+                           default=2,
+                           help=f"Minimum word count for co-occurrence edges (default: 2)",
+                           type=int)
+
+    argparser.add_argument("--cooccurrence-window",
+                           help=f"Window of words for co-occurrence (default: document)",
+                           type=int)
+
+    argparser.add_argument("--dedup",
+                           choices=["exact", "minhash"],
+                           help=f"Drop duplicate (exact) or near-duplicate (minhash) documents before tokenizer")
+
+    argparser.add_argument("--dedup-max-size",
+                           help=f"Maximum recent documents to remember for deduplication (default: all)",
+                           type=int)
+
+    argparser.add_argument("--dedup-threshold",
+                           default=0.8,
+                           help=f"Minimum estimated similarity for near-duplicate documents (default: 0.8)",
+                           type=float)
+
     argparser.add_argument("--delimiter",
                            dest="sep",
                            help=f"Character delimiter to load file")
 
+    argparser.add_argument("--head",
+                           help=f"Maximum rows to read from input, in order (optional)",
+                           type=int)
+
     argparser.add_argument("--ignore_startswith-chars",
                            help=f"Characters to ignore for stemmer (default: {IGNORE_STARTSWITH_CHARS})",
                            default=IGNORE_STARTSWITH_CHARS)
@@ -207,7 +126,30 @@ def getargs():
     argparser.add_argument("--lang-stopwords",
                            default="all",
                            dest="stop_words",
-                           help=f"Stopwords to use for tokenizer (default: all; available: {AVAILABLE_STOPWORDS})")
+                           help=f"Stopwords and/or file paths to use for tokenizer (comma separated; default: all; available: {AVAILABLE_STOPWORDS})",
+                           type=lambda x: x.split(","))
+
+    argparser.add_argument("--map",
+                           action="store_true",
+                           help=f"Save partial word count (.tsv) of inputs to merge later with --reduce")
+
+    argparser.add_argument("--matrix-features",
+                           help=f"Number of hashed features for document-term matrix (default: vocabulary)",
+                           type=int)
+
+    argparser.add_argument("--max-memory",
+                           help=f"Maximum memory in MB for reading (adapting chunk size) and word count (spilling to disk), or fail (optional)",
+                           type=lambda x: int(float(x) * 1024 ** 2))
+
+    argparser.add_argument("--max-table-words",
+                           default=MAX_TABLE_WORDS,
+                           help=f"Maximum words in table (.xlsx), at least those in cloud (default: {MAX_TABLE_WORDS})",
+                           type=int)
+
+    argparser.add_argument("--min-count",
+                           default=5,
+                           help=f"Minimum count of phrases for phrase scores (default: 5)",
+                           type=int)
 
     argparser.add_argument("--min-word-len",
                            default=MIN_WORD_LEN,
@@ -218,10 +160,84 @@ def getargs():
                            dest="model",
                            help=f"spaCy model to use (required for lemmatizer)")
 
+    argparser.add_argument("--prefetch",
+                           help=f"Maximum files read ahead of processing (default: twice the threads)",
+                           type=int)
+
+    argparser.add_argument("--processes",
+                           default=1,
+                           dest="n_processes",
+                           help=f"Number of worker processes for word count (default: 1)",
+                           type=int)
+
+    argparser.add_argument("--progress",
+                           const="-",
+                           help=f"Report progress to stderr, or as JSON lines to a log file if given (optional)",
+                           metavar="LOG",
+                           nargs="?")
+
+    argparser.add_argument("--reduce",
+                           action="store_true",
+                           help=f"Merge partial word counts (.tsv) from --map as inputs")
+
+    argparser.add_argument("--reference",
+                           help=f"Reference word frequency table for keyness score, e.g. a previous output (.xlsx or .csv)")
+
+    argparser.add_argument("--sample",
+                           help=f"Fraction of rows (below 1) or number of rows (from 1) to sample from input (optional)",
+                           type=float)
+
+    argparser.add_argument("--score",
+                           choices=AVAILABLE_SCORES,
+                           default="count",
+                           help=f"Word score for cloud: raw count, TF-IDF, log-likelihood keyness against reference, or phrases (word pairs) by log-likelihood ratio, PMI or normalized PMI (default: count)")
+
+    argparser.add_argument("--seed",
+                           help=f"Random seed for reproducible sampling (optional)",
+                           type=int)
+
+    argparser.add_argument("--serve",
+                           help=f"Serve pipeline over HTTP on 'host:port' or Unix socket path instead")
+
     argparser.add_argument("--skiprows",
                            help=f"Number of rows to skip for Pandas",
                            type=int)
 
+    argparser.add_argument("--sort",
+                           default=[],
+                           help=f"Column names to sort by before processing, descending (comma separated)",
+                           type=lambda x: x.split(","))
+
+    argparser.add_argument("--sort-ascending",
+                           action="store_true",
+                           dest="ascending",
+                           help=f"Sort in ascending order instead")
+
+    argparser.add_argument("--spill-memory",
+                           help=f"Memory for exact word count in MB, spilling to temporary files beyond (optional)",
+                           type=lambda x: int(float(x) * 1024 ** 2))
+
+    argparser.add_argument("--streams",
+                           default=[],
+                           help=f"Token streams to count in separate word clouds (comma separated; available: {AVAILABLE_STREAMS})",
+                           type=lambda x: x.split(","))
+
+    argparser.add_argument("--threads",
+                           default=1,
+                           dest="n_threads",
+                           help=f"Number of threads to read files concurrently (default: 1)",
+                           type=int)
+
+    argparser.add_argument("--time-column",
+                           help=f"Column name with record timestamps, in ascending order (required for --window)")
+
+    argparser.add_argument("--window",
+                           help=f"Time window per word cloud, e.g. '1h' or '1d' (optional)")
+
+    argparser.add_argument("--window-slide",
+                           dest="slide",
+                           help=f"Time between sliding windows, e.g. '15min' (default: window, i.e. tumbling)")
+
     argparser.add_argument("--no-pandas",
                            action="store_false",
                            dest="use_pandas",
@@ -238,15 +254,63 @@ def getargs():
                            dest="use_tokens",
                            help="Do NOT use tokenizer in pipeline")
 
+    argparser.add_argument("--use-cooccurrence",
+                           action="store_true",
+                           help="Save word co-occurrence edge list (.csv) from pipeline")
+
     argparser.add_argument("--use-lemmas",
                            action="store_true",
                            help="Use lemmatizer in pipeline")
 
+    argparser.add_argument("--use-matrix",
+                           action="store_true",
+                           help="Save sparse document-term matrix (.npz) from pipeline")
+
+    argparser.add_argument("--use-pandas-tokenizer",
+                           action="store_true",
+                           help="Use vectorized (pandas) tokenizer in pipeline")
+
     argparser.add_argument("--use-stemmer",
                            action="store_true",
                            help="Use stemmer in pipeline")
 
     args = argparser.parse_args()
+
+    if not args.input and not args.serve:
+        argparser.error("the following arguments are required: input")
+
+    if args.window and not args.time_column:
+        argparser.error("argument --window: requires --time-column")
+
+    if args.compare and args.window:
+        argparser.error("argument --window: not allowed with argument --compare")
+
+    if (args.compare or args.window) and (args.approx_counters or args.approx_error or args.serve or args.spill_memory or args.streams or
+                                          args.use_cooccurrence or args.use_matrix or args.score != "count"):
+        argparser.error(f"argument --{'compare' if args.compare else 'window'}: only supported for word count by itself")
+
+    if args.score in ("llr", "npmi", "pmi") and args.n_grams > 1:
+        # Phrases are scored from adjacent tokens, which would be n-grams already.
+        argparser.error(f"argument --score: '{args.score}' requires --n-grams 1")
+
+    if args.n_processes > 1 and (args.approx_counters or args.approx_error or args.compare or args.serve or args.streams or
+                                 args.use_cooccurrence or args.use_matrix or args.window or args.score != "count"):
+        argparser.error("argument --processes: only supported for exact word count by itself")
+
+    if args.n_processes > 1 and (args.dedup or args.head or args.sample or args.sort):
+        # Workers read one file at a time, so these would apply per file instead of to the whole input.
+        argparser.error("argument --processes: not allowed with arguments --dedup, --head, --sample or --sort")
+
+    if (args.map or args.reduce) and (args.approx_counters or args.approx_error or args.compare or args.serve or args.streams or
+                                      args.use_cooccurrence or args.use_matrix or args.window or args.score != "count"):
+        argparser.error(f"argument --{'map' if args.map else 'reduce'}: only supported for exact word count by itself")
+
+    if (args.map or args.reduce) and args.n_processes > 1:
+        argparser.error(f"argument --{'map' if args.map else 'reduce'}: not allowed with argument --processes")
+
+    if args.map and args.reduce:
+        argparser.error("argument --reduce: not allowed with argument --map")
+
     return vars(args)
 
 
@@ -260,8 +324,37 @@ def getfiles(lst):
     return files
 
 
+def corpus(nlp, files):
+    """ Yields documents from files, resetting stateful steps first. """
+    for name, step in nlp.steps:
+        step.fit(None)
+    yield from chain.from_iterable(nlp.iter_transform(files))
+
+
 def main(**args):
-    files = getfiles(args.pop("input"))
+    from base.pipeline import WordcloudNLP
+
+    serve_address = args.pop("serve", None)
+    n_processes = args.pop("n_processes", 1)
+    compare = args.pop("compare", False)
+    window, slide = args.pop("window", None), args.pop("slide", None)
+    map_only, reduce_only = args.pop("map", False), args.pop("reduce", False)
+    table_words = args.pop("max_table_words", MAX_TABLE_WORDS)
+
+    if serve_address:
+        from base.server import serve
+        args.pop("input"), args.pop("output")
+        nlp = WordcloudNLP(**args)
+        return serve(nlp, nlp.steps.pop(-1)[1], serve_address)
+
+    inputs = args.pop("input")
+    files = getfiles(inputs)
+
+    if reduce_only:
+        # Only runs (.tsv) are read from folders, which may also hold previous outputs.
+        files = [f for name in inputs for f in getfiles(name) if f.endswith(".tsv") or not isdir(name)]
+        if not files:
+            raise ValueError(f"Expected partial word counts (.tsv) from --map in {inputs}.")
 
     output = args.pop("output")
     output_file = basename(output) if output else ("%s_wordcloud" % splitext(basename(files[0]))[0])
@@ -273,17 +366,115 @@ def main(**args):
     nlp = WordcloudNLP(**args)
     wordcloud = nlp.steps.pop(-1)[1]
 
-    wordcount = wordcloud._wordcount(
-        nlp.transform(files),
-        exclude_words=wordcloud.exclude_words
-    )
-    wordcount.to_excel(f"{output_folder}/{output_file}.xlsx")
+    # Counts as many words as the table needs (bounded, so top words are selected with a heap), of which the cloud shows the top.
+    max_words = None if wordcloud.max_words is None else max(table_words or 0, wordcloud.max_words)
+
+    if compare:
+        names = [splitext(basename(name.rstrip("/")))[0] for name in inputs]
+        names = [f"{name}_{k + 1}" if names.count(name) > 1 else name for k, name in enumerate(names)]
+        if len(set(names)) < len(names):
+            raise ValueError(f"Expected distinct names for corpora to compare, found: {names}.")
+        table = wordcloud._comparecount(
+            [corpus(nlp, getfiles(name)) for name in inputs],
+            names=names,
+            exclude_words=wordcloud.exclude_words,
+        )
+        table[:max_words].to_excel(f"{output_folder}/{output_file}.xlsx")
+
+        scores = [wordcloud._compare(table, name, wordcloud.max_words) for name in names]
+        for name, wordcount in zip(names, scores):
+            with open(f"{output_folder}/{output_file}_{name}.html", "w") as f:
+                f.write(
+                    wordcloud._wordcloud(wordcount.to_dict())
+                )
+
+        scores = [wordcount[:(wordcloud.max_words or len(wordcount)) // len(names) or 1] for wordcount in scores]
+        with open(f"{output_folder}/{output_file}.html", "w") as f:
+            f.write(
+                wordcloud._wordcloud(
+                    {w: v for wordcount in scores for w, v in wordcount.items()},
+                    groups={w: k for k, wordcount in enumerate(scores) for w in wordcount.index},
+                )
+            )
+        return
+
+    if window:
+        for start, end, wordcount in wordcloud._windowcount(
+            nlp.iter_transform(files),
+            window=window,
+            slide=slide,
+            max_words=max_words,
+            exclude_words=wordcloud.exclude_words,
+        ):
+            name = f"{output_file}_{start:%Y%m%dT%H%M%S}_{end:%Y%m%dT%H%M%S}"
+            wordcount[:max_words].to_excel(f"{output_folder}/{name}.xlsx")
+
+            with open(f"{output_folder}/{name}.html", "w") as f:
+                f.write(
+                    wordcloud._wordcloud(wordcount[:wordcloud.max_words].to_dict())
+                )
+        return
+
+    if map_only:
+        wordcloud._mapcount(
+            chain.from_iterable(nlp.iter_transform(files)),
+            f"{output_folder}/{output_file}.tsv",
+            spill_memory=wordcloud.spill_memory,
+        )
+        return
+
+    if reduce_only:
+        from base import runs
+        wordcount = wordcloud._series(runs.top(files, max_words, wordcloud.exclude_words))
+    elif n_processes > 1:
+        from base.parallel import wordcount as parallel_wordcount
+        wordcount = parallel_wordcount(
+            args,
+            files,
+            n_processes,
+            max_words=max_words,
+            exclude_words=wordcloud.exclude_words,
+        )
+    else:
+        wordcount = wordcloud._wordcount(
+            chain.from_iterable(nlp.iter_transform(files)),
+            max_words=max_words,
+            exclude_words=wordcloud.exclude_words,
+            approx_counters=wordcloud.approx_counters,
+            approx_error=wordcloud.approx_error,
+            score=wordcloud.score,
+            reference=wordcloud.reference,
+            min_count=wordcloud.min_count,
+            spill_memory=wordcloud.spill_memory,
+        )
+    wordcount[:max_words].to_excel(f"{output_folder}/{output_file}.xlsx")
 
     with open(f"{output_folder}/{output_file}.html", "w") as f:
         f.write(
             wordcloud._wordcloud(wordcount[:wordcloud.max_words].to_dict())
         )
 
+    if "cooccurrence" in nlp.named_steps:
+        nlp.named_steps["cooccurrence"].edges().to_csv(f"{output_folder}/{output_file}_edges.csv", index=False)
+
+    if "matrix" in nlp.named_steps:
+        from scipy.sparse import save_npz
+        matrix = nlp.named_steps["matrix"]
+        save_npz(f"{output_folder}/{output_file}.npz", matrix.matrix())
+
+        if not matrix.n_features:
+            with open(f"{output_folder}/{output_file}_vocabulary.txt", "w") as f:
+                f.write("\n".join(matrix.vocabulary()))
+
+    for stream, counter in getattr(nlp.named_steps.get("token"), "counts_", {}).items():
+        wordcount = wordcloud._topk(counter, max_words)
+        wordcount[:max_words].to_excel(f"{output_folder}/{output_file}_{stream}.xlsx")
+
+        with open(f"{output_folder}/{output_file}_{stream}.html", "w") as f:
+            f.write(
+                wordcloud._wordcloud(wordcount[:wordcloud.max_words].to_dict())
+            )
+
 
 if __name__ == "__main__":
     main(**getargs())